@@ -0,0 +1,25 @@
+"""add pending event image hash index
+
+Revision ID: b7d41e9a2c63
+Revises: f107f45c40c8
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e9a2c63'
+down_revision: Union[str, None] = 'f107f45c40c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 같은 이미지 재업로드 시 기존 PendingEvent 조회용
+    op.create_index('ix_pending_events_source_image_hash', 'pending_events', ['source_image_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pending_events_source_image_hash', 'pending_events')
@@ -24,10 +24,119 @@ class Settings(BaseSettings):
     # Firebase
     firebase_credentials_path: str = "firebase/kid-chat-2ca0f-firebase-adminsdk-fbsvc-094c9dc406.json"
 
+    # AI 백엔드 (cli: Claude CLI 서브프로세스, api: Messages API HTTP 호출)
+    claude_backend: str = "cli"
+
     # Claude CLI
     claude_cli_path: str = "claude"
     claude_timeout_seconds: int = 120
     claude_max_timeout_seconds: int = 300
+    # 응답 최대 글자 수 (넘으면 CLI를 멈추고 여기까지를 truncated 응답으로 반환)
+    claude_max_output_chars: int = 100_000
+    # 적응형 타임아웃 (페르소나·입력 종류별 최근 실행 시간의 백분위수 × 배수 + 여유)
+    claude_adaptive_timeout_enabled: bool = True
+    claude_adaptive_timeout_window: int = 200
+    claude_adaptive_timeout_min_samples: int = 20
+    claude_adaptive_timeout_percentile: float = 0.99
+    claude_adaptive_timeout_multiplier: float = 1.5
+    claude_adaptive_timeout_margin_seconds: float = 5
+    claude_adaptive_timeout_min_seconds: int = 15
+    # 중간에 끝낼 CLI에 SIGTERM 후 SIGKILL까지 기다리는 시간 (타임아웃/클라이언트 연결 끊김)
+    claude_kill_grace_seconds: float = 3
+    # CLI stdout 최대 크기 (요청당, 넘으면 CLI를 멈추고 resource_limit 에러, 0이면 제한 없음)
+    claude_max_stdout_bytes: int = 32 * 1024 * 1024
+    # CLI 프로세스 자원 제한 (setrlimit, 0이면 제한 없음, 넘으면 resource_limit 에러)
+    # node는 가상 주소 공간을 크게 예약하므로 주소 공간 제한은 넉넉하게 (수 GB)
+    claude_rlimit_address_space_mb: int = 0
+    claude_rlimit_cpu_seconds: int = 0
+    claude_rlimit_open_files: int = 0
+    claude_rlimit_file_size_mb: int = 0
+    # CLI 프로세스 nice 값 (높을수록 API 워커보다 CPU 우선순위가 낮음)
+    claude_nice: int = 0
+    # 헤지 요청 (첫 출력이 최근 첫 출력 시간의 백분위수보다 늦으면 같은 요청을 한 번 더 실행해
+    # 먼저 출력한 쪽을 사용, 빈 슬롯이 있을 때만, 헤지 대상 요청의 budget_ratio 이하로 제한)
+    claude_hedge_enabled: bool = False
+    claude_hedge_personas: list[str] = ["calendar"]
+    claude_hedge_percentile: float = 0.95
+    claude_hedge_min_samples: int = 20
+    claude_hedge_min_delay_seconds: float = 1
+    claude_hedge_budget_ratio: float = 0.05
+    claude_hedge_budget_burst: int = 3
+    # 서킷 브레이커 (연속 실패 시 일정 시간 CLI 실행 없이 바로 503)
+    claude_circuit_enabled: bool = True
+    claude_circuit_failure_threshold: int = 5
+    claude_circuit_reset_seconds: int = 30
+    # 멀티파트 업로드 이미지 최대 크기 (바이트)
+    claude_max_image_bytes: int = 10 * 1024 * 1024
+    # 이미지 임시 저장 방식 (auto/memfd/tmpfs/disk) 및 tmpfs 디렉토리
+    claude_image_staging: str = "auto"
+    claude_image_tmpfs_dir: str | None = "/dev/shm"
+    # 이미지 전처리 (긴 변 축소 + EXIF 제거 + 재인코딩, 프로세스 풀에서 실행)
+    claude_image_preprocess_enabled: bool = True
+    claude_image_preprocess_workers: int = 2
+    claude_image_max_edge: int = 1568
+    claude_image_jpeg_quality: int = 85
+
+    # AI 요청 스케줄러 (사용자별 공정 큐)
+    # 전체 동시 CLI 실행 수 (레인이 있으면 아래 비율대로 나눈 레인 예산의 합계)
+    claude_max_concurrency: int = 4
+    claude_max_queue_depth: int = 20
+    claude_queue_retry_after_seconds: int = 5
+    # 우선순위 레인별 claude_max_concurrency 비율 (레인마다 최소 1자리, 비우면 레인 하나)
+    # 기본값은 동시 실행 4개 중 달력이 1, 잡담 3
+    claude_lane_shares: dict[str, float] = {"calendar": 0.25, "chat": 0.75}
+    # 레인별 대기열 (없는 레인은 claude_max_queue_depth)
+    claude_lane_queue_depth: dict[str, int] = {"calendar": 10, "chat": 20}
+    # 놀고 있는 다른 레인 자리를 빌려 쓸 수 있는 레인 (달력이 → 잡담 O, 반대 X)
+    claude_lane_borrows: dict[str, list[str]] = {"calendar": ["chat"]}
+    # 페르소나 → 레인 (목록에 없는 페르소나는 claude_lane_default)
+    claude_lane_by_persona: dict[str, str] = {"calendar": "calendar"}
+    claude_lane_default: str = "chat"
+
+    # AI 응답 캐시 (페르소나별 TTL 초, 목록에 없는 페르소나는 캐시 안 함)
+    claude_cache_ttl_seconds: dict[str, int] = {"calendar": 3600}
+    claude_cache_max_entries: int = 256
+    claude_cache_dir: str | None = "/tmp/claude-response-cache"
+
+    # Claude CLI 워커 풀 (stream-json 입력 모드로 미리 띄워둔 프로세스)
+    claude_pool_enabled: bool = False
+    claude_pool_min_size: int = 1
+    # 시작 시 min_size만큼 예열할 페르소나 (나머지는 첫 요청 때 워커 생성)
+    claude_pool_prewarm_personas: list[str] = ["mallangi", "calendar"]
+    claude_pool_max_size: int = 4
+    claude_pool_max_requests_per_worker: int = 1
+    claude_pool_max_idle_seconds: int = 600
+    claude_pool_health_check_interval_seconds: int = 30
+    claude_pool_drain_timeout_seconds: int = 10
+
+    # Messages API 백엔드 (claude_backend=api일 때, 요청 간 공유하는 keep-alive 연결 풀)
+    claude_api_base_url: str = "https://api.anthropic.com"
+    claude_api_key: str | None = None
+    claude_api_version: str = "2023-06-01"
+    claude_api_model: str = "claude-sonnet-4-5"
+    claude_api_max_tokens: int = 4096
+    claude_api_http2: bool = True
+    claude_api_max_connections: int = 20
+    claude_api_max_keepalive_connections: int = 10
+    claude_api_keepalive_expiry_seconds: float = 60
+    claude_api_connect_timeout_seconds: float = 10
+
+    # 캘린더 로컬 파서 (신뢰도가 기준 이상이면 AI 호출 생략)
+    calendar_quick_parse_enabled: bool = True
+    calendar_quick_parse_min_confidence: float = 0.8
+    # 캘린더 일괄 파싱 (CLI 호출 한 번에 묶을 최대 항목 수/글자 수)
+    calendar_batch_max_items: int = 100
+    calendar_batch_max_items_per_call: int = 20
+    calendar_batch_max_chars_per_call: int = 4000
+    # 캘린더 AI 파싱 비동기 작업 (동시 실행 수, 미완료 작업 상한, 결과 보관 시간, 롱폴링 최대 대기)
+    calendar_parse_job_workers: int = 4
+    calendar_parse_job_max_pending: int = 50
+    calendar_parse_job_ttl_seconds: int = 1800
+    calendar_parse_job_max_wait_seconds: int = 30
+
+    # Idempotency-Key (AI 요청 재전송 시 저장된 결과 반환, 보관 시간/최대 개수)
+    idempotency_ttl_seconds: int = 600
+    idempotency_max_entries: int = 2000
 
     # Firebase Test (E2E 테스트용, 선택)
     test_firebase_id: str | None = None
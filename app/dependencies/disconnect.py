@@ -0,0 +1,86 @@
+"""클라이언트 연결 끊김 감지 의존성
+
+일반(비스트리밍) 응답은 클라이언트가 앱을 닫아도 핸들러가 끝까지 실행되므로
+아무도 읽지 않을 응답을 위해 CLI 슬롯을 타임아웃까지 붙잡고 있게 됩니다.
+DisconnectGuard.run()은 작업을 실행하면서 http.disconnect 메시지를 기다리다가
+연결이 끊기면 작업을 취소합니다. 취소는 ClaudeService까지 전파되어
+대기열 자리는 반납되고 실행 중인 CLI는 프로세스 그룹째 종료됩니다.
+
+Idempotency-Key가 있는 요청은 취소하지 않습니다(cancellable=False). 끝까지 실행해 결과를
+저장해 두어야 클라이언트가 같은 키로 재전송했을 때 CLI를 다시 실행하지 않고 그 결과를 받습니다.
+
+Usage:
+    @router.post("/chat")
+    async def chat(
+        request: ChatRequest,
+        idempotency: Idempotency = Depends(get_idempotency),
+        disconnect: DisconnectGuard = Depends(get_disconnect_guard),
+    ):
+        return await disconnect.run(
+            lambda: idempotency.run(work, fingerprint=request.model_dump()),
+            cancellable=idempotency.cancellable,
+        )
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 클라이언트가 응답 전에 연결을 끊은 요청 (nginx 관례, 클라이언트는 받지 못함)
+CLIENT_CLOSED_REQUEST = 499
+
+
+@dataclass
+class DisconnectGuard:
+    """요청 하나의 연결 끊김 감시기"""
+
+    request: Request
+
+    async def _wait_for_disconnect(self) -> None:
+        # 본문을 다 읽은 뒤에는 연결이 끊기거나 응답이 끝날 때까지 http.disconnect만 옴
+        while True:
+            message = await self.request.receive()
+            if message["type"] == "http.disconnect":
+                return
+
+    async def run(self, work: Callable[[], Awaitable[T]], cancellable: bool = True) -> T:
+        """work 실행 (끝나기 전에 연결이 끊기면 취소하고 499)
+
+        cancellable이 False면 연결이 끊겨도 끝까지 실행합니다 (응답은 버려짐).
+        요청 본문을 모두 읽은 뒤(핸들러 안)에서 호출해야 합니다.
+        """
+        if not cancellable:
+            return await work()
+
+        task = asyncio.ensure_future(work())
+        watcher = asyncio.create_task(self._wait_for_disconnect())
+        try:
+            await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            watcher.cancel()
+
+        if task.done():
+            return task.result()
+
+        logger.info(f"Client disconnected, cancelling {self.request.url.path}")
+        task.cancel()
+        # 취소가 끝날 때까지(CLI 종료까지) 기다린 뒤 응답
+        await asyncio.wait({task})
+        if not task.cancelled():
+            task.exception()
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request")
+
+
+def get_disconnect_guard(request: Request) -> DisconnectGuard:
+    """요청별 연결 끊김 감시기"""
+    return DisconnectGuard(request=request)
@@ -0,0 +1,104 @@
+"""Idempotency-Key 헤더 의존성
+
+Usage:
+    @router.post("/parse")
+    async def parse(
+        request: CalendarAIRequest,
+        idempotency: Idempotency = Depends(get_idempotency),
+    ):
+        return await idempotency.run(work, fingerprint=request.model_dump())
+"""
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from fastapi import Depends, Header, Request, Response
+
+from app.config import get_settings
+from app.dependencies.auth import get_current_user
+from app.dependencies.entities import FirebaseUser
+from app.services.idempotency import IdempotencyStore, make_fingerprint
+
+# 저장된 결과를 돌려준 응답에 붙는 헤더
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+_idempotency_store: IdempotencyStore | None = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """
+    Idempotency 저장소 의존성 주입 포인트 (프로세스당 하나)
+
+    테스트에서 override 가능:
+        app.dependency_overrides[get_idempotency_store] = lambda: store
+    """
+    global _idempotency_store
+    if _idempotency_store is None:
+        settings = get_settings()
+        _idempotency_store = IdempotencyStore(
+            ttl_seconds=settings.idempotency_ttl_seconds,
+            max_entries=settings.idempotency_max_entries,
+        )
+    return _idempotency_store
+
+
+@dataclass
+class Idempotency:
+    """요청 하나의 Idempotency-Key 처리기 (헤더가 없으면 그냥 실행)"""
+
+    key: str | None
+    owner_uid: str
+    scope: str
+    store: IdempotencyStore
+    response: Response
+
+    @property
+    def cancellable(self) -> bool:
+        """클라이언트 연결이 끊기면 취소해도 되는지
+
+        키가 있으면 재전송이 결과를 받을 수 있게 끝까지 실행해야 하므로 False
+        (취소되면 실패로 보고 결과를 보관하지 않아 재전송 때 처음부터 다시 실행됨)
+        """
+        return self.key is None
+
+    async def run(
+        self,
+        work: Callable[[], Awaitable[Any]],
+        fingerprint: Any,
+        retain: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """work를 키당 한 번만 실행하고 결과 반환 (재전송이면 저장된 결과)
+
+        fingerprint는 요청 내용 (키가 있을 때만 해시 계산)
+        """
+        if self.key is None:
+            return await work()
+        result, replayed = await self.store.run(
+            self.owner_uid, self.scope, self.key, make_fingerprint(fingerprint), work, retain
+        )
+        if replayed:
+            self.response.headers[REPLAYED_HEADER] = "true"
+        return result
+
+
+async def get_idempotency(
+    request: Request,
+    response: Response,
+    idempotency_key: str | None = Header(
+        default=None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="재전송 시 같은 값을 보내면 한 번만 실행 (클라이언트가 요청마다 생성, 예: UUID)",
+    ),
+    current_user: FirebaseUser = Depends(get_current_user),
+    store: IdempotencyStore = Depends(get_idempotency_store),
+) -> Idempotency:
+    """Idempotency-Key 헤더 → 사용자/경로별 Idempotency 처리기"""
+    return Idempotency(
+        key=idempotency_key,
+        owner_uid=current_user.uid,
+        scope=f"{request.method} {request.url.path}",
+        store=store,
+        response=response,
+    )
@@ -0,0 +1,180 @@
+"""멀티파트 이미지 업로드 의존성
+
+요청 본문을 청크 단위로 읽어 파일 파트는 임시 파일로 바로 흘려보내고(해시 계산 포함),
+텍스트 필드만 메모리에 보관합니다. 이미지 전체를 메모리에 올리지 않으므로
+요청당 메모리 사용량이 이미지 크기와 무관하게 일정합니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request, status
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.config import get_settings
+from app.services.claude.metrics import timed_stage
+from app.services.claude.staging import (
+    ImageTooLargeError,
+    ImageWriter,
+    StagedImage,
+    get_image_stager,
+)
+
+logger = logging.getLogger(__name__)
+
+# 텍스트 필드 최대 크기 (프롬프트 10,000자 * UTF-8 최대 4바이트 + 여유)
+MAX_FIELD_BYTES = 64 * 1024
+
+# 업로드 이미지 필드 이름
+IMAGE_FIELD = "image"
+
+
+@dataclass
+class ImageUpload:
+    """파싱된 멀티파트 요청"""
+
+    fields: dict[str, str] = field(default_factory=dict)
+    image: StagedImage | None = None
+
+    def cleanup(self) -> None:
+        """임시 이미지 파일 삭제"""
+        if self.image:
+            self.image.remove()
+
+
+class _UploadParser:
+    """python-multipart 콜백 구현 (이미지 파트 → ImageWriter)"""
+
+    def __init__(self, max_image_bytes: int):
+        self.max_image_bytes = max_image_bytes
+        self.upload = ImageUpload()
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._name = ""
+        self._data = bytearray()
+        self._writer: ImageWriter | None = None
+
+    def on_part_begin(self) -> None:
+        self._disposition = b""
+        self._name = ""
+        self._data = bytearray()
+        self._writer = None
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        self._name = options.get(b"name", b"").decode("utf-8", errors="replace")
+        if b"filename" in options and self._name == IMAGE_FIELD:
+            if self.upload.image is not None or self._writer is not None:
+                raise MultipartParseError("Only one image can be uploaded")
+            self._writer = get_image_stager().writer(max_bytes=self.max_image_bytes)
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        chunk = data[start:end]
+        if self._writer is not None:
+            self._writer.write(chunk)
+            return
+        if len(self._data) + len(chunk) > MAX_FIELD_BYTES:
+            raise MultipartParseError(f"Field '{self._name}' is too large")
+        self._data.extend(chunk)
+
+    def on_part_end(self) -> None:
+        if self._writer is not None:
+            image = self._writer.close()
+            self._writer = None
+            # 빈 파일 파트는 이미지 없음으로 처리
+            if image.size:
+                self.upload.image = image
+            else:
+                image.remove()
+        elif self._name:
+            self.upload.fields[self._name] = self._data.decode("utf-8", errors="replace")
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
+        self.upload.cleanup()
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        }
+
+
+async def parse_image_upload(request: Request, max_image_bytes: int) -> ImageUpload:
+    """multipart/form-data 요청을 스트리밍 파싱
+
+    Raises:
+        HTTPException: 멀티파트 요청이 아니거나(415) 형식 오류(400), 이미지 크기 초과(413)
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="multipart/form-data 요청이어야 합니다",
+        )
+
+    handler = _UploadParser(max_image_bytes)
+    parser = MultipartParser(params[b"boundary"], handler.callbacks())
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+    except ImageTooLargeError:
+        handler.abort()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"이미지는 최대 {max_image_bytes // (1024 * 1024)}MB까지 업로드할 수 있습니다",
+        )
+    except MultipartParseError as e:
+        handler.abort()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"잘못된 multipart 요청: {e}",
+        )
+    except BaseException:
+        handler.abort()
+        raise
+
+    if handler.upload.image:
+        logger.info(
+            f"Streamed image upload: {handler.upload.image.size} bytes, "
+            f"sha256={handler.upload.image.sha256[:12]}"
+        )
+    return handler.upload
+
+
+async def get_image_upload(request: Request) -> AsyncIterator[ImageUpload]:
+    """
+    멀티파트 이미지 업로드 의존성 (응답 후 임시 파일 자동 삭제)
+
+    인증 의존성보다 뒤에 선언해야 인증 실패 시 본문을 읽지 않습니다.
+    """
+    settings = get_settings()
+    with timed_stage("image_upload"):
+        upload = await parse_image_upload(request, settings.claude_max_image_bytes)
+    try:
+        yield upload
+    finally:
+        upload.cleanup()
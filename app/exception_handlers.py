@@ -3,7 +3,13 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from app.exceptions import NotFoundError, DuplicateError, ForbiddenError
+from app.exceptions import (
+    NotFoundError,
+    DuplicateError,
+    ForbiddenError,
+    TooManyRequestsError,
+    IdempotencyKeyReuseError,
+)
 
 
 async def not_found_error_handler(request: Request, exc: NotFoundError):
@@ -30,8 +36,27 @@ async def forbidden_error_handler(request: Request, exc: ForbiddenError):
     )
 
 
+async def too_many_requests_error_handler(request: Request, exc: TooManyRequestsError):
+    """TooManyRequestsError → 429 응답 (Retry-After 헤더 포함)"""
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": exc.message},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def idempotency_key_reuse_error_handler(request: Request, exc: IdempotencyKeyReuseError):
+    """IdempotencyKeyReuseError → 422 응답"""
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": exc.message},
+    )
+
+
 def register_exception_handlers(app):
     """FastAPI 앱에 예외 핸들러 등록"""
     app.add_exception_handler(NotFoundError, not_found_error_handler)
     app.add_exception_handler(DuplicateError, duplicate_error_handler)
     app.add_exception_handler(ForbiddenError, forbidden_error_handler)
+    app.add_exception_handler(TooManyRequestsError, too_many_requests_error_handler)
+    app.add_exception_handler(IdempotencyKeyReuseError, idempotency_key_reuse_error_handler)
@@ -22,3 +22,16 @@ class DuplicateError(AppError):
 class ForbiddenError(AppError):
     """권한 없음 (403)"""
     pass
+
+
+class TooManyRequestsError(AppError):
+    """요청 과다 (429)"""
+
+    def __init__(self, message: str, retry_after: int = 5):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class IdempotencyKeyReuseError(AppError):
+    """같은 Idempotency-Key를 다른 요청에 사용 (422)"""
+    pass
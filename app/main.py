@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -5,11 +7,28 @@ from app.config import get_settings
 from app.routers import health, auth, ai
 from app.routers.calendar import router as calendar_router
 from app.exception_handlers import register_exception_handlers
+from app.middleware import ServerTimingMiddleware
+from app.services.claude.dependencies import (
+    start_claude_service,
+    shutdown_claude_service,
+)
+from app.services.calendar.dependencies import shutdown_parse_job_manager
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 훅"""
+    await start_claude_service()
+    yield
+    await shutdown_parse_job_manager()
+    await shutdown_claude_service()
+
+
 app = FastAPI(
     title=settings.app_name,
+    lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -27,6 +46,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# AI 요청 단계별 소요 시간 → Server-Timing 헤더
+app.add_middleware(ServerTimingMiddleware)
+
 # Routers
 app.include_router(health.router)
 app.include_router(auth.router)
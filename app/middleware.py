@@ -0,0 +1,31 @@
+"""ASGI 미들웨어"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.claude.metrics import start_request_timings
+
+
+class ServerTimingMiddleware:
+    """AI 요청 경로에서 잰 단계별 시간을 Server-Timing 응답 헤더로 추가
+
+    헤더는 응답 시작 시점에 붙으므로 스트리밍 응답은 첫 조각 전까지 끝난 단계만 포함됩니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timings()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and timings.stages:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.header())
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
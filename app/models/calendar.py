@@ -139,6 +139,7 @@ class PendingEvent(Base):
         Index("ix_pending_events_created_by", "created_by"),
         Index("ix_pending_events_status", "status"),
         Index("ix_pending_events_expires_at", "expires_at"),
+        Index("ix_pending_events_source_image_hash", "source_image_hash"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -1,27 +1,161 @@
+import json
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from app.dependencies import get_current_user, FirebaseUser
+from app.dependencies.disconnect import DisconnectGuard, get_disconnect_guard
+from app.dependencies.idempotency import Idempotency, get_idempotency
+from app.dependencies.upload import ImageUpload, get_image_upload
 from app.schemas.ai import ChatRequest, ChatResponse, ParsedEvent
 from app.services.claude.dependencies import get_claude_service
-from app.services.claude.protocol import AIServiceProtocol
+from app.services.claude.protocol import AIErrorType, AIServiceProtocol
+from app.services.claude.protocol import ChatResponse as AIChatResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
 
+def _error_detail(result: AIChatResponse) -> tuple[int, dict]:
+    """실패한 AI 응답을 error_type에 따라 (HTTP 상태 코드, 에러 상세)로 변환"""
+    error_type = result.error_type or AIErrorType.CLI_ERROR
+    if error_type == AIErrorType.NO_TRIGGER:
+        # AI 호출어가 없는 경우 - 일반 메시지이므로 무시
+        return status.HTTP_400_BAD_REQUEST, {
+            "error": "No AI trigger detected",
+            "error_type": error_type.value,
+            "detail": "메시지에 AI 호출어가 없습니다. (말랑아/루팡아/푸딩아/마이콜아)",
+        }
+    if error_type == AIErrorType.INVALID_IMAGE:
+        return status.HTTP_400_BAD_REQUEST, {
+            "error": "Invalid image",
+            "error_type": error_type.value,
+            "detail": result.error,
+        }
+    if error_type == AIErrorType.TIMEOUT:
+        return status.HTTP_408_REQUEST_TIMEOUT, {
+            "error": "Request timed out",
+            "error_type": error_type.value,
+            "detail": result.error,
+        }
+    if error_type == AIErrorType.SERVICE_UNAVAILABLE:
+        return status.HTTP_503_SERVICE_UNAVAILABLE, {
+            "error": "AI service unavailable",
+            "error_type": error_type.value,
+            "detail": result.error,
+        }
+    if error_type == AIErrorType.RESOURCE_LIMIT:
+        # CLI 출력 크기/자원 제한 초과 - 같은 요청을 다시 보내도 같은 결과일 가능성이 높음
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, {
+            "error": "AI resource limit exceeded",
+            "error_type": error_type.value,
+            "detail": result.error,
+        }
+    return status.HTTP_500_INTERNAL_SERVER_ERROR, {
+        "error": "AI processing failed",
+        "error_type": AIErrorType.CLI_ERROR.value,
+        "detail": result.error,
+    }
+
+
+def _raise_for_error(result: AIChatResponse) -> None:
+    """실패한 AI 응답을 HTTPException으로 변환"""
+    status_code, detail = _error_detail(result)
+    raise HTTPException(status_code=status_code, detail=detail)
+
+
+def _to_parsed_event(event: dict) -> ParsedEvent | None:
+    """스트리밍 중 완성된 일정 dict → ParsedEvent (형식이 맞지 않으면 None)"""
+    try:
+        return ParsedEvent(
+            title=event.get("title", ""),
+            start_time=event.get("start_time"),
+            end_time=event.get("end_time"),
+            all_day=event.get("all_day", False),
+            description=event.get("description"),
+            recurrence=event.get("recurrence"),
+        )
+    except ValidationError:
+        return None
+
+
+def _to_chat_response(result: AIChatResponse) -> ChatResponse:
+    """성공한 AI 응답을 API 응답 스키마로 변환"""
+    # 달력이 페르소나 응답 처리
+    parsed_events = None
+    if result.parsed_events:
+        parsed_events = [
+            ParsedEvent(
+                title=e.get("title", ""),
+                start_time=e.get("start_time"),
+                end_time=e.get("end_time"),
+                all_day=e.get("all_day", False),
+                description=e.get("description"),
+                recurrence=e.get("recurrence"),
+            )
+            for e in result.parsed_events
+        ]
+
+    return ChatResponse(
+        response=result.output,
+        elapsed_time_ms=result.elapsed_ms,
+        truncated=result.truncated,
+        queue_wait_ms=result.queue_wait_ms,
+        persona=result.persona_name,
+        # 달력이 페르소나 전용 필드
+        action_type="confirm_event" if result.parsed_events else None,
+        pending_events=parsed_events,
+    )
+
+
+# /chat/upload 요청 본문 (OpenAPI 문서용 - 본문은 get_image_upload가 직접 파싱)
+UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["prompt"],
+                    "properties": {
+                        "prompt": {"type": "string", "maxLength": 10000},
+                        "timeout_seconds": {"type": "integer", "minimum": 10, "maximum": 300},
+                        "image": {"type": "string", "format": "binary"},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+def _sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
     user: FirebaseUser = Depends(get_current_user),
     claude_service: AIServiceProtocol = Depends(get_claude_service),
+    idempotency: Idempotency = Depends(get_idempotency),
+    disconnect: DisconnectGuard = Depends(get_disconnect_guard),
 ):
     """
     Claude에게 프롬프트를 보내고 응답을 받습니다.
 
     Firebase 인증 필수.
 
+    ## 재전송
+    - Idempotency-Key 헤더를 보내면 같은 키로 다시 보낸 요청은 AI를 다시 호출하지 않고
+      처음 응답을 그대로 받습니다 (실행 중이면 끝날 때까지 대기, 응답 헤더 Idempotent-Replayed)
+
+    응답 전에 클라이언트 연결이 끊기면 실행 중인 AI 요청을 취소합니다.
+
     ## AI 캐릭터 호출 방법
     - "말랑아 ..." → 말랑이 (다정한 친구)
     - "루팡아 ..." → 루팡 (건방진 친구)
@@ -40,72 +174,140 @@ async def chat(
         f"has_image: {request.image_base64 is not None}"
     )
 
-    result = await claude_service.chat(
+    async def work() -> ChatResponse:
+        result = await claude_service.chat(
+            prompt=request.prompt,
+            timeout_seconds=request.timeout_seconds,
+            image_base64=request.image_base64,
+            user_id=user.uid,
+        )
+        if not result.success:
+            _raise_for_error(result)
+        return _to_chat_response(result)
+
+    return await disconnect.run(
+        lambda: idempotency.run(work, fingerprint=request.model_dump()),
+        cancellable=idempotency.cancellable,
+    )
+
+
+@router.post("/chat/upload", response_model=ChatResponse, openapi_extra=UPLOAD_OPENAPI)
+async def chat_upload(
+    user: FirebaseUser = Depends(get_current_user),
+    upload: ImageUpload = Depends(get_image_upload),
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+    idempotency: Idempotency = Depends(get_idempotency),
+    disconnect: DisconnectGuard = Depends(get_disconnect_guard),
+):
+    """
+    /ai/chat과 같지만 이미지를 multipart/form-data로 받습니다.
+
+    이미지를 Base64 JSON으로 보내지 않아도 되고, 서버는 업로드를 청크 단위로
+    임시 파일에 바로 기록하므로 큰 이미지도 메모리에 올리지 않습니다.
+
+    ## 폼 필드
+    - prompt: 프롬프트 (필수)
+    - timeout_seconds: 타임아웃 (선택, 10-300초)
+    - image: 이미지 파일 (선택)
+    """
+    try:
+        request = ChatRequest(
+            prompt=upload.fields.get("prompt", ""),
+            timeout_seconds=upload.fields.get("timeout_seconds") or None,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+    logger.info(
+        f"Chat upload request from user {user.uid}, "
+        f"prompt length: {len(request.prompt)}, "
+        f"image_bytes: {upload.image.size if upload.image else 0}"
+    )
+
+    async def work() -> ChatResponse:
+        result = await claude_service.chat(
+            prompt=request.prompt,
+            timeout_seconds=request.timeout_seconds,
+            image=upload.image,
+            user_id=user.uid,
+        )
+        if not result.success:
+            _raise_for_error(result)
+        return _to_chat_response(result)
+
+    image_hash = upload.image.sha256 if upload.image else None
+    return await disconnect.run(
+        lambda: idempotency.run(work, fingerprint=(request.model_dump(), image_hash)),
+        cancellable=idempotency.cancellable,
+    )
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    user: FirebaseUser = Depends(get_current_user),
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+    disconnect: DisconnectGuard = Depends(get_disconnect_guard),
+):
+    """
+    /ai/chat과 같은 요청을 Server-Sent Events로 스트리밍합니다.
+
+    ## 이벤트
+    - `delta`: 생성 중인 텍스트 조각 `{"text": "..."}`
+    - `event`: 달력이 응답에서 완성된 일정 하나 (ParsedEvent 형식, 생성 중 순서대로)
+    - `done`: 최종 응답 (/ai/chat 응답과 같은 형식, elapsed_time_ms/persona/pending_events 포함)
+    - `error`: 스트리밍 도중 실패 `{"error", "error_type", "detail"}`
+
+    첫 조각이 나오기 전에 실패하면 /ai/chat과 같은 HTTP 에러 코드로 응답합니다.
+    """
+    logger.info(
+        f"Chat stream request from user {user.uid}, "
+        f"prompt length: {len(request.prompt)}, "
+        f"has_image: {request.image_base64 is not None}"
+    )
+
+    chunks = claude_service.chat_stream(
         prompt=request.prompt,
         timeout_seconds=request.timeout_seconds,
         image_base64=request.image_base64,
+        user_id=user.uid,
     )
 
-    if not result.success:
-        if "no ai trigger" in (result.error or "").lower():
-            # AI 호출어가 없는 경우 - 일반 메시지이므로 무시
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "No AI trigger detected",
-                    "error_type": "no_trigger",
-                    "detail": "메시지에 AI 호출어가 없습니다. (말랑아/루팡아/푸딩아/마이콜아)",
-                },
-            )
-        elif "timed out" in (result.error or "").lower():
-            raise HTTPException(
-                status_code=status.HTTP_408_REQUEST_TIMEOUT,
-                detail={
-                    "error": "Request timed out",
-                    "error_type": "timeout",
-                    "detail": result.error,
-                },
-            )
-        elif "not found" in (result.error or "").lower():
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail={
-                    "error": "AI service unavailable",
-                    "error_type": "service_unavailable",
-                    "detail": result.error,
-                },
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "AI processing failed",
-                    "error_type": "cli_error",
-                    "detail": result.error,
-                },
-            )
+    # 첫 조각까지 기다려서 즉시 실패한 경우 일반 HTTP 에러로 응답
+    # (스트리밍 시작 후의 연결 끊김은 StreamingResponse가 감지해 생성기를 취소)
+    first = await disconnect.run(lambda: anext(chunks))
+    if first.response is not None and not first.response.success:
+        await chunks.aclose()
+        _raise_for_error(first.response)
 
-    # 달력이 페르소나 응답 처리
-    parsed_events = None
-    if result.parsed_events:
-        parsed_events = [
-            ParsedEvent(
-                title=e.get("title", ""),
-                start_time=e.get("start_time"),
-                end_time=e.get("end_time"),
-                all_day=e.get("all_day", False),
-                description=e.get("description"),
-                recurrence=e.get("recurrence"),
-            )
-            for e in result.parsed_events
-        ]
+    async def event_stream():
+        chunk = first
+        try:
+            while True:
+                if chunk.event is not None:
+                    event = _to_parsed_event(chunk.event)
+                    if event is not None:
+                        yield _sse("event", event.model_dump(mode="json"))
+                elif chunk.response is None:
+                    yield _sse("delta", {"text": chunk.text})
+                elif chunk.response.success:
+                    response = _to_chat_response(chunk.response)
+                    yield _sse("done", response.model_dump(mode="json"))
+                else:
+                    _, detail = _error_detail(chunk.response)
+                    yield _sse("error", detail)
+                chunk = await anext(chunks)
+        except StopAsyncIteration:
+            pass
+        finally:
+            await chunks.aclose()
 
-    return ChatResponse(
-        response=result.output,
-        elapsed_time_ms=result.elapsed_ms,
-        truncated=False,
-        persona=result.persona_name,
-        # 달력이 페르소나 전용 필드
-        action_type="confirm_event" if result.parsed_events else None,
-        pending_events=parsed_events,
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx 프록시 버퍼링 끄기
+            "X-Accel-Buffering": "no",
+        },
     )
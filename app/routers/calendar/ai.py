@@ -1,20 +1,41 @@
 """캘린더 AI 라우터 - 일정 파싱 및 등록"""
 
+import asyncio
+import logging
+from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
+from app.config import get_settings
 from app.dependencies import get_current_user
 from app.dependencies.entities import FirebaseUser
+from app.dependencies.disconnect import DisconnectGuard, get_disconnect_guard
+from app.dependencies.idempotency import Idempotency, get_idempotency
+from app.dependencies.upload import ImageUpload, get_image_upload
 from app.schemas.ai import ChatRequest, ChatResponse, ParsedEvent
 from app.schemas.calendar import EventCreate
 from app.services.claude.dependencies import get_claude_service
+from app.services.claude.metrics import timed_stage
 from app.services.claude.protocol import AIServiceProtocol
+from app.services.claude.protocol import ChatResponse as AIChatResponse
 from app.services.claude.personas import PersonaType
+from app.services.claude.staging import (
+    StagedImage,
+    decode_image_base64,
+    get_image_stager,
+)
+from app.services.calendar.batch import build_batch_prompt, pack_items, split_events
+from app.services.calendar.jobs import ParseJob, ParseJobManager, ParseJobStatus
+from app.services.calendar.pending import PendingEventDraft
+from app.services.calendar.quick_parse import quick_parse
+from app.services.clock import today_kst
 from app.services.calendar.dependencies import (
     get_pending_event_service,
+    get_pending_event_service_factory,
     get_event_service,
     get_member_service,
+    get_parse_job_manager,
 )
 from app.services.calendar.protocol import (
     PendingEventServiceProtocol,
@@ -22,6 +43,8 @@ from app.services.calendar.protocol import (
     MemberServiceProtocol,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/ai", tags=["calendar-ai"])
 
 
@@ -51,6 +74,49 @@ class CalendarAIResponse(BaseModel):
     error: str | None = Field(default=None, description="에러 메시지")
 
 
+class CalendarAIBatchItem(BaseModel):
+    """일괄 파싱 항목 하나"""
+
+    id: str | None = Field(
+        default=None, max_length=64, description="클라이언트 항목 ID (없으면 1부터 순번)"
+    )
+    text: str | None = Field(default=None, max_length=10000, description="파싱할 텍스트")
+    image_base64: str | None = Field(
+        default=None, max_length=10_000_000, description="Base64 인코딩된 이미지 (선택)"
+    )
+
+
+class CalendarAIBatchRequest(BaseModel):
+    """캘린더 AI 일괄 파싱 요청"""
+
+    items: list[CalendarAIBatchItem] = Field(..., min_length=1, description="파싱할 항목 목록")
+
+
+class CalendarAIBatchItemResult(CalendarAIResponse):
+    """일괄 파싱 항목별 결과 (/parse 응답 + 항목 ID)"""
+
+    id: str = Field(..., description="요청 항목 ID")
+
+
+class CalendarAIBatchResponse(BaseModel):
+    """캘린더 AI 일괄 파싱 응답"""
+
+    items: list[CalendarAIBatchItemResult] = Field(..., description="요청 순서대로 항목별 결과")
+    ai_calls: int = Field(default=0, description="실행한 AI 호출 수")
+
+
+class ParseJobResponse(BaseModel):
+    """AI 파싱 작업 상태"""
+
+    job_id: UUID = Field(..., description="작업 ID")
+    status: ParseJobStatus = Field(..., description="queued/running/done/failed")
+    created_at: datetime = Field(..., description="제출 시각")
+    result: CalendarAIResponse | None = Field(
+        default=None, description="파싱 결과 (status=done일 때, /parse 응답과 같은 형식)"
+    )
+    error: str | None = Field(default=None, description="작업 실패 사유 (status=failed일 때)")
+
+
 class ConfirmRequest(BaseModel):
     """일정 확인 요청"""
 
@@ -69,40 +135,242 @@ class ConfirmResponse(BaseModel):
     error: str | None = Field(default=None, description="에러 메시지")
 
 
-@router.post("/parse", response_model=CalendarAIResponse)
-async def parse_schedule(
-    request: CalendarAIRequest,
-    current_user: FirebaseUser = Depends(get_current_user),
-    claude_service: AIServiceProtocol = Depends(get_claude_service),
-    pending_service: PendingEventServiceProtocol = Depends(get_pending_event_service),
-    member_service: MemberServiceProtocol = Depends(get_member_service),
-):
-    """
-    텍스트/이미지에서 일정을 파싱하여 PendingEvent로 저장
+# /parse/upload 요청 본문 (OpenAPI 문서용 - 본문은 get_image_upload가 직접 파싱)
+PARSE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {"type": "string", "maxLength": 10000},
+                        "image": {"type": "string", "format": "binary"},
+                    },
+                }
+            }
+        },
+    }
+}
 
-    - 달력이 페르소나를 사용하여 AI가 일정 정보를 추출
-    - 파싱 결과는 PendingEvent에 저장 (30분 TTL)
-    - 클라이언트에서 /confirm 호출 시 실제 Event로 변환
+
+def _to_parsed_events(events: list[dict]) -> list[ParsedEvent]:
+    """AI 파싱 결과(dict) → ParsedEvent 변환"""
+    return [
+        ParsedEvent(
+            title=e.get("title", ""),
+            start_time=e.get("start_time"),
+            end_time=e.get("end_time"),
+            all_day=e.get("all_day", False),
+            description=e.get("description"),
+            recurrence=e.get("recurrence"),
+        )
+        for e in events
+    ]
+
+
+def _is_successful_parse(response: CalendarAIResponse) -> bool:
+    """Idempotency 보관 대상 (실패 응답은 같은 키로 재시도하면 다시 파싱)"""
+    return response.success
+
+
+def _has_successful_item(response: CalendarAIBatchResponse) -> bool:
+    """배치 Idempotency 보관 대상 (모두 실패한 배치는 같은 키로 재시도하면 다시 파싱)
+
+    일부라도 성공했으면 PendingEvent가 이미 만들어졌으므로 재전송 시 중복 생성하지 않도록 보관
     """
+    return any(item.success for item in response.items)
+
+
+def _pending_response(pending) -> CalendarAIResponse:
+    """PendingEvent → 파싱 응답"""
+    return CalendarAIResponse(
+        success=True,
+        pending_id=pending.id,
+        events=_to_parsed_events(pending.event_data.get("events", [])),
+        message=pending.ai_message,
+        expires_at=pending.expires_at.isoformat(),
+    )
+
+
+def _require_member(current_user: FirebaseUser, member_service: MemberServiceProtocol):
+    """사용자의 FamilyMember 조회 (AI 호출 전에 확인, 없으면 404)"""
+    member = member_service.get_by_firebase_uid(current_user.uid)
+    if not member:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="가족 구성원으로 등록되지 않았습니다. 먼저 /calendar/auth/verify를 호출하세요.",
+        )
+    return member
+
+
+def _stage_base64_image(image_base64: str) -> StagedImage:
+    """Base64 이미지를 디코딩해 임시 파일로 저장"""
+    return get_image_stager().stage_bytes(decode_image_base64(image_base64))
+
+
+async def _parse_and_store(
+    text: str | None,
+    current_user: FirebaseUser,
+    claude_service: AIServiceProtocol,
+    pending_service: PendingEventServiceProtocol,
+    member_service: MemberServiceProtocol,
+    image_base64: str | None = None,
+    image: StagedImage | None = None,
+) -> CalendarAIResponse:
+    """달력이 페르소나로 일정을 파싱하고 PendingEvent로 저장 (/parse, /parse/upload 공통)"""
     # 텍스트와 이미지 둘 다 없으면 에러
-    if not request.text and not request.image_base64:
+    if not text and not image_base64 and image is None:
         return CalendarAIResponse(
             success=False,
             error="텍스트 또는 이미지 중 하나는 필수입니다",
         )
 
-    # 달력이 호출어 추가 (이미지만 있을 때는 기본 프롬프트 사용)
-    if request.text:
-        prompt = f"달력아 {request.text}"
-    else:
-        prompt = "달력아 이 이미지에서 일정을 추출해줘"
+    member = _require_member(current_user, member_service)
+
+    # Base64 이미지는 여기서 한 번만 디코딩해 임시 파일로 저장 (저장하면서 해시 계산)
+    owned_image = None
+    if image_base64 and image is None:
+        try:
+            image = owned_image = _stage_base64_image(image_base64)
+        except (ValueError, OSError) as e:
+            return CalendarAIResponse(
+                success=False,
+                error=f"Failed to process image: {e}",
+            )
+
+    try:
+        return await _parse_with_dedup(
+            text=text,
+            image=image,
+            member_id=member.id,
+            current_user=current_user,
+            claude_service=claude_service,
+            pending_service=pending_service,
+        )
+    finally:
+        if owned_image:
+            owned_image.remove()
+
+
+async def _parse_with_dedup(
+    text: str | None,
+    image: StagedImage | None,
+    member_id: UUID,
+    current_user: FirebaseUser,
+    claude_service: AIServiceProtocol,
+    pending_service: PendingEventServiceProtocol,
+) -> CalendarAIResponse:
+    """같은 이미지의 유효한 PendingEvent가 있으면 재사용, 없으면 파싱해서 PendingEvent 생성"""
+    outcome = await _resolve_parse(
+        text, image, member_id, current_user, claude_service, pending_service
+    )
+    if isinstance(outcome, CalendarAIResponse):
+        return outcome
+
+    with timed_stage("db_insert"):
+        pending = pending_service.create(
+            event_data=outcome.event_data,
+            user_uid=current_user.uid,
+            source_text=outcome.source_text,
+            source_image_hash=outcome.source_image_hash,
+            ai_message=outcome.ai_message,
+            confidence=outcome.confidence,
+        )
+    return _pending_response(pending)
+
+
+async def _resolve_parse(
+    text: str | None,
+    image: StagedImage | None,
+    member_id: UUID,
+    current_user: FirebaseUser,
+    claude_service: AIServiceProtocol,
+    pending_service: PendingEventServiceProtocol,
+) -> CalendarAIResponse | PendingEventDraft:
+    """파싱 결과 → 저장할 PendingEventDraft, 또는 바로 돌려줄 응답 (실패/기존 PendingEvent)"""
+    source_text = text or "[이미지]"
+    image_hash = image.sha256 if image else None
+
+    # 같은 이미지를 다시 올린 경우 (예: 부모 둘 다 같은 가정통신문 전송) AI 호출 생략
+    if image_hash:
+        reused = _reuse_image_parse(source_text, image_hash, member_id, pending_service)
+        if reused:
+            return reused
+
+    # 간단한 문구는 로컬 파서로 바로 처리 (신뢰도가 낮으면 AI로)
+    if text and image is None:
+        quick = _quick_draft(text)
+        if quick:
+            return quick
 
     # Claude AI 호출
     response = await claude_service.chat(
-        prompt=prompt,
-        image_base64=request.image_base64,
+        prompt=_ai_prompt(text),
+        user_id=current_user.uid,
+        image=image,
+    )
+    return _draft_from_response(response, response.parsed_events, source_text, image_hash)
+
+
+def _ai_prompt(text: str | None) -> str:
+    """달력이 호출어 추가 (이미지만 있을 때는 기본 프롬프트 사용)"""
+    if text:
+        return f"달력아 {text}"
+    return "달력아 이 이미지에서 일정을 추출해줘"
+
+
+def _reuse_image_parse(
+    source_text: str,
+    image_hash: str,
+    member_id: UUID,
+    pending_service: PendingEventServiceProtocol,
+) -> CalendarAIResponse | PendingEventDraft | None:
+    """같은 이미지(+텍스트)의 유효한 PendingEvent가 있으면 그 결과 (없으면 None)"""
+    existing = pending_service.find_by_image_hash(image_hash, source_text)
+    if not existing:
+        return None
+
+    if existing.created_by == member_id:
+        logger.info(f"Reusing PendingEvent {existing.id} for image {image_hash[:12]}")
+        return _pending_response(existing)
+
+    # 다른 가족이 만든 건 확인 권한이 없으므로 파싱 결과만 복사
+    logger.info(f"Copying PendingEvent {existing.id} for image {image_hash[:12]}")
+    return PendingEventDraft(
+        event_data=existing.event_data.get("events", []),
+        source_text=source_text,
+        source_image_hash=image_hash,
+        ai_message=existing.ai_message,
+        confidence=existing.confidence,
+    )
+
+
+def _quick_draft(text: str) -> PendingEventDraft | None:
+    """로컬 파서 결과가 충분히 확실하면 PendingEventDraft (아니면 None)"""
+    settings = get_settings()
+    if not settings.calendar_quick_parse_enabled:
+        return None
+    # 서버는 UTC라 "내일" 등의 기준일은 사용자 기준(KST) 오늘로 넘김
+    quick = quick_parse(text, today=today_kst())
+    if quick.confidence < settings.calendar_quick_parse_min_confidence:
+        return None
+    logger.info(f"Quick-parsed calendar text (confidence={quick.confidence})")
+    return PendingEventDraft(
+        event_data=quick.events,
+        source_text=text,
+        ai_message=quick.message,
+        confidence=quick.confidence,
     )
 
+
+def _draft_from_response(
+    response: AIChatResponse,
+    events: list[dict] | None,
+    source_text: str,
+    image_hash: str | None = None,
+) -> CalendarAIResponse | PendingEventDraft:
+    """AI 응답 → PendingEventDraft (실패하거나 일정이 없으면 실패 응답)"""
     if not response.success:
         return CalendarAIResponse(
             success=False,
@@ -110,52 +378,407 @@ async def parse_schedule(
         )
 
     # 파싱된 일정이 없으면 에러
-    if not response.parsed_events:
+    if not events:
         return CalendarAIResponse(
             success=False,
             error="일정을 찾을 수 없습니다",
             message=response.ai_message,
         )
 
-    # 사용자의 FamilyMember 조회
-    member = member_service.get_by_firebase_uid(current_user.uid)
-    if not member:
+    return PendingEventDraft(
+        event_data=events,
+        source_text=source_text,
+        source_image_hash=image_hash,
+        ai_message=response.ai_message,
+    )
+
+
+@router.post("/parse", response_model=CalendarAIResponse)
+async def parse_schedule(
+    request: CalendarAIRequest,
+    current_user: FirebaseUser = Depends(get_current_user),
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+    pending_service: PendingEventServiceProtocol = Depends(get_pending_event_service),
+    member_service: MemberServiceProtocol = Depends(get_member_service),
+    idempotency: Idempotency = Depends(get_idempotency),
+    disconnect: DisconnectGuard = Depends(get_disconnect_guard),
+):
+    """
+    텍스트/이미지에서 일정을 파싱하여 PendingEvent로 저장
+
+    - 달력이 페르소나를 사용하여 AI가 일정 정보를 추출
+    - 파싱 결과는 PendingEvent에 저장 (30분 TTL)
+    - 클라이언트에서 /confirm 호출 시 실제 Event로 변환
+    - 응답 전에 연결이 끊기면 AI 파싱을 취소 (오래 걸리는 요청은 /jobs 사용)
+    - Idempotency-Key가 같은 재전송은 같은 pending_id를 돌려줌 (실패 응답은 보관 안 함)
+    """
+
+    async def work() -> CalendarAIResponse:
+        return await _parse_and_store(
+            text=request.text,
+            image_base64=request.image_base64,
+            current_user=current_user,
+            claude_service=claude_service,
+            pending_service=pending_service,
+            member_service=member_service,
+        )
+
+    return await disconnect.run(
+        lambda: idempotency.run(
+            work, fingerprint=request.model_dump(), retain=_is_successful_parse
+        ),
+        cancellable=idempotency.cancellable,
+    )
+
+
+@router.post(
+    "/parse/upload",
+    response_model=CalendarAIResponse,
+    openapi_extra=PARSE_UPLOAD_OPENAPI,
+)
+async def parse_schedule_upload(
+    current_user: FirebaseUser = Depends(get_current_user),
+    upload: ImageUpload = Depends(get_image_upload),
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+    pending_service: PendingEventServiceProtocol = Depends(get_pending_event_service),
+    member_service: MemberServiceProtocol = Depends(get_member_service),
+    idempotency: Idempotency = Depends(get_idempotency),
+    disconnect: DisconnectGuard = Depends(get_disconnect_guard),
+):
+    """
+    /parse와 같지만 multipart/form-data로 받습니다 (필드: text, image 파일)
+
+    이미지는 청크 단위로 임시 파일에 바로 기록되므로 Base64 인코딩이 필요 없습니다.
+    """
+    text = upload.fields.get("text") or None
+    if text and len(text) > 10000:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="가족 구성원으로 등록되지 않았습니다. 먼저 /calendar/auth/verify를 호출하세요.",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="text는 최대 10000자까지 입력할 수 있습니다",
         )
 
-    # PendingEvent 생성
-    pending = pending_service.create(
-        event_data=response.parsed_events,
-        user_uid=current_user.uid,
-        source_text=request.text or "[이미지]",
-        source_image_hash=None,  # TODO: 이미지 해시 계산
-        ai_message=response.ai_message,
+    async def work() -> CalendarAIResponse:
+        return await _parse_and_store(
+            text=text,
+            image=upload.image,
+            current_user=current_user,
+            claude_service=claude_service,
+            pending_service=pending_service,
+            member_service=member_service,
+        )
+
+    image_hash = upload.image.sha256 if upload.image else None
+    return await disconnect.run(
+        lambda: idempotency.run(
+            work, fingerprint=(text, image_hash), retain=_is_successful_parse
+        ),
+        cancellable=idempotency.cancellable,
     )
 
-    # ParsedEvent 변환
-    parsed_events = [
-        ParsedEvent(
-            title=e.get("title", ""),
-            start_time=e.get("start_time"),
-            end_time=e.get("end_time"),
-            all_day=e.get("all_day", False),
-            description=e.get("description"),
-            recurrence=e.get("recurrence"),
+
+# 항목 ID → 저장할 PendingEventDraft 또는 바로 돌려줄 응답
+BatchOutcomes = dict[str, CalendarAIResponse | PendingEventDraft]
+
+
+async def _parse_text_group(
+    group: list[tuple[str, str]],
+    current_user: FirebaseUser,
+    claude_service: AIServiceProtocol,
+) -> tuple[BatchOutcomes, int]:
+    """텍스트 항목 묶음을 AI 호출 한 번으로 파싱 → (항목별 결과, AI 호출 수)"""
+    if len(group) == 1:
+        item_id, text = group[0]
+        response = await claude_service.chat(prompt=_ai_prompt(text), user_id=current_user.uid)
+        return {item_id: _draft_from_response(response, response.parsed_events, text)}, 1
+
+    response = await claude_service.chat(
+        prompt=build_batch_prompt([text for _, text in group]),
+        user_id=current_user.uid,
+    )
+    per_item, untagged = split_events(response.parsed_events or [], len(group))
+
+    # 일정은 찾았지만 항목 번호를 하나도 못 붙인 경우 항목별로 다시 파싱
+    if response.success and untagged and not any(per_item):
+        logger.warning(f"Batch response without item tags, re-parsing {len(group)} items")
+        results = await asyncio.gather(
+            *(_parse_text_group([entry], current_user, claude_service) for entry in group)
         )
-        for e in response.parsed_events
-    ]
+        outcomes: BatchOutcomes = {}
+        calls = 1
+        for partial, partial_calls in results:
+            outcomes.update(partial)
+            calls += partial_calls
+        return outcomes, calls
 
-    return CalendarAIResponse(
-        success=True,
-        pending_id=pending.id,
-        events=parsed_events,
-        message=response.ai_message,
-        expires_at=pending.expires_at.isoformat(),
+    return {
+        item_id: _draft_from_response(response, events, text)
+        for (item_id, text), events in zip(group, per_item)
+    }, 1
+
+
+def _batch_image_concurrency(claude_service: AIServiceProtocol) -> int:
+    """배치에서 동시에 디코딩/임시 저장해 둘 이미지 수 (달력이 레인의 동시 실행 예산)
+
+    어차피 레인 예산보다 많이는 동시에 실행되지 않으므로 그만큼만 미리 풀어 둡니다.
+    """
+    return claude_service.lane_concurrency(PersonaType.CALENDAR)
+
+
+async def _parse_image_item(
+    item: CalendarAIBatchItem,
+    member_id: UUID,
+    current_user: FirebaseUser,
+    claude_service: AIServiceProtocol,
+    pending_service: PendingEventServiceProtocol,
+    image_slots: asyncio.Semaphore,
+) -> tuple[CalendarAIResponse | PendingEventDraft, int]:
+    """이미지 항목은 하나씩 파싱 (CLI 호출당 이미지 하나) → (결과, AI 호출 수)
+
+    image_slots만큼만 동시에 디코딩/저장해서 큰 배치도 메모리와 tmpfs를 조금씩만 씀
+    """
+    async with image_slots:
+        try:
+            image = _stage_base64_image(item.image_base64)
+        except (ValueError, OSError) as e:
+            return CalendarAIResponse(success=False, error=f"Failed to process image: {e}"), 0
+
+        try:
+            source_text = item.text or "[이미지]"
+            reused = _reuse_image_parse(source_text, image.sha256, member_id, pending_service)
+            if reused:
+                return reused, 0
+            response = await claude_service.chat(
+                prompt=_ai_prompt(item.text),
+                user_id=current_user.uid,
+                image=image,
+            )
+            return _draft_from_response(
+                response, response.parsed_events, source_text, image.sha256
+            ), 1
+        finally:
+            image.remove()
+
+
+def _job_response(job: ParseJob) -> ParseJobResponse:
+    return ParseJobResponse(
+        job_id=job.id,
+        status=job.status,
+        created_at=job.created_at,
+        result=job.result,
+        error=job.error,
+    )
+
+
+@router.post("/parse/batch", response_model=CalendarAIBatchResponse)
+async def parse_schedule_batch(
+    request: CalendarAIBatchRequest,
+    current_user: FirebaseUser = Depends(get_current_user),
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+    pending_service: PendingEventServiceProtocol = Depends(get_pending_event_service),
+    member_service: MemberServiceProtocol = Depends(get_member_service),
+    idempotency: Idempotency = Depends(get_idempotency),
+    disconnect: DisconnectGuard = Depends(get_disconnect_guard),
+):
+    """
+    여러 텍스트/이미지를 한 번에 파싱 (예: 학기 일정표를 줄마다 붙여넣기)
+
+    - 텍스트 항목은 로컬 파서로 먼저 처리하고, 나머지는 항목 번호를 붙여 AI 호출 한 번에 묶음
+    - 이미지 항목은 항목마다 AI 호출 (같은 이미지는 /parse와 같이 재사용)
+    - 성공한 항목의 PendingEvent는 한 트랜잭션으로 생성
+    - 항목별 결과는 /parse 응답과 같은 형식이며 요청 순서를 따름
+    - Idempotency-Key가 같은 재전송은 처음 응답을 그대로 돌려줌
+    """
+    settings = get_settings()
+    if len(request.items) > settings.calendar_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"한 번에 최대 {settings.calendar_batch_max_items}개까지 파싱할 수 있습니다",
+        )
+
+    item_ids = [item.id or str(i) for i, item in enumerate(request.items, start=1)]
+    if len(set(item_ids)) != len(item_ids):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="항목 ID가 중복되었습니다",
+        )
+
+    async def work() -> CalendarAIBatchResponse:
+        member = _require_member(current_user, member_service)
+
+        outcomes: BatchOutcomes = {}
+        texts: list[tuple[str, str]] = []
+        image_items: list[tuple[str, CalendarAIBatchItem]] = []
+        for item_id, item in zip(item_ids, request.items):
+            if item.image_base64:
+                image_items.append((item_id, item))
+            elif not item.text:
+                outcomes[item_id] = CalendarAIResponse(
+                    success=False,
+                    error="텍스트 또는 이미지 중 하나는 필수입니다",
+                )
+            else:
+                quick = _quick_draft(item.text)
+                if quick:
+                    outcomes[item_id] = quick
+                else:
+                    texts.append((item_id, item.text))
+
+        groups = pack_items(
+            texts,
+            max_items=settings.calendar_batch_max_items_per_call,
+            max_chars=settings.calendar_batch_max_chars_per_call,
+        )
+        image_slots = asyncio.Semaphore(_batch_image_concurrency(claude_service))
+        group_results, image_results = await asyncio.gather(
+            asyncio.gather(
+                *(_parse_text_group(group, current_user, claude_service) for group in groups)
+            ),
+            asyncio.gather(
+                *(
+                    _parse_image_item(
+                        item, member.id, current_user, claude_service, pending_service, image_slots
+                    )
+                    for _, item in image_items
+                )
+            ),
+        )
+
+        ai_calls = 0
+        for partial, calls in group_results:
+            outcomes.update(partial)
+            ai_calls += calls
+        for (item_id, _), (outcome, calls) in zip(image_items, image_results):
+            outcomes[item_id] = outcome
+            ai_calls += calls
+
+        # 성공한 항목은 한 트랜잭션으로 저장
+        draft_ids = [i for i in item_ids if isinstance(outcomes[i], PendingEventDraft)]
+        with timed_stage("db_insert"):
+            pendings = pending_service.create_many(
+                [outcomes[i] for i in draft_ids], user_uid=current_user.uid
+            )
+        for item_id, pending in zip(draft_ids, pendings):
+            outcomes[item_id] = _pending_response(pending)
+
+        logger.info(
+            f"Batch parsed {len(item_ids)} items with {ai_calls} AI calls "
+            f"({len(draft_ids)} pending created)"
+        )
+        return CalendarAIBatchResponse(
+            items=[
+                CalendarAIBatchItemResult(id=item_id, **outcomes[item_id].model_dump())
+                for item_id in item_ids
+            ],
+            ai_calls=ai_calls,
+        )
+
+    return await disconnect.run(
+        lambda: idempotency.run(
+            work, fingerprint=request.model_dump(), retain=_has_successful_item
+        ),
+        cancellable=idempotency.cancellable,
     )
 
 
+@router.post(
+    "/jobs",
+    response_model=ParseJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_parse_job(
+    request: CalendarAIRequest,
+    current_user: FirebaseUser = Depends(get_current_user),
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+    member_service: MemberServiceProtocol = Depends(get_member_service),
+    pending_service_factory=Depends(get_pending_event_service_factory),
+    jobs: ParseJobManager = Depends(get_parse_job_manager),
+    idempotency: Idempotency = Depends(get_idempotency),
+):
+    """
+    /parse와 같은 요청을 작업으로 제출하고 바로 job_id를 반환 (202)
+
+    - 결과는 GET /calendar/ai/jobs/{job_id}로 조회 (롱폴링 가능)
+    - 결과는 /parse와 같이 PendingEvent에 저장되며 /confirm으로 등록
+    - 미완료 작업이 너무 많으면 429 + Retry-After
+    - Idempotency-Key가 같은 재전송은 작업을 새로 만들지 않고 같은 job_id를 돌려줌
+    """
+    if not request.text and not request.image_base64:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="텍스트 또는 이미지 중 하나는 필수입니다",
+        )
+
+    async def submit() -> ParseJobResponse:
+        member = _require_member(current_user, member_service)
+
+        # 이미지는 요청 본문이 사라지기 전에 저장해두고 작업이 끝나면 삭제
+        image = None
+        if request.image_base64:
+            try:
+                image = _stage_base64_image(request.image_base64)
+            except (ValueError, OSError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Failed to process image: {e}",
+                )
+
+        async def parse() -> CalendarAIResponse:
+            try:
+                with pending_service_factory() as pending_service:
+                    return await _parse_with_dedup(
+                        text=request.text,
+                        image=image,
+                        member_id=member.id,
+                        current_user=current_user,
+                        claude_service=claude_service,
+                        pending_service=pending_service,
+                    )
+            finally:
+                if image:
+                    image.remove()
+
+        try:
+            job = jobs.submit(current_user.uid, parse)
+        except Exception:
+            if image:
+                image.remove()
+            raise
+
+        logger.info(f"Parse job submitted: {job.id} (user={current_user.uid})")
+        return _job_response(job)
+
+    return await idempotency.run(submit, fingerprint=request.model_dump())
+
+
+@router.get("/jobs/{job_id}", response_model=ParseJobResponse)
+async def get_parse_job(
+    job_id: UUID,
+    wait: int = Query(
+        default=0,
+        ge=0,
+        description="작업이 끝날 때까지 최대 대기할 초 (롱폴링, 서버 상한 적용)",
+    ),
+    current_user: FirebaseUser = Depends(get_current_user),
+    jobs: ParseJobManager = Depends(get_parse_job_manager),
+):
+    """
+    파싱 작업 상태/결과 조회
+
+    - wait > 0이면 작업이 끝나거나 wait초가 지날 때까지 응답을 보류 (롱폴링)
+    - 본인이 제출한 작업만 조회 가능 (다른 사용자의 작업은 404)
+    """
+    job = jobs.get(job_id, current_user.uid)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다",
+        )
+
+    max_wait = get_settings().calendar_parse_job_max_wait_seconds
+    await jobs.wait(job, min(wait, max_wait))
+    return _job_response(job)
+
+
 @router.post("/confirm/{pending_id}", response_model=ConfirmResponse)
 async def confirm_schedule(
     pending_id: UUID,
@@ -3,6 +3,9 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.external import get_db
+from app.services.claude.dependencies import get_claude_service
+from app.services.claude.metrics import get_stage_metrics
+from app.services.claude.protocol import AIServiceProtocol
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -19,3 +22,20 @@ def db_health_check(db: Session = Depends(get_db)):
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         return {"status": "error", "database": str(e)}
+
+
+@router.get("/ai")
+async def ai_health_check(
+    claude_service: AIServiceProtocol = Depends(get_claude_service),
+):
+    stats = claude_service.get_stats()
+    # 서킷이 열려 있으면 AI 요청이 바로 실패하는 상태
+    circuit = stats.get("circuit") or {}
+    status = "degraded" if circuit.get("state", "closed") != "closed" else "ok"
+    return {"status": status, **stats}
+
+
+@router.get("/metrics")
+def metrics():
+    """AI 요청 경로 단계별 소요 시간 히스토그램 (ms 버킷)"""
+    return {"stages": get_stage_metrics().stats()}
@@ -43,7 +43,11 @@ class ChatResponse(BaseModel):
 
     response: str = Field(..., description="Claude 응답")
     elapsed_time_ms: int = Field(..., description="응답 시간 (밀리초)")
-    truncated: bool = Field(default=False, description="응답 잘림 여부")
+    truncated: bool = Field(
+        default=False,
+        description="응답 잘림 여부 (타임아웃/출력 크기 상한으로 중간까지만 생성된 부분 응답)",
+    )
+    queue_wait_ms: int = Field(default=0, description="AI 대기열 대기 시간 (밀리초)")
     persona: Optional[str] = Field(
         default=None,
         description="응답한 AI 캐릭터 (말랑이/루팡/푸딩/마이콜/달력이)",
@@ -11,7 +11,8 @@ from app.services.calendar.service import (
     CategoryService,
     EventService,
 )
-from app.services.calendar.pending import PendingEventService
+from app.services.calendar.pending import PendingEventDraft, PendingEventService
+from app.services.calendar.jobs import ParseJob, ParseJobManager, ParseJobStatus
 from app.exceptions import (
     NotFoundError,
     DuplicateError,
@@ -22,6 +23,8 @@ from app.services.calendar.dependencies import (
     get_category_service,
     get_event_service,
     get_pending_event_service,
+    get_pending_event_service_factory,
+    get_parse_job_manager,
 )
 from app.services.calendar.recurrence import (
     RecurrenceFrequency,
@@ -41,6 +44,11 @@ __all__ = [
     "CategoryService",
     "EventService",
     "PendingEventService",
+    "PendingEventDraft",
+    # Jobs
+    "ParseJob",
+    "ParseJobManager",
+    "ParseJobStatus",
     # Errors
     "NotFoundError",
     "DuplicateError",
@@ -50,6 +58,8 @@ __all__ = [
     "get_category_service",
     "get_event_service",
     "get_pending_event_service",
+    "get_pending_event_service_factory",
+    "get_parse_job_manager",
     # Recurrence
     "RecurrenceFrequency",
     "Weekday",
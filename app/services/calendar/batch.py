@@ -0,0 +1,64 @@
+"""일정 일괄 파싱 - 여러 텍스트를 CLI 한 번에 묶어 보내기
+
+학기 일정표처럼 줄마다 일정이 있는 입력을 줄마다 CLI로 보내면
+프로세스 시작과 시스템 프롬프트 비용을 매번 치르게 됩니다.
+항목마다 태그([1], [2], ...)를 붙여 한 프롬프트로 보내고,
+응답의 각 일정에 들어 있는 "item" 필드로 다시 항목별로 나눕니다.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+ITEM_KEY = "item"
+
+
+def pack_items(
+    items: list[tuple[str, str]], max_items: int, max_chars: int
+) -> list[list[tuple[str, str]]]:
+    """(항목 ID, 텍스트) 목록을 호출 단위로 묶음 (항목 수/글자 수 상한)"""
+    batches: list[list[tuple[str, str]]] = []
+    current: list[tuple[str, str]] = []
+    chars = 0
+    for item_id, text in items:
+        if current and (len(current) >= max_items or chars + len(text) > max_chars):
+            batches.append(current)
+            current, chars = [], 0
+        current.append((item_id, text))
+        chars += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_batch_prompt(texts: list[str]) -> str:
+    """항목 번호를 붙인 달력이 프롬프트 (번호는 1부터)"""
+    lines = "\n".join(f"[{i}] {text}" for i, text in enumerate(texts, start=1))
+    return (
+        "달력아 아래 번호가 붙은 항목마다 일정을 찾아줘. "
+        f'각 일정에는 그 일정이 나온 항목 번호를 "{ITEM_KEY}" 필드(숫자)로 꼭 넣어줘.\n\n'
+        f"{lines}"
+    )
+
+
+def split_events(events: list[dict], count: int) -> tuple[list[list[dict]], int]:
+    """응답 일정을 항목별로 나눔 → (항목별 일정 목록, 항목 번호가 없거나 잘못된 일정 수)
+
+    반환하는 일정에서는 item 필드를 뺍니다.
+    """
+    per_item: list[list[dict]] = [[] for _ in range(count)]
+    untagged = 0
+    for event in events:
+        event = dict(event)
+        tag = event.pop(ITEM_KEY, None)
+        try:
+            index = int(str(tag).strip().strip("[]")) - 1
+        except (TypeError, ValueError):
+            index = -1
+        if 0 <= index < count:
+            per_item[index].append(event)
+        else:
+            untagged += 1
+    if untagged:
+        logger.warning(f"{untagged} batch events had no valid item tag")
+    return per_item, untagged
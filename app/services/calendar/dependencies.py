@@ -1,9 +1,13 @@
 """캘린더 서비스 의존성 주입"""
 
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.external.database import get_db
+from app.config import get_settings
+from app.external.database import SessionLocal, get_db
 from app.services.calendar.protocol import (
     MemberServiceProtocol,
     CategoryServiceProtocol,
@@ -15,8 +19,11 @@ from app.services.calendar.service import (
     CategoryService,
     EventService,
 )
+from app.services.calendar.jobs import ParseJobManager
 from app.services.calendar.pending import PendingEventService
 
+_parse_job_manager: ParseJobManager | None = None
+
 
 def get_member_service(
     db: Session = Depends(get_db),
@@ -64,3 +71,51 @@ def get_pending_event_service(
         app.dependency_overrides[get_pending_event_service] = lambda: FakePendingEventService()
     """
     return PendingEventService(db)
+
+
+@contextmanager
+def _pending_event_session() -> Iterator[PendingEventServiceProtocol]:
+    """자체 DB 세션을 가진 PendingEvent 서비스"""
+    db = SessionLocal()
+    try:
+        yield PendingEventService(db)
+    finally:
+        db.close()
+
+
+def get_pending_event_service_factory() -> Callable[
+    [], ContextManager[PendingEventServiceProtocol]
+]:
+    """
+    요청이 끝난 뒤 실행되는 작업용 PendingEvent 서비스 팩토리 (요청 세션과 별도)
+
+    테스트에서 override 가능:
+        app.dependency_overrides[get_pending_event_service_factory] = (
+            lambda: lambda: nullcontext(FakePendingEventService())
+        )
+    """
+    return _pending_event_session
+
+
+def get_parse_job_manager() -> ParseJobManager:
+    """
+    AI 파싱 작업 실행기 의존성 주입 포인트 (프로세스당 하나)
+
+    테스트에서 override 가능:
+        app.dependency_overrides[get_parse_job_manager] = lambda: ParseJobManager()
+    """
+    global _parse_job_manager
+    if _parse_job_manager is None:
+        settings = get_settings()
+        _parse_job_manager = ParseJobManager(
+            max_workers=settings.calendar_parse_job_workers,
+            max_pending=settings.calendar_parse_job_max_pending,
+            result_ttl_seconds=settings.calendar_parse_job_ttl_seconds,
+        )
+    return _parse_job_manager
+
+
+async def shutdown_parse_job_manager() -> None:
+    """앱 종료 시 호출 (실행 중인 작업 취소)"""
+    if _parse_job_manager is not None:
+        await _parse_job_manager.shutdown()
@@ -0,0 +1,162 @@
+"""캘린더 AI 파싱 비동기 작업
+
+/calendar/ai/parse는 CLI가 끝날 때까지 HTTP 요청을 붙잡고 있어
+nginx/모바일 네트워크 타임아웃과 uvicorn 워커 점유 문제가 있습니다.
+작업 모드에서는 제출 즉시 job id를 돌려주고, 제한된 수의 작업만 동시에 실행하며,
+클라이언트는 GET /calendar/ai/jobs/{id} 롱폴링으로 결과를 받습니다.
+
+- 파싱 결과 자체는 PendingEvent에 저장되고, 작업에는 응답만 잠시 보관 (result_ttl_seconds)
+- 작업 목록은 프로세스 메모리에 있으므로 제출한 프로세스에서만 조회 가능
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Awaitable, Callable
+from uuid import UUID, uuid4
+
+from app.exceptions import TooManyRequestsError
+
+logger = logging.getLogger(__name__)
+
+
+class ParseJobStatus(str, Enum):
+    """작업 상태"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class ParseJob:
+    """파싱 작업 하나"""
+
+    id: UUID
+    owner_uid: str
+    status: ParseJobStatus = ParseJobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    result: Any = None
+    error: str | None = None
+    finished_at: float | None = None  # time.monotonic()
+    _done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (ParseJobStatus.DONE, ParseJobStatus.FAILED)
+
+
+class ParseJobManager:
+    """동시 실행 수가 제한된 인메모리 작업 실행기"""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 50,
+        result_ttl_seconds: int = 1800,
+        retry_after_seconds: int = 5,
+    ):
+        self.max_workers = max(max_workers, 1)
+        self.max_pending = max_pending
+        self.result_ttl_seconds = result_ttl_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+        self._jobs: dict[UUID, ParseJob] = {}
+
+        self.submitted_total = 0
+        self.failed_total = 0
+        self.rejected_total = 0
+
+    @property
+    def pending(self) -> int:
+        """아직 끝나지 않은 작업 수 (대기 + 실행 중)"""
+        return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def submit(self, owner_uid: str, work: Callable[[], Awaitable[Any]]) -> ParseJob:
+        """작업 제출 → 바로 ParseJob 반환
+
+        Raises:
+            TooManyRequestsError: 끝나지 않은 작업이 max_pending개 이상인 경우
+        """
+        self._purge_expired()
+        if self.pending >= self.max_pending:
+            self.rejected_total += 1
+            raise TooManyRequestsError(
+                "일정 분석 요청이 많아 잠시 후 다시 시도해주세요",
+                retry_after=self.retry_after_seconds,
+            )
+
+        job = ParseJob(id=uuid4(), owner_uid=owner_uid)
+        self._jobs[job.id] = job
+        job._task = asyncio.create_task(self._run(job, work))
+        self.submitted_total += 1
+        return job
+
+    async def _run(self, job: ParseJob, work: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            async with self._semaphore:
+                job.status = ParseJobStatus.RUNNING
+                job.result = await work()
+                job.status = ParseJobStatus.DONE
+        except asyncio.CancelledError:
+            job.status = ParseJobStatus.FAILED
+            job.error = "작업이 취소되었습니다"
+            raise
+        except Exception as e:
+            logger.exception(f"Parse job {job.id} failed")
+            job.status = ParseJobStatus.FAILED
+            job.error = str(e) or type(e).__name__
+            self.failed_total += 1
+        finally:
+            job.finished_at = time.monotonic()
+            job._done.set()
+
+    def get(self, job_id: UUID, owner_uid: str) -> ParseJob | None:
+        """작업 조회 (다른 사용자의 작업은 없는 것으로 취급)"""
+        self._purge_expired()
+        job = self._jobs.get(job_id)
+        if job is None or job.owner_uid != owner_uid:
+            return None
+        return job
+
+    async def wait(self, job: ParseJob, timeout: float) -> ParseJob:
+        """작업이 끝나거나 timeout초가 지날 때까지 대기 (롱폴링)"""
+        if not job.finished and timeout > 0:
+            try:
+                await asyncio.wait_for(job._done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job
+
+    def _purge_expired(self) -> None:
+        """끝난 지 result_ttl_seconds가 지난 작업 정리"""
+        now = time.monotonic()
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.result_ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def shutdown(self) -> None:
+        """앱 종료 시 실행 중인 작업 취소"""
+        tasks = [job._task for job in self._jobs.values() if job._task and not job._task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "running": sum(1 for j in self._jobs.values() if j.status == ParseJobStatus.RUNNING),
+            "max_workers": self.max_workers,
+            "submitted_total": self.submitted_total,
+            "failed_total": self.failed_total,
+            "rejected_total": self.rejected_total,
+        }
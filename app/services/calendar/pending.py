@@ -1,6 +1,7 @@
 """PendingEvent 서비스 - AI 파싱 결과 임시 저장"""
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from uuid import UUID
 
@@ -13,6 +14,17 @@ from app.schemas.calendar import EventCreate
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PendingEventDraft:
+    """create_many로 한 번에 저장할 PendingEvent 한 건 (create 인자와 같음)"""
+
+    event_data: list[dict]
+    source_text: str | None = None
+    source_image_hash: str | None = None
+    ai_message: str | None = None
+    confidence: float = 1.0
+
+
 class PendingEventService:
     """PendingEvent 서비스 (PendingEventServiceProtocol 구현)"""
 
@@ -78,6 +90,40 @@ class PendingEventService:
         )
         return pending
 
+    def create_many(
+        self,
+        drafts: list[PendingEventDraft],
+        user_uid: str,
+        expires_minutes: int | None = None,
+    ) -> list[PendingEvent]:
+        """여러 PendingEvent를 한 트랜잭션으로 생성 (일괄 파싱용, drafts 순서 유지)"""
+        if not drafts:
+            return []
+        member = self._get_member_by_firebase_uid(user_uid)
+        expires_at = datetime.utcnow() + timedelta(
+            minutes=expires_minutes or self.DEFAULT_EXPIRES_MINUTES
+        )
+
+        pendings = [
+            PendingEvent(
+                event_data={"events": draft.event_data},
+                source_text=draft.source_text,
+                source_image_hash=draft.source_image_hash,
+                created_by=member.id,
+                ai_message=draft.ai_message,
+                confidence=draft.confidence,
+                expires_at=expires_at,
+            )
+            for draft in drafts
+        ]
+        self.db.add_all(pendings)
+        self.db.commit()
+        for pending in pendings:
+            self.db.refresh(pending)
+
+        logger.info(f"PendingEvents created in batch: {len(pendings)}")
+        return pendings
+
     def get_by_id(self, pending_id: UUID) -> PendingEvent | None:
         """ID로 PendingEvent 조회"""
         return (
@@ -86,6 +132,25 @@ class PendingEventService:
             .first()
         )
 
+    def find_by_image_hash(
+        self, source_image_hash: str, source_text: str | None = None
+    ) -> PendingEvent | None:
+        """같은 이미지(+텍스트)로 만든 아직 유효한 PendingEvent 조회 (가족 전체, 최신순)
+
+        같은 가정통신문을 여러 번 올려도 AI 파싱을 다시 하지 않기 위함
+        """
+        return (
+            self.db.query(PendingEvent)
+            .filter(
+                PendingEvent.source_image_hash == source_image_hash,
+                PendingEvent.source_text == source_text,
+                PendingEvent.status == PendingEventStatus.PENDING.value,
+                PendingEvent.expires_at > datetime.utcnow(),
+            )
+            .order_by(PendingEvent.created_at.desc())
+            .first()
+        )
+
     def get_pending_by_user(self, user_uid: str) -> list[PendingEvent]:
         """사용자의 대기 중인 PendingEvent 목록 조회"""
         member = self._get_member_by_firebase_uid(user_uid)
@@ -15,6 +15,7 @@ from app.schemas.calendar import (
     EventUpdate,
     EventResponse,
 )
+from app.services.calendar.pending import PendingEventDraft
 
 
 class MemberServiceProtocol(Protocol):
@@ -117,10 +118,23 @@ class PendingEventServiceProtocol(Protocol):
         """PendingEvent 생성"""
         ...
 
+    def create_many(
+        self,
+        drafts: list[PendingEventDraft],
+        user_uid: str,
+        expires_minutes: int | None = None,
+    ) -> list:
+        """여러 PendingEvent를 한 트랜잭션으로 생성"""
+        ...
+
     def get_by_id(self, pending_id: UUID):
         """ID로 PendingEvent 조회"""
         ...
 
+    def find_by_image_hash(self, source_image_hash: str, source_text: str | None = None):
+        """같은 이미지(+텍스트)로 만든 유효한 PendingEvent 조회"""
+        ...
+
     def get_pending_by_user(self, user_uid: str) -> list:
         """사용자의 대기 중인 PendingEvent 목록 조회"""
         ...
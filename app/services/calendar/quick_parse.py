@@ -0,0 +1,378 @@
+"""간단한 한국어 일정 문구 로컬 파서
+
+"내일 오후 3시 치과", "다음주 월요일 종일 현장학습", "매주 월수금 피아노"처럼
+달력이 프롬프트(personas.py)의 날짜/시간/반복 규칙만으로 해석되는 짧은 문구를
+CLI 호출 없이 바로 파싱합니다.
+
+결과는 달력이 응답과 같은 일정 dict 형식이며, 신뢰도(confidence)가 낮으면
+호출자가 AI 파싱으로 넘깁니다. 확실하지 않은 부분이 있으면 신뢰도를 낮추는 것이 원칙입니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+
+from app.services.clock import today_kst
+
+# 요일 (월=0)
+WEEKDAYS = "월화수목금토일"
+RRULE_DAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+# 단어 뒤에 붙는 조사 / 단어 경계
+_PARTICLE = r"(?:에는|에|엔|은|는|부터|까지)?"
+_END = r"(?![가-힣\d])"
+_START = r"(?<![가-힣\d])"
+
+_RELATIVE_DAYS = {"오늘": 0, "내일": 1, "모레": 2, "글피": 3}
+_RELATIVE_MONTHS = {"이번": 0, "다음": 1, "다다음": 2}
+_RELATIVE_YEARS = {"올해": 0, "내년": 1, "내후년": 2}
+
+_DAILY = re.compile(_START + r"매일" + _PARTICLE + _END)
+_WEEKLY = re.compile(
+    _START + r"(매주|격주)\s*((?:[월화수목금토일]\s*[,·/]?\s*)+?)(?:요일)?" + _PARTICLE + _END
+)
+_MONTHLY = re.compile(_START + r"(?:매월|매달)\s*(\d{1,2})\s*일" + _PARTICLE + _END)
+_YEARLY = re.compile(
+    _START + r"매년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일" + _PARTICLE + _END
+)
+_AFTER = re.compile(_START + r"(\d{1,3})\s*(일|주)\s*(?:후|뒤)" + _PARTICLE + _END)
+_RELATIVE_YEAR_DATE = re.compile(
+    _START + r"(올해|내년|내후년)\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일" + _PARTICLE + _END
+)
+_RELATIVE_MONTH_DAY = re.compile(
+    _START + r"(이번|다음|다다음)\s*달\s*(\d{1,2})\s*일" + _PARTICLE + _END
+)
+_FULL_DATE = re.compile(
+    _START + r"(?:(\d{4})\s*년\s*)?(\d{1,2})\s*월\s*(\d{1,2})\s*일" + _PARTICLE + _END
+)
+_SLASH_DATE = re.compile(_START + r"(\d{1,2})/(\d{1,2})" + _PARTICLE + _END)
+_RELATIVE = re.compile(_START + r"(오늘|내일|모레|글피)" + _PARTICLE + _END)
+_WEEKDAY = re.compile(
+    _START + r"(?:(이번|다음|다다음)\s*주\s*)?([월화수목금토일])요일" + _PARTICLE + _END
+)
+_DAY_OF_MONTH = re.compile(_START + r"(\d{1,2})\s*일" + _PARTICLE + _END)
+
+_TIME = (
+    r"(오전|오후|아침|낮|저녁|밤|새벽)?\s*(\d{1,2})\s*(?:시\s*(?:(\d{1,2})\s*분|(반))?|:(\d{2}))"
+)
+_TIME_RANGE = re.compile(
+    _START + _TIME + r"\s*(?:부터|~|-)\s*" + _TIME + r"\s*(?:까지)?" + _END
+)
+_TIME_SINGLE = re.compile(_START + _TIME + _PARTICLE + _END)
+_NOON = re.compile(_START + r"정오" + _PARTICLE + _END)
+_ALL_DAY = re.compile(_START + r"(?:하루\s*)?종일" + _PARTICLE + _END)
+
+# 제목 끝의 요청 문구 ("등록해줘", "잡아줘" 등)
+_COMMAND_SUFFIX = re.compile(
+    r"\s*(?:일정\s*)?(?:을|를)?\s*"
+    r"(?:(?:등록|추가|저장|입력)\s*(?:해\s*줘|해\s*주세요|해줄래|해|하기|부탁해?)?|"
+    r"예약\s*(?:해\s*줘|해\s*주세요|해줄래|부탁해?)|"
+    r"(?:잡아|넣어|적어)\s*(?:줘|주세요))[.!~]*$"
+)
+_TRAILING_SCHEDULE = re.compile(r"\s+일정$")
+
+# 신뢰도를 낮추는 신호
+_MULTI_EVENT = re.compile(r"그리고|하고|,|및|랑")
+_VAGUE_TIME = re.compile(r"아침|점심|저녁|밤|오전|오후|새벽|쯤|경")
+_QUESTION = re.compile(r"\?|언제|뭐|무슨|어떻게")
+# 새 일정이 아니라 기존 일정을 바꾸는 요청 ("치과 취소", "3시로 미뤄줘")
+_CHANGE_REQUEST = re.compile(r"취소|변경|바꿔|바꾸|미뤄|미루|옮겨|옮기|앞당|삭제|지워")
+# 해석하지 못하고 제목에 남은 날짜 표현 ("다음달", "내년" 등)
+_LEFTOVER_DATE = re.compile(
+    r"(?:이번|다음|다다음|지난)\s*(?:달|주|해)|내년|내후년|올해|작년|주말|월말|월초|연말|연초"
+)
+
+MAX_TITLE_LENGTH = 20
+
+
+@dataclass
+class QuickParseResult:
+    """로컬 파싱 결과 (events는 달력이 응답과 같은 형식)"""
+
+    events: list[dict] = field(default_factory=list)
+    message: str | None = None
+    confidence: float = 0.0
+
+
+def _next_weekday(base: date, weekday: int) -> date:
+    """base 포함 가장 가까운 해당 요일"""
+    return base + timedelta(days=(weekday - base.weekday()) % 7)
+
+
+def _to_hour(meridiem: str | None, hour: int) -> int:
+    """오전/오후 표현을 24시간제로 변환 (표현이 없는 1~7시는 오후로 간주)"""
+    if meridiem in ("오후", "저녁", "밤"):
+        return hour + 12 if hour < 12 else hour
+    if meridiem in ("오전", "아침", "새벽"):
+        return 0 if hour == 12 else hour
+    if meridiem == "낮":
+        return hour + 12 if hour <= 5 else hour
+    return hour + 12 if 1 <= hour <= 7 else hour
+
+
+def _parse_time(groups: tuple, inherit: str | None = None) -> tuple[int, int, str | None]:
+    meridiem, hour, minute, half, colon_minute = groups
+    meridiem = meridiem or inherit
+    hour = _to_hour(meridiem, int(hour))
+    if half:
+        minute = 30
+    elif colon_minute:
+        minute = int(colon_minute)
+    else:
+        minute = int(minute or 0)
+    return hour, minute, meridiem
+
+
+class _Parser:
+    def __init__(self, text: str, today: date):
+        self.text = " ".join(text.split())
+        self.rest = self.text
+        self.today = today
+        self.day: date | None = None
+        self.date_matches = 0
+        self.start: time | None = None
+        self.end: time | None = None
+        self.all_day = False
+        self.recurrence: str | None = None
+        self.when: list[str] = []  # 메시지용 표현
+        self.penalty = 1.0
+
+    def take(self, pattern: re.Pattern) -> re.Match | None:
+        """패턴을 찾아 남은 텍스트에서 제거"""
+        match = pattern.search(self.rest)
+        if match:
+            self.rest = self.rest[: match.start()] + " " + self.rest[match.end() :]
+        return match
+
+    def set_day(self, day: date) -> None:
+        self.date_matches += 1
+        if self.day is None:
+            self.day = day
+
+    def parse_recurrence(self) -> None:
+        if self.take(_DAILY):
+            self.recurrence = "FREQ=DAILY"
+            self.when.append("매일")
+
+        match = self.take(_WEEKLY)
+        if match:
+            days = sorted({WEEKDAYS.index(c) for c in match.group(2) if c in WEEKDAYS})
+            interval = ";INTERVAL=2" if match.group(1) == "격주" else ""
+            self.recurrence = f"FREQ=WEEKLY{interval};BYDAY=" + ",".join(
+                RRULE_DAYS[d] for d in days
+            )
+            self.set_day(min(_next_weekday(self.today, d) for d in days))
+            names = "·".join(WEEKDAYS[d] for d in days)
+            self.when.append(f"{match.group(1)} {names}" + ("요일" if len(days) == 1 else ""))
+
+        match = self.take(_MONTHLY)
+        if match:
+            day_of_month = int(match.group(1))
+            self.recurrence = f"FREQ=MONTHLY;BYMONTHDAY={day_of_month}"
+            self.set_day(self._next_month_day(day_of_month))
+            self.when.append(f"매월 {day_of_month}일")
+
+        match = self.take(_YEARLY)
+        if match:
+            month, day = int(match.group(1)), int(match.group(2))
+            self.recurrence = "FREQ=YEARLY"
+            self.set_day(self._next_date(month, day))
+            self.when.append(f"매년 {month}월 {day}일")
+
+    def parse_date(self) -> None:
+        while match := self.take(_AFTER):
+            amount = int(match.group(1)) * (7 if match.group(2) == "주" else 1)
+            self.set_day(self.today + timedelta(days=amount))
+
+        while match := self.take(_RELATIVE_YEAR_DATE):
+            year = self.today.year + _RELATIVE_YEARS[match.group(1)]
+            self.set_day(self._date(year, int(match.group(2)), int(match.group(3))))
+
+        while match := self.take(_RELATIVE_MONTH_DAY):
+            offset = self.today.month - 1 + _RELATIVE_MONTHS[match.group(1)]
+            year, month = self.today.year + offset // 12, offset % 12 + 1
+            self.set_day(self._date(year, month, int(match.group(2))))
+
+        while match := self.take(_FULL_DATE):
+            year, month, day = match.groups()
+            if year:
+                self.set_day(self._date(int(year), int(month), int(day)))
+            else:
+                self.set_day(self._next_date(int(month), int(day)))
+
+        while match := self.take(_SLASH_DATE):
+            self.set_day(self._next_date(int(match.group(1)), int(match.group(2))))
+
+        while match := self.take(_RELATIVE):
+            self.set_day(self.today + timedelta(days=_RELATIVE_DAYS[match.group(1)]))
+
+        while match := self.take(_WEEKDAY):
+            week, weekday = match.group(1), WEEKDAYS.index(match.group(2))
+            monday = self.today - timedelta(days=self.today.weekday())
+            if week == "이번":
+                self.set_day(monday + timedelta(days=weekday))
+            elif week == "다음":
+                self.set_day(monday + timedelta(days=7 + weekday))
+            elif week == "다다음":
+                self.set_day(monday + timedelta(days=14 + weekday))
+            else:
+                self.set_day(_next_weekday(self.today, weekday))
+
+        while match := self.take(_DAY_OF_MONTH):
+            self.set_day(self._next_month_day(int(match.group(1))))
+
+    def parse_time(self) -> None:
+        match = self.take(_TIME_RANGE)
+        if match:
+            start_h, start_m, meridiem = _parse_time(match.groups()[:5])
+            end_h, end_m, _ = _parse_time(match.groups()[5:], inherit=meridiem)
+            if (end_h, end_m) <= (start_h, start_m) and end_h < 12:
+                end_h += 12
+            self.start, self.end = self._time(start_h, start_m), self._time(end_h, end_m)
+        else:
+            match = self.take(_TIME_SINGLE)
+            if match:
+                hour, minute, _ = _parse_time(match.groups())
+                self.start = self._time(hour, minute)
+            elif self.take(_NOON):
+                self.start = time(12, 0)
+
+        if self.take(_ALL_DAY):
+            self.all_day = True
+            if self.start is not None:
+                # "종일"과 시각이 같이 있으면 의도가 불분명
+                self.penalty = min(self.penalty, 0.5)
+
+        if match and self.take(_TIME_SINGLE):
+            # 시각이 두 개 이상이면 여러 일정일 가능성
+            self.penalty = min(self.penalty, 0.3)
+
+    def _time(self, hour: int, minute: int) -> time | None:
+        if 0 <= hour <= 23 and 0 <= minute <= 59:
+            return time(hour, minute)
+        self.penalty = 0.0
+        return None
+
+    def _date(self, year: int, month: int, day: int) -> date:
+        """연/월/일이 모두 정해진 날짜 (없는 날짜면 신뢰도 0)"""
+        try:
+            return date(year, month, day)
+        except ValueError:
+            self.penalty = 0.0
+            return self.today
+
+    def _next_date(self, month: int, day: int) -> date:
+        """연도가 없는 날짜 → 오늘 이후 가장 가까운 날짜"""
+        try:
+            candidate = date(self.today.year, month, day)
+            if candidate < self.today:
+                candidate = date(self.today.year + 1, month, day)
+            return candidate
+        except ValueError:
+            self.penalty = 0.0
+            return self.today
+
+    def _next_month_day(self, day: int) -> date:
+        """이번 달(지났으면 다음 달)의 day일"""
+        year, month = self.today.year, self.today.month
+        for _ in range(12):
+            try:
+                candidate = date(year, month, day)
+                if candidate >= self.today:
+                    return candidate
+            except ValueError:
+                pass
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        self.penalty = 0.0
+        return self.today
+
+    def title(self) -> str:
+        title = " ".join(self.rest.split())
+        title = _COMMAND_SUFFIX.sub("", title).strip(" ,.!~")
+        stripped = _TRAILING_SCHEDULE.sub("", title)
+        return stripped or title
+
+    def confidence(self, title: str) -> float:
+        score = 0.95
+        if self.day is None and self.recurrence is None:
+            # 시각만 있으면 날짜를 추정해야 함
+            score = 0.6 if self.start else 0.0
+        if not title:
+            return 0.0
+        if re.search(r"\d", title):
+            score = min(score, 0.3)  # 해석하지 못한 숫자
+        if self.date_matches > 1:
+            score = min(score, 0.3)  # 날짜가 여러 개 → 여러 일정일 가능성
+        if _QUESTION.search(self.text):
+            score = min(score, 0.2)
+        if _CHANGE_REQUEST.search(self.text):
+            score = min(score, 0.2)
+        if _LEFTOVER_DATE.search(title):
+            score = min(score, 0.3)
+        if _MULTI_EVENT.search(title):
+            score = min(score, 0.4)
+        if _VAGUE_TIME.search(title):
+            score = min(score, 0.6)
+        if len(title) > MAX_TITLE_LENGTH:
+            score = min(score, 0.6)
+        return round(min(score, self.penalty), 2)
+
+
+def quick_parse(text: str, today: date | None = None) -> QuickParseResult:
+    """짧은 일정 문구를 로컬에서 파싱
+
+    Args:
+        text: 사용자 입력 (호출어 제외)
+        today: 기준 날짜 (기본 오늘, KST)
+
+    Returns:
+        QuickParseResult - confidence가 낮으면 AI 파싱으로 넘겨야 함
+    """
+    parser = _Parser(text or "", today or today_kst())
+    parser.parse_recurrence()
+    parser.parse_date()
+    parser.parse_time()
+
+    title = parser.title()
+    confidence = parser.confidence(title)
+    if confidence == 0.0:
+        return QuickParseResult(confidence=0.0)
+
+    day = parser.day or parser.today
+    if parser.start is None or parser.all_day:
+        start = datetime.combine(day, time(0, 0))
+        end = datetime.combine(day, time(23, 59, 59))
+        all_day = True
+    else:
+        start = datetime.combine(day, parser.start)
+        end = (
+            datetime.combine(day, parser.end)
+            if parser.end
+            else start + timedelta(hours=1)
+        )
+        all_day = False
+
+    event = {
+        "title": title,
+        "start_time": start.isoformat(),
+        "end_time": end.isoformat(),
+        "all_day": all_day,
+        "description": None,
+        "recurrence": parser.recurrence,
+    }
+    return QuickParseResult(
+        events=[event],
+        message=f"{_describe(parser, start, all_day)} {title} 일정이에요!",
+        confidence=confidence,
+    )
+
+
+def _describe(parser: _Parser, start: datetime, all_day: bool) -> str:
+    """확인 메시지용 날짜/시간 표현"""
+    when = parser.when[0] if parser.when else f"{start.month}월 {start.day}일"
+    if all_day:
+        return f"{when} 종일"
+    hour = start.hour % 12 or 12
+    meridiem = "오전" if start.hour < 12 else "오후"
+    minute = f" {start.minute}분" if start.minute else ""
+    return f"{when} {meridiem} {hour}시{minute}"
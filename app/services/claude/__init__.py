@@ -1,7 +1,13 @@
 """Claude 서비스 모듈"""
 
-from app.services.claude.protocol import AIServiceProtocol, ChatResponse
+from app.services.claude.protocol import (
+    AIErrorType,
+    AIServiceProtocol,
+    ChatChunk,
+    ChatResponse,
+)
 from app.services.claude.service import ClaudeService
+from app.services.claude.api import ClaudeAPIService
 from app.services.claude.dependencies import get_claude_service
 from app.services.claude.personas import (
     PersonaType,
@@ -15,9 +21,12 @@ from app.services.claude.personas import (
 __all__ = [
     # Protocol
     "AIServiceProtocol",
+    "AIErrorType",
     "ChatResponse",
+    "ChatChunk",
     # Service
     "ClaudeService",
+    "ClaudeAPIService",
     "get_claude_service",
     # Personas
     "PersonaType",
@@ -0,0 +1,224 @@
+"""Messages API 백엔드 (CLI 대신 HTTP 호출)
+
+요청마다 CLI 프로세스를 띄우고 인증하는 대신, 앱 전체가 공유하는 httpx 클라이언트의
+keep-alive 연결 풀(HTTP/2 가능)로 Messages API를 스트리밍 호출합니다.
+페르소나 감지, 캐시, 중복 요청 합치기, 스케줄러, 서킷 브레이커, 적응형 타임아웃은
+ClaudeService와 같은 경로를 쓰고 실제 실행 부분(_stream_backend)만 교체합니다.
+
+- 페르소나 지시사항은 system 블록(cache_control)으로 보내 프롬프트 캐시 재사용
+- CLI와 달리 현재 날짜를 알려주지 않으므로 캐시 블록 뒤에 오늘 날짜(KST) 블록을 따로 붙임
+  (달력이가 "내일", "다음주" 등을 해석하는 기준, 캐시 접두사는 그대로 유지)
+- 이미지는 파일 경로 대신 base64 image 블록으로 전송
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator
+
+import httpx
+
+from app.services.claude.imaging import sniff_format
+from app.services.claude.metrics import record_stage
+from app.services.claude.personas import PersonaType, get_system_prompt
+from app.services.claude.service import ClaudeService, CLIResult
+from app.services.clock import KST, now_kst
+
+logger = logging.getLogger(__name__)
+
+MESSAGES_PATH = "/v1/messages"
+
+WEEKDAYS = "월화수목금토일"
+
+
+def current_date_text(now: datetime | None = None) -> str:
+    """system 블록에 넣을 현재 날짜/시각 (KST)"""
+    now = (now or now_kst()).astimezone(KST)
+    return (
+        f"현재 날짜와 시각: {now:%Y-%m-%d} ({WEEKDAYS[now.weekday()]}요일) "
+        f"{now:%H:%M} KST"
+    )
+
+
+class MessagesAPIError(Exception):
+    """Messages API 에러 응답 (HTTP 에러 상태 또는 스트림 중 error 이벤트)"""
+
+    pass
+
+
+def _http2_available() -> bool:
+    """HTTP/2용 h2 패키지 설치 여부 (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ClaudeAPIService(ClaudeService):
+    """Messages API 서비스 (AIServiceProtocol 구현)"""
+
+    backend_name = "api"
+
+    def __init__(self):
+        super().__init__()
+        settings = self.settings
+        # CLI 워커 풀은 사용하지 않음 (설정으로 만들어졌어도 시작 전에 버림)
+        self.pools = {}
+
+        self.http2 = settings.claude_api_http2 and _http2_available()
+        if settings.claude_api_http2 and not self.http2:
+            logger.warning("h2 package not installed, Messages API client falls back to HTTP/1.1")
+        if not settings.claude_api_key:
+            logger.warning("claude_api_key is not set, Messages API requests will be rejected")
+
+        headers = {"anthropic-version": settings.claude_api_version}
+        if settings.claude_api_key:
+            headers["x-api-key"] = settings.claude_api_key
+        self.client = httpx.AsyncClient(
+            base_url=settings.claude_api_base_url,
+            headers=headers,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=settings.claude_api_max_connections,
+                max_keepalive_connections=settings.claude_api_max_keepalive_connections,
+                keepalive_expiry=settings.claude_api_keepalive_expiry_seconds,
+            ),
+            # 전체 시간 제한은 요청별 타임아웃(deadline)으로 따로 적용
+            timeout=httpx.Timeout(
+                settings.claude_max_timeout_seconds,
+                connect=settings.claude_api_connect_timeout_seconds,
+            ),
+        )
+        self.api_stats = {"requests_total": 0, "errors_total": 0}
+
+    async def shutdown(self) -> None:
+        """앱 종료 시 호출 - 연결 풀 닫기"""
+        await super().shutdown()
+        await self.client.aclose()
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats["api"] = {
+            "base_url": self.settings.claude_api_base_url,
+            "model": self.settings.claude_api_model,
+            "http2": self.http2,
+            **self.api_stats,
+        }
+        return stats
+
+    async def _request_body(
+        self, user_prompt: str, image_path: str | None, persona_type: PersonaType
+    ) -> dict:
+        """Messages API 요청 본문 (스트리밍)"""
+        content: list[dict] = []
+        if image_path:
+            data = await asyncio.to_thread(Path(image_path).read_bytes)
+            sniffed = sniff_format(data[:16])
+            content.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": f"image/{sniffed[0] if sniffed else 'png'}",
+                    "data": base64.b64encode(data).decode("ascii"),
+                },
+            })
+        content.append({"type": "text", "text": user_prompt})
+
+        return {
+            "model": self.settings.claude_api_model,
+            "max_tokens": self.settings.claude_api_max_tokens,
+            "stream": True,
+            "system": [
+                {
+                    "type": "text",
+                    "text": get_system_prompt(persona_type),
+                    "cache_control": {"type": "ephemeral"},
+                },
+                # 매번 바뀌므로 캐시 블록 뒤에 (캐시 접두사에 영향 없음)
+                {"type": "text", "text": current_date_text()},
+            ],
+            "messages": [{"role": "user", "content": content}],
+        }
+
+    async def _events(self, body: dict) -> AsyncIterator[dict]:
+        """스트리밍 응답의 SSE data 이벤트를 도착하는 대로 반환"""
+        async with self.client.stream("POST", MESSAGES_PATH, json=body) as response:
+            if response.status_code != 200:
+                detail = (await response.aread()).decode("utf-8", errors="replace")
+                raise MessagesAPIError(
+                    f"Messages API returned {response.status_code}: {detail[:500]}"
+                )
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    yield json.loads(line[5:])
+                except ValueError:
+                    logger.warning(f"Skipping malformed SSE data: {line[:200]}")
+
+    async def _stream_backend(
+        self,
+        user_prompt: str,
+        image_path: str | None,
+        persona_type: PersonaType,
+        timeout: int,
+    ) -> AsyncIterator[str | CLIResult]:
+        """Messages API 스트리밍 호출 → 텍스트 조각(str)들, 마지막에 CLIResult"""
+        self.api_stats["requests_total"] += 1
+        body = await self._request_body(user_prompt, image_path, persona_type)
+        events = self._events(body)
+
+        deadline = time.monotonic() + timeout
+        started = time.perf_counter()
+        first_event = True
+        parts: list[str] = []
+        usage: dict = {}
+        truncated = False
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    event = await asyncio.wait_for(anext(events), remaining)
+                except StopAsyncIteration:
+                    break
+                if first_event:
+                    # 요청 전송(연결 재사용 포함)부터 첫 이벤트까지
+                    record_stage("first_byte", (time.perf_counter() - started) * 1000)
+                    first_event = False
+
+                event_type = event.get("type")
+                if event_type == "message_start":
+                    usage.update(event.get("message", {}).get("usage") or {})
+                elif event_type == "content_block_delta":
+                    delta = event.get("delta") or {}
+                    if delta.get("type") == "text_delta" and delta.get("text"):
+                        parts.append(delta["text"])
+                        yield delta["text"]
+                elif event_type == "message_delta":
+                    usage.update(event.get("usage") or {})
+                    if (event.get("delta") or {}).get("stop_reason") == "max_tokens":
+                        logger.warning("Messages API response truncated at max_tokens")
+                        truncated = True
+                elif event_type == "error":
+                    error = event.get("error") or {}
+                    raise MessagesAPIError(error.get("message") or "Messages API stream error")
+        except asyncio.TimeoutError:
+            # 타임아웃 전까지 받은 텍스트는 부분 응답으로 살림
+            yield CLIResult(output="".join(parts), timed_out=True)
+            return
+        except (MessagesAPIError, httpx.HTTPError) as e:
+            self.api_stats["errors_total"] += 1
+            yield CLIResult(output="", error=str(e) or type(e).__name__)
+            return
+        finally:
+            await events.aclose()
+            record_stage("generate", (time.perf_counter() - started) * 1000)
+
+        yield CLIResult(output="".join(parts), usage=usage or None, truncated=truncated)
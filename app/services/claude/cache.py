@@ -0,0 +1,172 @@
+"""AI 응답 캐시 - 메모리 LRU + 디스크 content-addressed 저장소
+
+키: (페르소나, 정규화된 프롬프트, 이미지 해시, 날짜 버킷)
+- 날짜 버킷: "내일", "다음주 월요일" 같은 상대 날짜는 날짜가 바뀌면 결과가 달라지므로
+  오늘 날짜(KST)를 키에 포함 (서버 UTC 날짜를 쓰면 KST 자정~오전 9시에 전날 결과가 재사용됨)
+- 페르소나별 TTL로 캐시 여부 결정 (TTL이 없는 페르소나는 캐시하지 않음)
+
+조회 순서: 메모리 → 디스크 (디스크 적중 시 메모리로 승격)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import date
+
+from app.services.claude.personas import PersonaType
+from app.services.clock import today_kst
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """캐시 키용 프롬프트 정규화 (유니코드 NFC, 공백 정리, 소문자)"""
+    prompt = unicodedata.normalize("NFC", prompt)
+    return _WHITESPACE.sub(" ", prompt).strip().lower()
+
+
+def make_cache_key(
+    persona_type: PersonaType,
+    prompt: str,
+    image_hash: str | None = None,
+    today: date | None = None,
+) -> str:
+    """캐시 키 (SHA-256 hex)"""
+    bucket = (today or today_kst()).isoformat()
+    raw = "\x1f".join(
+        [persona_type.value, normalize_prompt(prompt), image_hash or "", bucket]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """2단계 AI 응답 캐시"""
+
+    def __init__(
+        self,
+        ttl_by_persona: dict[str, int],
+        max_entries: int = 256,
+        disk_dir: str | None = None,
+    ):
+        self.ttl_by_persona = {k: v for k, v in ttl_by_persona.items() if v > 0}
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir or None
+        self._memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def is_cacheable(self, persona_type: PersonaType) -> bool:
+        """페르소나별 캐시 정책"""
+        return persona_type.value in self.ttl_by_persona
+
+    async def get(self, key: str) -> dict | None:
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.hits_memory += 1
+                return payload
+            del self._memory[key]
+
+        if self.disk_dir:
+            stored = await asyncio.to_thread(self._read_disk, key)
+            if stored is not None and stored["expires_at"] > now:
+                self._remember(key, stored["expires_at"], stored["payload"])
+                self.hits_disk += 1
+                return stored["payload"]
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, persona_type: PersonaType, payload: dict) -> None:
+        """캐시 저장 (캐시 대상이 아닌 페르소나는 무시)"""
+        ttl = self.ttl_by_persona.get(persona_type.value)
+        if not ttl:
+            return
+
+        expires_at = time.time() + ttl
+        self._remember(key, expires_at, payload)
+        self.stores += 1
+
+        if self.disk_dir:
+            await asyncio.to_thread(self._write_disk, key, expires_at, payload)
+
+    def _remember(self, key: str, expires_at: float, payload: dict) -> None:
+        self._memory[key] = (expires_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> dict | None:
+        path = self._disk_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to read AI cache entry {key}: {e}")
+            return None
+
+        if stored.get("expires_at", 0) <= time.time():
+            # 만료된 항목은 읽는 김에 정리
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return stored
+
+    def _write_disk(self, key: str, expires_at: float, payload: dict) -> None:
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 임시 파일에 쓰고 rename (동시 읽기 시 깨진 파일 방지)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"expires_at": expires_at, "payload": payload},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write AI cache entry {key}: {e}")
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 지표 (헬스 엔드포인트용)"""
+        lookups = self.hits_memory + self.hits_disk + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits_memory": self.hits_memory,
+            "hits_disk": self.hits_disk,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits_memory + self.hits_disk) / lookups, 3)
+            if lookups
+            else 0.0,
+            "personas": sorted(self.ttl_by_persona),
+            "disk": self.disk_dir is not None,
+        }
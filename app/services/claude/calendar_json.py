@@ -0,0 +1,149 @@
+"""달력이 응답 JSON 점진 추출
+
+CLI 출력이 스트리밍되는 동안 텍스트 조각을 받아
+```json 펜스 또는 맨 JSON 객체를 찾고, `events` 배열의 원소가 완성될 때마다 바로 돌려줍니다.
+UI가 나머지 일정이 생성되는 동안 첫 일정부터 그릴 수 있게 하기 위함입니다.
+
+응답 형식:
+    {"events": [{...}, {...}], "message": "..."}
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+_FENCE = "```json"
+
+
+class CalendarJSONExtractor:
+    """스트리밍 텍스트에서 events 원소를 완성되는 대로 꺼내는 파서
+
+    Usage:
+        extractor = CalendarJSONExtractor()
+        for delta in deltas:
+            for event in extractor.feed(delta):
+                ...
+        events, message = extractor.result()
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0  # 다음에 검사할 위치
+        self._root_start = -1  # 최상위 객체 '{' 위치
+        self._root_end = -1  # 최상위 객체 '}' 다음 위치
+        self._stack: list[str] = []  # 열린 괄호 ('{' / '[')
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string: str | None = None
+        self._key: str | None = None  # 최상위 객체에서 현재 값의 키
+        self._events_depth = -1  # events 배열의 스택 깊이
+        self._event_start = -1
+        self.events: list[dict] = []
+
+    @property
+    def done(self) -> bool:
+        """최상위 객체가 닫혔는지"""
+        return self._root_end >= 0
+
+    def feed(self, text: str) -> list[dict]:
+        """텍스트 조각 추가 → 이번에 완성된 events 원소 목록"""
+        if self.done or not text:
+            return []
+        self._buffer += text
+
+        if self._root_start < 0 and not self._find_root():
+            return []
+
+        completed: list[dict] = []
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer) and not self.done:
+            ch = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._last_string = buffer[self._string_start + 1 : i]
+            elif ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ":":
+                if len(self._stack) == 1:
+                    self._key = self._last_string
+            elif ch in "{[":
+                self._stack.append(ch)
+                depth = len(self._stack)
+                if ch == "[" and depth == 2 and self._key == "events":
+                    self._events_depth = depth
+                elif ch == "{" and depth == self._events_depth + 1 and self._events_depth > 0:
+                    self._event_start = i
+            elif ch in "}]":
+                depth = len(self._stack)
+                if not self._stack:
+                    break
+                self._stack.pop()
+                if ch == "}" and depth == self._events_depth + 1 and self._event_start >= 0:
+                    event = self._load(buffer[self._event_start : i + 1])
+                    self._event_start = -1
+                    if isinstance(event, dict):
+                        self.events.append(event)
+                        completed.append(event)
+                elif ch == "]" and depth == self._events_depth:
+                    self._events_depth = -1
+                elif not self._stack:
+                    self._root_end = i + 1
+            elif ch == "," and len(self._stack) == 1:
+                self._key = None
+            i += 1
+        self._pos = i
+        return completed
+
+    def _find_root(self) -> bool:
+        """최상위 객체 시작 위치 찾기 (```json 펜스 안, 또는 출력 맨 앞의 '{')"""
+        fence = self._buffer.find(_FENCE)
+        if fence >= 0:
+            brace = self._buffer.find("{", fence + len(_FENCE))
+        elif self._buffer.lstrip().startswith("{"):
+            brace = self._buffer.find("{")
+        else:
+            # 앞에 설명 문장이 오는 경우 펜스가 나올 때까지 대기
+            return False
+        if brace < 0:
+            return False
+        self._root_start = brace
+        self._pos = brace
+        return True
+
+    @staticmethod
+    def _load(text: str):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Skipping malformed calendar event: {e}")
+            return None
+
+    def result(self) -> tuple[list[dict], str | None]:
+        """최종 (events, message)
+
+        최상위 객체가 온전하면 그 내용을, 아니면 지금까지 완성된 events만 반환
+        """
+        if self.done:
+            data = self._load(self._buffer[self._root_start : self._root_end])
+            if isinstance(data, dict):
+                events = data.get("events", [])
+                if not isinstance(events, list):
+                    events = []
+                return events, data.get("message")
+        return list(self.events), None
+
+
+def parse_calendar_output(output: str) -> tuple[list[dict], str | None]:
+    """완성된 CLI 출력 전체에서 (events, message) 추출"""
+    extractor = CalendarJSONExtractor()
+    extractor.feed(output)
+    return extractor.result()
@@ -0,0 +1,120 @@
+"""Claude CLI 서킷 브레이커
+
+CLI 설정 오류, 사용량 제한, 업스트림 장애 중에는 요청마다 프로세스를 띄워
+실패할 때까지 기다리는 대신 바로 실패 응답을 돌려줍니다.
+
+- closed: 정상. 연속 실패(타임아웃/CLI 에러)가 failure_threshold에 닿으면 open
+- open: CLI 실행 없이 바로 service_unavailable. reset_seconds가 지나면 half_open
+- half_open: 요청 하나만 시험 삼아 실행 (성공 → closed, 실패 → 다시 open)
+  열리기 전에 들어와 늦게 끝난 요청의 결과는 시험 요청 결과가 아니므로 무시
+  (record_success/record_failure에 probe=True로 시험 요청임을 표시)
+"""
+
+import logging
+import math
+import time
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """서킷 상태"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_seconds = reset_seconds
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.opened_total = 0
+        self.rejected_total = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 상태 (open 유지 시간이 지났으면 half_open으로 보임)"""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_seconds
+        ):
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_after(self) -> int:
+        """다시 시도해볼 만한 시점까지 남은 초"""
+        if self._state != CircuitState.OPEN:
+            return 0
+        remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+        return max(math.ceil(remaining), 1)
+
+    def allow(self) -> bool:
+        """이번 요청을 실행해도 되는지 (half_open에서는 시험 요청 하나만 허용)"""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = True
+            logger.info("Circuit half-open, sending probe request")
+            return True
+        self.rejected_total += 1
+        return False
+
+    def record_success(self, probe: bool = False) -> None:
+        """실행 성공 (probe: half_open에서 allow()로 들어간 시험 요청인지)"""
+        if self._state == CircuitState.HALF_OPEN and not probe:
+            return
+        self._consecutive_failures = 0
+        if self._state == CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+            self._state = CircuitState.CLOSED
+            logger.info("Circuit closed after successful probe")
+
+    def record_failure(self, probe: bool = False) -> None:
+        """실행 실패 (probe: half_open에서 allow()로 들어간 시험 요청인지)"""
+        if self._state == CircuitState.HALF_OPEN and not probe:
+            return
+        self._consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+            self._open()
+        elif (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._open()
+
+    def abandon_probe(self) -> None:
+        """시험 요청이 결과 없이 끝난 경우 (취소, 대기열 초과, 잘못된 이미지 등)"""
+        if self._state == CircuitState.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.opened_total += 1
+        logger.warning(
+            f"Circuit opened after {self._consecutive_failures} consecutive failures, "
+            f"retry in {self.reset_seconds}s"
+        )
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "retry_after_seconds": self.retry_after,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
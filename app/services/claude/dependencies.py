@@ -1,5 +1,7 @@
 """Claude 서비스 의존성 주입"""
 
+from app.config import get_settings
+from app.services.claude.api import ClaudeAPIService
 from app.services.claude.protocol import AIServiceProtocol
 from app.services.claude.service import ClaudeService
 
@@ -7,10 +9,13 @@ _claude_service: ClaudeService | None = None
 
 
 def _get_singleton() -> ClaudeService:
-    """싱글톤 인스턴스 반환 (내부용)"""
+    """싱글톤 인스턴스 반환 (내부용, claude_backend 설정에 따라 CLI 또는 Messages API)"""
     global _claude_service
     if _claude_service is None:
-        _claude_service = ClaudeService()
+        if get_settings().claude_backend == "api":
+            _claude_service = ClaudeAPIService()
+        else:
+            _claude_service = ClaudeService()
     return _claude_service
 
 
@@ -22,3 +27,14 @@ async def get_claude_service() -> AIServiceProtocol:
         app.dependency_overrides[get_claude_service] = lambda: FakeClaudeService()
     """
     return _get_singleton()
+
+
+async def start_claude_service() -> None:
+    """앱 시작 시 호출 (워커 풀 예열)"""
+    await _get_singleton().start()
+
+
+async def shutdown_claude_service() -> None:
+    """앱 종료 시 호출 (워커 풀 drain, HTTP 연결 풀 닫기)"""
+    if _claude_service is not None:
+        await _claude_service.shutdown()
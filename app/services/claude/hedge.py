@@ -0,0 +1,53 @@
+"""헤지 요청 예산
+
+CLI 응답 시간은 꼬리가 길어서(대부분 몇 초, 일부는 1분 가까이 멈춤)
+첫 출력이 평소보다 늦으면 같은 요청을 한 번 더 실행해 먼저 응답한 쪽을 쓰면 p99가 크게 줄어듭니다.
+다만 헤지는 CLI 실행을 늘리므로 전체 요청 대비 비율을 토큰 버킷으로 제한합니다.
+
+- 헤지 대상 요청마다 ratio만큼 토큰 적립 (최대 burst개)
+- 헤지 한 번에 토큰 1개 사용, 토큰이 없으면 헤지하지 않고 원래 요청만 기다림
+예: ratio=0.05면 장기적으로 헤지 대상 요청의 5% 이하만 두 번 실행됩니다.
+"""
+
+
+class HedgeBudget:
+    """헤지 비율 상한 (토큰 버킷) + 헤지 통계"""
+
+    def __init__(self, ratio: float = 0.05, burst: int = 3):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = 0.0
+
+        self.requests_total = 0
+        self.hedged_total = 0
+        self.denied_total = 0
+        self.wins_total = 0
+
+    def on_request(self) -> None:
+        """헤지 대상 요청 하나 실행 → 토큰 적립"""
+        self.requests_total += 1
+        self.tokens = min(self.tokens + self.ratio, float(self.burst))
+
+    def try_spend(self) -> bool:
+        """헤지 가능하면 토큰을 쓰고 True (예산이 없으면 False)"""
+        # ratio 누적의 부동소수점 오차 허용 (0.1 × 10번이 1에 못 미치는 경우)
+        if self.tokens < 1 - 1e-9:
+            self.denied_total += 1
+            return False
+        self.tokens = max(self.tokens - 1, 0.0)
+        self.hedged_total += 1
+        return True
+
+    def record_win(self) -> None:
+        """헤지 요청이 원래 요청보다 먼저 응답함"""
+        self.wins_total += 1
+
+    def stats(self) -> dict:
+        return {
+            "requests_total": self.requests_total,
+            "hedged_total": self.hedged_total,
+            "denied_total": self.denied_total,
+            "wins_total": self.wins_total,
+            "tokens": round(self.tokens, 2),
+            "ratio": self.ratio,
+        }
@@ -0,0 +1,135 @@
+"""CLI로 넘기기 전 이미지 전처리
+
+휴대폰 사진(4~12MP)을 그대로 넘기면 CLI 업로드/처리 시간과 메모리가 커지므로
+실제 포맷을 확인하고, 긴 변 기준으로 축소한 뒤 EXIF를 제거하고 다시 인코딩합니다.
+
+CPU 작업이므로 이벤트 루프를 막지 않도록 프로세스 풀에서 실행하며,
+이 모듈은 워커 프로세스에서도 import되므로 앱 설정 등 무거운 의존성을 두지 않습니다.
+"""
+
+import io
+from dataclasses import dataclass
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# 매직 바이트 → (포맷 이름, 확장자)
+_SIGNATURES: list[tuple[bytes, int, str, str]] = [
+    (b"\x89PNG\r\n\x1a\n", 0, "png", ".png"),
+    (b"\xff\xd8\xff", 0, "jpeg", ".jpg"),
+    (b"GIF87a", 0, "gif", ".gif"),
+    (b"GIF89a", 0, "gif", ".gif"),
+    (b"WEBP", 8, "webp", ".webp"),
+]
+
+# CLI에 그대로 넘길 수 있는 포맷
+SUPPORTED_FORMATS = {"png", "jpeg", "gif", "webp"}
+
+# 이미지 디코딩 픽셀 수 상한 (압축 폭탄 방지, 약 50MP)
+MAX_PIXELS = 50_000_000
+
+
+class ImageProcessingError(ValueError):
+    """이미지로 해석할 수 없거나 지원하지 않는 포맷"""
+
+    pass
+
+
+@dataclass
+class ProcessedImage:
+    """전처리 결과"""
+
+    data: bytes
+    format: str
+    suffix: str
+    width: int
+    height: int
+    # 원본을 그대로 쓴 경우 False
+    reencoded: bool
+
+
+def sniff_format(head: bytes) -> tuple[str, str] | None:
+    """파일 앞부분으로 실제 포맷 판별 → (포맷, 확장자)"""
+    for signature, offset, name, suffix in _SIGNATURES:
+        if head[offset : offset + len(signature)] == signature:
+            if name == "webp" and head[:4] != b"RIFF":
+                continue
+            return name, suffix
+    return None
+
+
+def preprocess_image(
+    source: bytes | str,
+    max_edge: int = 1568,
+    jpeg_quality: int = 85,
+) -> ProcessedImage:
+    """이미지 축소 + EXIF 제거 + 재인코딩 (프로세스 풀 워커에서 실행)
+
+    Args:
+        source: 이미지 바이트 또는 파일 경로
+        max_edge: 긴 변 최대 픽셀
+        jpeg_quality: JPEG 재인코딩 품질
+
+    Returns:
+        ProcessedImage - 이미 작고 메타데이터가 없는 이미지는 원본 그대로 (reencoded=False)
+
+    Raises:
+        ImageProcessingError: 이미지가 아니거나 지원하지 않는 포맷
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            data = f.read()
+    else:
+        data = source
+
+    sniffed = sniff_format(data[:16])
+    Image.MAX_IMAGE_PIXELS = MAX_PIXELS
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        raise ImageProcessingError(f"Unsupported image: {e}") from e
+
+    width, height = image.size
+    has_metadata = bool(image.info.get("exif") or image.info.get("xmp"))
+    animated = getattr(image, "is_animated", False)
+
+    # 이미 충분히 작고 메타데이터도 없으면 재인코딩하지 않음 (화질 손실 방지)
+    if (
+        sniffed
+        and sniffed[0] in SUPPORTED_FORMATS
+        and (animated or (max(width, height) <= max_edge and not has_metadata))
+    ):
+        return ProcessedImage(
+            data=data,
+            format=sniffed[0],
+            suffix=sniffed[1],
+            width=width,
+            height=height,
+            reencoded=False,
+        )
+
+    # EXIF 방향 정보를 픽셀에 반영한 뒤 메타데이터 없이 다시 저장
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    output = io.BytesIO()
+    if has_alpha:
+        image.convert("RGBA").save(output, format="PNG", optimize=True)
+        fmt, suffix = "png", ".png"
+    else:
+        image.convert("RGB").save(
+            output, format="JPEG", quality=jpeg_quality, optimize=True, progressive=True
+        )
+        fmt, suffix = "jpeg", ".jpg"
+
+    return ProcessedImage(
+        data=output.getvalue(),
+        format=fmt,
+        suffix=suffix,
+        width=image.width,
+        height=image.height,
+        reencoded=True,
+    )
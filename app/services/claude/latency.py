@@ -0,0 +1,116 @@
+"""페르소나별 응답 시간 기반 적응형 타임아웃
+
+페르소나 × 입력 종류(text/image)마다 최근 CLI 실행 시간을 고정 크기 창으로 보관하고,
+높은 백분위수에 배수와 여유 시간을 더한 값을 실제 타임아웃으로 사용합니다.
+평소 8초면 끝나는 마이콜 응답이 멈췄을 때 2분 동안 슬롯을 붙잡지 않게 하기 위함입니다.
+
+- 표본이 min_samples보다 적으면 요청/설정 타임아웃 그대로 사용
+- 타임아웃 난 실행은 실제 소요 시간을 모르므로 "타임아웃보다 김"(중도 절단, inf)으로 기록
+  타임아웃 값을 그대로 표본으로 쓰면 다음 타임아웃이 그보다 커지고, 그 타임아웃이 다시
+  표본이 되어 실제 실행 시간과 무관하게 상한까지 계속 올라감
+- 백분위수 위치에 타임아웃 표본이 걸리면(타임아웃 비율 > 1 - quantile) 추정할 수 없으므로
+  상한을 사용 (실제로 느려졌다면 상한 안에서 끝난 실행이 다시 표본이 됨)
+- 요청의 timeout_seconds(없으면 설정 기본값)는 항상 상한으로 유지
+
+측정 구간: 스케줄러 슬롯과 이미지 준비가 끝난 뒤 CLI/API 실행 시작부터 종료까지.
+대기열 대기 시간(queue_wait_ms)은 포함하지 않으므로 적응형 타임아웃과 그 상한인
+timeout_seconds 모두 실행 시간에만 적용되고, 클라이언트가 실제로 기다리는 시간은
+대기열 대기 시간 + 실행 시간입니다 (클라이언트 쪽 타임아웃은 대기 시간까지 포함해 잡아야 함).
+"""
+
+import math
+from collections import deque
+
+INPUT_TEXT = "text"
+INPUT_IMAGE = "image"
+
+# 타임아웃 난 실행 (실제 소요 시간은 타임아웃보다 김)
+CENSORED = math.inf
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """정렬된 표본의 백분위수 (nearest-rank)"""
+    if not samples:
+        return 0.0
+    rank = max(math.ceil(q * len(samples)), 1)
+    return samples[min(rank, len(samples)) - 1]
+
+
+def _seconds(value: float) -> float | None:
+    """stats용 초 값 (타임아웃 표본이면 None)"""
+    return None if value == CENSORED else round(value, 2)
+
+
+class LatencyTracker:
+    """(페르소나, 입력 종류)별 최근 실행 시간 창 + 타임아웃 계산"""
+
+    def __init__(
+        self,
+        window: int = 200,
+        min_samples: int = 20,
+        quantile: float = 0.99,
+        multiplier: float = 1.5,
+        margin_seconds: float = 5,
+        min_timeout_seconds: int = 15,
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.quantile = quantile
+        self.multiplier = multiplier
+        self.margin_seconds = margin_seconds
+        self.min_timeout_seconds = min_timeout_seconds
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+
+    @staticmethod
+    def input_type(has_image: bool) -> str:
+        return INPUT_IMAGE if has_image else INPUT_TEXT
+
+    def record(
+        self, persona: str, has_image: bool, elapsed_seconds: float, timed_out: bool = False
+    ) -> None:
+        """CLI 실행 시간 기록 (끝난 실행은 소요 시간, 타임아웃은 중도 절단 표본)"""
+        key = (persona, self.input_type(has_image))
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(CENSORED if timed_out else elapsed_seconds)
+
+    def _adaptive_timeout(self, samples: list[float]) -> int | None:
+        """정렬된 표본으로 계산한 타임아웃 (표본 부족 시 None)"""
+        if len(samples) < self.min_samples:
+            return None
+        observed = percentile(samples, self.quantile)
+        if observed == CENSORED:
+            return None
+        adaptive = math.ceil(observed * self.multiplier + self.margin_seconds)
+        return max(adaptive, self.min_timeout_seconds)
+
+    def timeout_for(self, persona: str, has_image: bool, upper_bound: int) -> int:
+        """이번 요청에 적용할 타임아웃 (초, upper_bound 이하)"""
+        samples = self._samples.get((persona, self.input_type(has_image)), ())
+        adaptive = self._adaptive_timeout(sorted(samples))
+        if adaptive is None:
+            return upper_bound
+        return min(adaptive, upper_bound)
+
+    def quantile_for(self, persona: str, has_image: bool, q: float) -> float | None:
+        """최근 실행 시간의 q 백분위수 (초, 표본 부족 시 None)"""
+        samples = self._samples.get((persona, self.input_type(has_image)), ())
+        if len(samples) < self.min_samples:
+            return None
+        observed = percentile(sorted(samples), q)
+        return None if observed == CENSORED else observed
+
+    def stats(self) -> dict:
+        result: dict[str, dict] = {}
+        for (persona, input_type), samples in sorted(self._samples.items()):
+            ordered = sorted(samples)
+            result.setdefault(persona, {})[input_type] = {
+                "samples": len(ordered),
+                "timed_out": ordered.count(CENSORED),
+                "p50_seconds": _seconds(percentile(ordered, 0.5)),
+                "p95_seconds": _seconds(percentile(ordered, 0.95)),
+                "p99_seconds": _seconds(percentile(ordered, 0.99)),
+                "timeout_seconds": self._adaptive_timeout(ordered),
+            }
+        return result
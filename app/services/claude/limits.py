@@ -0,0 +1,180 @@
+"""CLI 프로세스 자원 제한
+
+CLI 하나가 폭주해도(끝없는 출력, 메모리/CPU 과다 사용) API 워커가 함께 느려지거나
+메모리가 부풀지 않도록 두 가지를 제한합니다.
+
+- 파이프 읽기: stdout은 한 줄씩 읽으면서 요청당 총 바이트 수를 세고,
+  stderr는 마지막 STDERR_TAIL_BYTES만 보관 (communicate()처럼 전체를 메모리에 모으지 않음)
+- 프로세스 자원: fork 직후 자식에서 setrlimit/nice 적용 (주소 공간, CPU 시간, 열린 파일 수, 파일 크기)
+
+제한에 걸리면 ResourceLimitError로 알리고, 서비스는 error_type=resource_limit 응답으로 변환합니다.
+"""
+
+import asyncio
+import os
+import signal
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+try:
+    import resource
+except ImportError:  # Windows 등 setrlimit이 없는 플랫폼
+    resource = None
+
+# stderr는 에러 메시지용으로 마지막 부분만 보관
+STDERR_TAIL_BYTES = 4096
+
+MB = 1024 * 1024
+
+# CPU 시간은 소프트 제한에서 SIGXCPU(원인 판별 가능), 하드 제한에서 SIGKILL
+# 둘이 같으면 SIGKILL이 먼저 와서 제한 초과인지 알 수 없으므로 하드 제한을 조금 높게 둠
+CPU_HARD_LIMIT_MARGIN_SECONDS = 5
+
+# 메모리 제한(RLIMIT_AS)에 걸린 프로세스가 stderr에 남기는 흔적 (node/V8, libc)
+_OUT_OF_MEMORY_MARKERS = (
+    "out of memory",
+    "cannot allocate memory",
+    "allocation failed",
+)
+
+
+class ResourceLimitError(Exception):
+    """CLI가 출력 크기나 자원 제한을 넘음"""
+
+    pass
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """CLI 프로세스에 적용할 자원 제한 (0이면 제한 없음)"""
+
+    address_space_mb: int = 0
+    cpu_seconds: int = 0
+    open_files: int = 0
+    file_size_mb: int = 0
+    nice: int = 0
+
+    @classmethod
+    def from_settings(cls, settings) -> "ResourceLimits":
+        return cls(
+            address_space_mb=settings.claude_rlimit_address_space_mb,
+            cpu_seconds=settings.claude_rlimit_cpu_seconds,
+            open_files=settings.claude_rlimit_open_files,
+            file_size_mb=settings.claude_rlimit_file_size_mb,
+            nice=settings.claude_nice,
+        )
+
+    def _rlimits(self) -> list[tuple[int, int, int]]:
+        """(종류, 소프트 제한, 하드 제한) 목록"""
+        if resource is None:
+            return []
+        limits = []
+        if self.address_space_mb > 0:
+            size = self.address_space_mb * MB
+            limits.append((resource.RLIMIT_AS, size, size))
+        if self.cpu_seconds > 0:
+            limits.append(
+                (
+                    resource.RLIMIT_CPU,
+                    self.cpu_seconds,
+                    self.cpu_seconds + CPU_HARD_LIMIT_MARGIN_SECONDS,
+                )
+            )
+        if self.open_files > 0:
+            limits.append((resource.RLIMIT_NOFILE, self.open_files, self.open_files))
+        if self.file_size_mb > 0:
+            size = self.file_size_mb * MB
+            limits.append((resource.RLIMIT_FSIZE, size, size))
+        return limits
+
+    def preexec_fn(self) -> Callable[[], None] | None:
+        """create_subprocess_exec(preexec_fn=...)에 넘길 함수 (적용할 제한이 없으면 None)
+
+        fork와 exec 사이 자식 프로세스에서 실행되므로 setrlimit/nice 외의 일은 하지 않습니다.
+        """
+        rlimits = self._rlimits()
+        nice = self.nice if hasattr(os, "nice") else 0
+        if not rlimits and nice <= 0:
+            return None
+
+        def apply() -> None:
+            for kind, soft, hard in rlimits:
+                _, current_hard = resource.getrlimit(kind)
+                # 현재 하드 제한보다 높게는 올릴 수 없음
+                if current_hard != resource.RLIM_INFINITY:
+                    soft = min(soft, current_hard)
+                    hard = min(hard, current_hard)
+                resource.setrlimit(kind, (soft, hard))
+            if nice > 0:
+                os.nice(nice)
+
+        return apply
+
+    def describe_exit(self, returncode: int | None, stderr: str) -> str | None:
+        """종료 코드/stderr로 어떤 제한에 걸렸는지 설명 (제한과 무관한 종료면 None)"""
+        if returncode is not None and returncode < 0:
+            sig = -returncode
+            if self.cpu_seconds > 0 and sig == getattr(signal, "SIGXCPU", None):
+                return f"Claude CLI exceeded CPU time limit ({self.cpu_seconds}s)"
+            if self.file_size_mb > 0 and sig == getattr(signal, "SIGXFSZ", None):
+                return f"Claude CLI exceeded file size limit ({self.file_size_mb}MB)"
+        if self.address_space_mb > 0 and any(
+            marker in stderr.lower() for marker in _OUT_OF_MEMORY_MARKERS
+        ):
+            return f"Claude CLI exceeded memory limit ({self.address_space_mb}MB)"
+        return None
+
+
+class StderrTail:
+    """stderr를 계속 비우면서 마지막 max_bytes만 보관 (파이프가 가득 차 CLI가 멈추지 않게)"""
+
+    def __init__(self, stream: asyncio.StreamReader | None, max_bytes: int = STDERR_TAIL_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._tail = b""
+        self._task = asyncio.create_task(self._drain(stream)) if stream is not None else None
+
+    async def _drain(self, stream: asyncio.StreamReader) -> None:
+        while True:
+            chunk = await stream.read(self.max_bytes)
+            if not chunk:
+                return
+            self.total_bytes += len(chunk)
+            self._tail = (self._tail + chunk)[-self.max_bytes:]
+
+    async def wait(self, timeout: float = 1.0) -> None:
+        """프로세스 종료 후 남은 stderr까지 읽기 (자식이 파이프를 잡고 있으면 timeout까지만)"""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    @property
+    def text(self) -> str:
+        return self._tail.decode("utf-8", errors="replace").strip()
+
+
+async def read_lines(stream: asyncio.StreamReader, max_bytes: int) -> AsyncIterator[bytes]:
+    """stdout을 한 줄씩 읽기 (줄 하나가 StreamReader limit을 넘거나 총 max_bytes를 넘으면 중단)
+
+    EOF에서 끝나며, 빈 줄도 그대로 반환합니다.
+    """
+    total = 0
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError as e:
+            # asyncio가 limit을 넘는 줄을 버리고 ValueError로 알림
+            raise ResourceLimitError(f"Claude CLI output line too long: {e}") from e
+        if not line:
+            return
+        total += len(line)
+        if max_bytes > 0 and total > max_bytes:
+            raise ResourceLimitError(f"Claude CLI output exceeded {max_bytes} bytes")
+        yield line
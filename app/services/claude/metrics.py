@@ -0,0 +1,183 @@
+"""AI 호출 지표
+
+- 페르소나별 토큰 사용량: CLI result 메시지의 usage(input/cache/output 토큰)를 누적합니다.
+  시스템 프롬프트를 고정 채널(--append-system-prompt)로 넘긴 뒤
+  prompt caching으로 입력 토큰이 얼마나 재사용되는지 확인하는 용도입니다.
+- 단계별 소요 시간: 페르소나 감지, 이미지 디코딩/저장, 프로세스 시작, 첫 출력까지,
+  전체 생성, JSON 파싱, PendingEvent 저장 등 AI 요청 경로의 단계마다 시간을 재서
+  전역 히스토그램(/health/metrics)과 요청별 Server-Timing 헤더로 내보냅니다.
+  느린 파싱이 CLI 콜드 스타트인지, 이미지 I/O인지, DB인지 구분하기 위함입니다.
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator
+
+_USAGE_FIELDS = (
+    "input_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "output_tokens",
+)
+
+
+@dataclass
+class _PersonaUsage:
+    requests: int = 0
+    input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    output_tokens: int = 0
+
+    def stats(self) -> dict:
+        # 캐시에서 읽은 토큰 포함 전체 입력
+        total_input = (
+            self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+        )
+        return {
+            "requests": self.requests,
+            "input_tokens": self.input_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
+            "output_tokens": self.output_tokens,
+            "avg_input_tokens": round(total_input / self.requests, 1) if self.requests else 0.0,
+            "cache_read_ratio": round(self.cache_read_input_tokens / total_input, 3)
+            if total_input
+            else 0.0,
+        }
+
+
+class TokenUsageMetrics:
+    """페르소나별 토큰 사용량 누적"""
+
+    def __init__(self):
+        self._by_persona: dict[str, _PersonaUsage] = {}
+
+    def record(self, persona: str, usage: dict | None) -> None:
+        """result 메시지의 usage 기록 (usage가 없으면 무시)"""
+        if not usage:
+            return
+        entry = self._by_persona.setdefault(persona, _PersonaUsage())
+        entry.requests += 1
+        for name in _USAGE_FIELDS:
+            value = usage.get(name)
+            if isinstance(value, int):
+                setattr(entry, name, getattr(entry, name) + value)
+
+    def stats(self) -> dict:
+        return {persona: usage.stats() for persona, usage in sorted(self._by_persona.items())}
+
+
+# 히스토그램 버킷 상한 (ms)
+STAGE_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+
+
+class StageHistogram:
+    """고정 버킷 히스토그램 (단계 하나)"""
+
+    def __init__(self, buckets: tuple[float, ...] = STAGE_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def quantile(self, q: float) -> float | None:
+        """백분위수 추정 (해당 버킷의 상한, +Inf 버킷이면 None)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else None
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{str(le): count for le, count in zip(self.buckets, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+
+class StageMetrics:
+    """단계 이름별 히스토그램 (프로세스 전역)"""
+
+    def __init__(self):
+        self._histograms: dict[str, StageHistogram] = {}
+
+    def observe(self, stage: str, ms: float) -> None:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            histogram = self._histograms[stage] = StageHistogram()
+        histogram.observe(ms)
+
+    def stats(self) -> dict:
+        return {stage: h.stats() for stage, h in sorted(self._histograms.items())}
+
+
+class RequestTimings:
+    """HTTP 요청 하나에서 잰 단계별 시간 (Server-Timing 헤더용)"""
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+
+    def add(self, stage: str, ms: float) -> None:
+        # 같은 단계가 여러 번이면 합산 (예: 일괄 파싱의 AI 호출 여러 번)
+        self.stages[stage] = self.stages.get(stage, 0.0) + ms
+
+    def header(self) -> str:
+        return ", ".join(f"{stage};dur={ms:.1f}" for stage, ms in self.stages.items())
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+@lru_cache
+def get_stage_metrics() -> StageMetrics:
+    """단계별 히스토그램 (프로세스당 하나)"""
+    return StageMetrics()
+
+
+def start_request_timings() -> RequestTimings:
+    """현재 요청의 단계별 시간 수집 시작 (미들웨어에서 호출)"""
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+
+def record_stage(stage: str, ms: float) -> None:
+    """단계 소요 시간 기록 (전역 히스토그램 + 진행 중인 요청의 Server-Timing)"""
+    get_stage_metrics().observe(stage, ms)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(stage, ms)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """with 블록 실행 시간을 stage로 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, (time.perf_counter() - start) * 1000)
@@ -0,0 +1,365 @@
+"""Claude CLI 워커 풀
+
+CLI 프로세스를 `--input-format stream-json` 모드로 미리 띄워두고
+요청이 오면 stdin으로 메시지를 보내 콜드 스타트 비용을 요청 경로에서 제거합니다.
+
+- min_size: 항상 대기시켜 둘 워커 수
+- max_size: 동시에 존재할 수 있는 최대 워커 수
+- max_requests_per_worker: 이 횟수만큼 처리한 워커는 교체 (기본 1)
+  1보다 크면 같은 워커가 이전 대화 맥락을 이어가므로 주의
+- 에러/타임아웃이 난 워커는 즉시 종료하고 새 워커로 보충
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator
+
+from app.services.claude.limits import (
+    ResourceLimitError,
+    ResourceLimits,
+    StderrTail,
+    read_lines,
+)
+from app.services.claude.process import kill_process_group
+from app.services.claude.stream import (
+    STREAM_LINE_LIMIT,
+    StreamResult,
+    build_user_message,
+    is_result,
+    parse_line,
+    to_result,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerError(Exception):
+    """워커 프로세스와의 통신 실패"""
+
+    pass
+
+
+class ClaudeWorker:
+    """stream-json 입력을 기다리는 CLI 프로세스 하나"""
+
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        limits: ResourceLimits | None = None,
+        max_output_bytes: int = 0,
+    ):
+        self.process = process
+        self.limits = limits or ResourceLimits()
+        self.max_output_bytes = max_output_bytes
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+        self.requests_served = 0
+        self.broken = False
+        # stderr 파이프가 가득 차지 않도록 계속 읽어서 꼬리만 보관 (에러 메시지용)
+        self._stderr = StderrTail(process.stderr)
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        """프로세스가 살아 있는지 여부"""
+        return self.process.returncode is None
+
+    @property
+    def stderr_tail(self) -> str:
+        return self._stderr.text
+
+    async def send(self, text: str) -> None:
+        """user 메시지를 stdin으로 전송"""
+        if not self.alive:
+            self.broken = True
+            raise WorkerError(f"Claude worker {self.pid} is not running")
+
+        self.requests_served += 1
+        self.last_used_at = time.monotonic()
+        try:
+            self.process.stdin.write(build_user_message(text))
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.broken = True
+            raise WorkerError(f"Failed to write to Claude worker: {e}") from e
+
+    async def messages(self) -> AsyncIterator[dict]:
+        """result 메시지가 나올 때까지 stdout 메시지를 순서대로 반환
+
+        출력이 요청당 max_output_bytes를 넘거나 자원 제한으로 죽으면 ResourceLimitError
+        """
+        async with aclosing(read_lines(self.process.stdout, self.max_output_bytes)) as lines:
+            async for line in lines:
+                message = parse_line(line)
+                if message is None:
+                    continue
+                yield message
+                if is_result(message):
+                    return
+
+        self.broken = True
+        await self.process.wait()
+        await self._stderr.wait()
+        limit = self.limits.describe_exit(self.process.returncode, self.stderr_tail)
+        if limit:
+            raise ResourceLimitError(limit)
+        raise WorkerError(
+            self.stderr_tail or f"Claude worker exited with code {self.process.returncode}"
+        )
+
+    async def read_result(self) -> StreamResult:
+        """최종 result 메시지까지 읽고 결과 반환"""
+        async for message in self.messages():
+            if is_result(message):
+                return to_result(message)
+        raise WorkerError("Claude worker finished without a result")
+
+    async def close(self, grace_seconds: float = 5.0) -> None:
+        """stdin을 닫아 정상 종료를 유도하고, 시간 내 끝나지 않으면 kill"""
+        if self.process.stdin and not self.process.stdin.is_closing():
+            self.process.stdin.close()
+
+        if self.alive:
+            try:
+                await asyncio.wait_for(self.process.wait(), grace_seconds)
+            except asyncio.TimeoutError:
+                self.kill()
+                await self.process.wait()
+
+        self._stderr.cancel()
+
+    def kill(self) -> None:
+        """CLI와 CLI가 띄운 자식 프로세스까지 종료"""
+        if self.alive:
+            kill_process_group(self.process)
+
+
+class ClaudeWorkerPool:
+    """미리 띄워둔 Claude CLI 워커를 대여해주는 풀"""
+
+    def __init__(
+        self,
+        command: list[str],
+        min_size: int = 1,
+        max_size: int = 4,
+        max_requests_per_worker: int = 1,
+        max_idle_seconds: float = 600,
+        health_check_interval_seconds: float = 30,
+        limits: ResourceLimits | None = None,
+        max_output_bytes: int = 0,
+    ):
+        self.command = command
+        self.limits = limits or ResourceLimits()
+        self.max_output_bytes = max_output_bytes
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.max_requests_per_worker = max(max_requests_per_worker, 1)
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+
+        self._idle: deque[ClaudeWorker] = deque()
+        self._busy: set[ClaudeWorker] = set()
+        self._spawning = 0
+        self._cond = asyncio.Condition()
+        self._closed = False
+        self._maintenance_task: asyncio.Task | None = None
+        self._background: set[asyncio.Task] = set()
+
+        self.spawned_total = 0
+        self.recycled_total = 0
+
+    @property
+    def size(self) -> int:
+        """현재 워커 수 (생성 중 포함)"""
+        return len(self._idle) + len(self._busy) + self._spawning
+
+    async def start(self) -> None:
+        """최소 워커를 띄우고 헬스체크 루프 시작"""
+        await self._fill()
+        self._maintenance_task = asyncio.create_task(self._maintain())
+        logger.info(
+            f"Claude worker pool started: size={self.size}, "
+            f"min={self.min_size}, max={self.max_size}"
+        )
+
+    async def _spawn(self) -> ClaudeWorker:
+        process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LINE_LIMIT,
+            start_new_session=True,
+            preexec_fn=self.limits.preexec_fn(),
+        )
+        self.spawned_total += 1
+        logger.debug(f"Spawned Claude worker pid={process.pid}")
+        return ClaudeWorker(process, self.limits, self.max_output_bytes)
+
+    async def _fill(self) -> None:
+        """최소 워커 수까지 보충"""
+        while not self._closed and self.size < self.min_size:
+            self._spawning += 1
+            worker = None
+            try:
+                worker = await self._spawn()
+            except Exception:
+                logger.exception("Failed to spawn Claude worker")
+                return
+            finally:
+                # 실패해도 자리가 났으므로 대여를 기다리는 쪽을 깨움
+                async with self._cond:
+                    self._spawning -= 1
+                    if worker is not None:
+                        self._idle.append(worker)
+                    self._cond.notify()
+
+    def _track(self, coro) -> None:
+        """백그라운드 작업 참조 유지 (GC 방지)"""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _retire(self, worker: ClaudeWorker, refill: bool = True) -> None:
+        """워커 종료 후 필요하면 보충"""
+        if worker.broken:
+            worker.kill()
+        await worker.close()
+        logger.debug(
+            f"Retired Claude worker pid={worker.pid}, "
+            f"served={worker.requests_served}, broken={worker.broken}"
+        )
+        if refill:
+            await self._fill()
+
+    async def _acquire(self) -> ClaudeWorker:
+        async with self._cond:
+            while True:
+                if self._closed:
+                    raise WorkerError("Claude worker pool is shut down")
+
+                while self._idle:
+                    worker = self._idle.popleft()
+                    if worker.alive:
+                        self._busy.add(worker)
+                        return worker
+                    self.recycled_total += 1
+                    self._track(self._retire(worker, refill=False))
+
+                if self.size < self.max_size:
+                    self._spawning += 1
+                    break
+
+                await self._cond.wait()
+
+        # 빈 워커가 없고 여유가 있으면 새로 띄움 (락 밖에서)
+        worker = None
+        try:
+            worker = await self._spawn()
+        finally:
+            async with self._cond:
+                self._spawning -= 1
+                if worker is not None:
+                    self._busy.add(worker)
+                # 생성에 실패하면 예약했던 자리가 비므로 기다리는 대여자를 깨움
+                self._cond.notify()
+        return worker
+
+    async def _release(self, worker: ClaudeWorker) -> None:
+        self._busy.discard(worker)
+        recycle = (
+            self._closed
+            or worker.broken
+            or not worker.alive
+            or worker.requests_served >= self.max_requests_per_worker
+        )
+        if recycle:
+            self.recycled_total += 1
+            self._track(self._retire(worker, refill=not self._closed))
+
+        async with self._cond:
+            if not recycle:
+                self._idle.append(worker)
+            self._cond.notify_all()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[ClaudeWorker]:
+        """워커 대여 (블록을 벗어나면 반납 또는 교체)
+
+        블록 안에서 예외/취소가 발생하면 워커는 broken으로 표시되어 종료됩니다.
+        """
+        worker = await self._acquire()
+        try:
+            yield worker
+        except BaseException:
+            worker.broken = True
+            raise
+        finally:
+            await self._release(worker)
+
+    def _check_health(self) -> None:
+        """죽었거나 너무 오래 놀고 있는 대기 워커 정리"""
+        now = time.monotonic()
+        for worker in list(self._idle):
+            if not worker.alive or now - worker.last_used_at > self.max_idle_seconds:
+                self._idle.remove(worker)
+                self.recycled_total += 1
+                self._track(self._retire(worker, refill=False))
+
+    async def _maintain(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.health_check_interval_seconds)
+            try:
+                self._check_health()
+                await self._fill()
+            except Exception:
+                logger.exception("Claude worker pool health check failed")
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """새 대여를 막고 진행 중인 요청을 기다린 뒤 모든 워커 종료"""
+        self._closed = True
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+
+        async with self._cond:
+            self._cond.notify_all()
+            try:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: not self._busy), timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Claude worker pool drain timed out, "
+                    f"killing {len(self._busy)} busy workers"
+                )
+
+        # drain 이후에도 남은 워커는 강제 종료
+        for worker in self._busy:
+            worker.broken = True
+        workers = list(self._idle) + list(self._busy)
+        self._idle.clear()
+        self._busy.clear()
+        await asyncio.gather(
+            *(self._retire(w, refill=False) for w in workers),
+            *self._background,
+            return_exceptions=True,
+        )
+        logger.info(f"Claude worker pool shut down ({len(workers)} workers closed)")
+
+    def stats(self) -> dict:
+        """풀 상태 (헬스 엔드포인트용)"""
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "busy": len(self._busy),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "spawned_total": self.spawned_total,
+            "recycled_total": self.recycled_total,
+        }
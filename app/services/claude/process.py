@@ -0,0 +1,71 @@
+"""CLI 프로세스 그룹 종료
+
+CLI는 start_new_session=True로 띄워 자기 프로세스 그룹의 리더가 되므로
+CLI가 띄운 자식 프로세스(node 워커, 도구 실행 등)까지 그룹 단위로 한 번에 종료할 수 있습니다.
+요청이 취소되면(클라이언트 연결 끊김 등) SIGTERM으로 정리할 기회를 주고,
+grace_seconds 안에 끝나지 않으면 SIGKILL로 그룹 전체를 종료한 뒤 회수(wait)합니다.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+from contextlib import suppress
+
+logger = logging.getLogger(__name__)
+
+
+def _is_group_leader(process: asyncio.subprocess.Process) -> bool:
+    """자기 프로세스 그룹의 리더인지 (회수 전에만 pid가 유효하므로 실행 중일 때 확인)"""
+    if process.returncode is not None:
+        return False
+    try:
+        return os.getpgid(process.pid) == process.pid
+    except OSError:
+        return False
+
+
+def _send(process: asyncio.subprocess.Process, sig: int, group: bool) -> None:
+    """그룹 리더면 그룹 전체에, 아니면 프로세스에만 시그널 전송 (이미 없으면 무시)"""
+    if group:
+        with suppress(ProcessLookupError):
+            os.killpg(process.pid, sig)
+        return
+    if process.returncode is None:
+        with suppress(ProcessLookupError):
+            if sig == signal.SIGKILL:
+                process.kill()
+            else:
+                process.terminate()
+
+
+def kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """프로세스 그룹 전체를 바로 SIGKILL (회수는 호출자가 wait)"""
+    _send(process, signal.SIGKILL, _is_group_leader(process))
+
+
+async def terminate_process_group(
+    process: asyncio.subprocess.Process, grace_seconds: float
+) -> None:
+    """SIGTERM → grace_seconds 대기 → SIGKILL 순서로 프로세스 그룹 종료 후 회수
+
+    대기 중에 다시 취소되어도 SIGKILL까지는 보내고 취소를 전파합니다.
+    """
+    if process.returncode is not None:
+        return
+
+    group = _is_group_leader(process)
+    _send(process, signal.SIGTERM, group)
+    try:
+        await asyncio.wait_for(process.wait(), grace_seconds)
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Claude CLI pid={process.pid} ignored SIGTERM for {grace_seconds}s, killing"
+        )
+    except asyncio.CancelledError:
+        _send(process, signal.SIGKILL, group)
+        raise
+
+    # 리더가 먼저 끝나도 그룹에 남은 자식까지 정리
+    _send(process, signal.SIGKILL, group)
+    await process.wait()
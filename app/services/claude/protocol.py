@@ -1,7 +1,22 @@
 """Claude 서비스 인터페이스 정의"""
 
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 from dataclasses import dataclass, field
+from enum import Enum
+
+from app.services.claude.personas import PersonaType
+from app.services.claude.staging import StagedImage
+
+
+class AIErrorType(str, Enum):
+    """실패한 AI 응답의 종류 (라우터가 HTTP 상태 코드를 고르는 기준)"""
+
+    NO_TRIGGER = "no_trigger"  # 호출어 없음
+    INVALID_IMAGE = "invalid_image"  # 이미지 디코딩/전처리 실패
+    TIMEOUT = "timeout"  # CLI 타임아웃
+    SERVICE_UNAVAILABLE = "service_unavailable"  # CLI 없음, 서킷 열림
+    RESOURCE_LIMIT = "resource_limit"  # CLI 출력 크기/자원 제한(rlimit) 초과
+    CLI_ERROR = "cli_error"  # 그 외 CLI 실행 실패
 
 
 @dataclass
@@ -12,10 +27,30 @@ class ChatResponse:
     elapsed_ms: int
     success: bool
     error: str | None = None
+    error_type: AIErrorType | None = None
     persona_name: str | None = None
     # 캘린더 AI 응답용
     parsed_events: list[dict] | None = None
     ai_message: str | None = None
+    # 스케줄러 대기열에서 기다린 시간
+    queue_wait_ms: int = 0
+    # 응답 캐시에서 꺼낸 결과 여부 (CLI 실행 안 함)
+    cache_hit: bool = False
+    # 타임아웃/출력 크기 상한으로 중간에 끊긴 부분 응답 (success=True, 타임아웃이면 error_type=TIMEOUT)
+    truncated: bool = False
+
+
+@dataclass
+class ChatChunk:
+    """스트리밍 응답 조각
+
+    text가 있으면 중간 텍스트, event가 있으면 스트리밍 중 완성된 달력이 일정 하나,
+    response가 있으면 마지막 조각(성공/실패 결과)
+    """
+
+    text: str = ""
+    event: dict | None = None
+    response: ChatResponse | None = None
 
 
 class AIServiceProtocol(Protocol):
@@ -26,6 +61,8 @@ class AIServiceProtocol(Protocol):
         prompt: str,
         timeout_seconds: int | None = None,
         image_base64: str | None = None,
+        user_id: str | None = None,
+        image: StagedImage | None = None,
     ) -> ChatResponse:
         """
         AI 채팅 요청
@@ -34,8 +71,50 @@ class AIServiceProtocol(Protocol):
             prompt: 사용자 프롬프트
             timeout_seconds: 타임아웃 (초)
             image_base64: Base64 인코딩된 이미지 (선택)
+            user_id: 요청한 사용자 UID (공정 큐 키)
+            image: 이미 임시 파일로 저장된 이미지 (선택, 멀티파트 업로드용)
 
         Returns:
             ChatResponse: 응답 데이터
         """
         ...
+
+    def chat_stream(
+        self,
+        prompt: str,
+        timeout_seconds: int | None = None,
+        image_base64: str | None = None,
+        user_id: str | None = None,
+        image: StagedImage | None = None,
+    ) -> AsyncIterator[ChatChunk]:
+        """
+        AI 스트리밍 채팅 요청
+
+        Args:
+            chat()과 동일
+
+        Yields:
+            ChatChunk: 텍스트 조각들, 마지막에 response가 담긴 조각 하나
+        """
+        ...
+
+    def lane_concurrency(self, persona_type: PersonaType) -> int:
+        """
+        페르소나가 실행될 레인의 동시 실행 예산
+
+        Args:
+            persona_type: 페르소나
+
+        Returns:
+            int: 해당 레인에서 동시에 실행될 수 있는 요청 수
+        """
+        ...
+
+    def get_stats(self) -> dict:
+        """
+        AI 백엔드 상태 (헬스 엔드포인트용)
+
+        Returns:
+            dict: 워커 풀 등 내부 구성요소 상태
+        """
+        ...
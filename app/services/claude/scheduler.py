@@ -0,0 +1,293 @@
+"""AI 요청 스케줄러 - 레인별 동시 실행 제한 + 사용자별 공정 큐
+
+요청은 우선순위 레인(예: calendar, chat)으로 나뉘고, 레인마다 동시 실행 예산과 대기열이 따로 있습니다.
+자리가 없으면 레인 안에서 사용자(uid)별 큐에 대기시키고,
+자리가 나면 대기 중인 사용자들을 라운드로빈으로 돌면서 하나씩 깨우므로
+한 사용자가 요청을 많이 보내도 다른 가족의 요청이 밀리지 않습니다.
+
+빌려 쓰기: borrows_from에 지정한 레인이 놀고 있으면(실행 여유가 있고 대기 요청이 없으면)
+그 레인의 자리를 빌려 실행합니다. 예: 달력이는 잡담 레인의 빈 자리를 쓸 수 있지만 반대는 안 됨.
+빌린 자리가 비면 빌려준 레인의 대기 요청이 먼저 받고, 없을 때만 다시 빌려줍니다.
+
+전체 동시 실행 수는 레인 예산의 합계이며, 서비스는 설정의 전체 동시 실행 수를
+split_concurrency()로 레인 비율대로 나눠 레인 예산을 정합니다.
+레인을 지정하지 않으면 max_concurrency/max_queue_depth를 가진 기본 레인 하나로 동작합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from app.exceptions import TooManyRequestsError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANE = "default"
+
+
+def split_concurrency(total: int, shares: dict[str, float]) -> dict[str, int]:
+    """전체 동시 실행 수를 레인 비율대로 나눔
+
+    레인마다 최소 1자리이고 합계는 total (레인 수보다 작으면 레인 수).
+    나누어떨어지지 않는 자리는 나머지가 큰 레인부터(같으면 비율이 큰 레인) 하나씩 줌.
+    """
+    if not shares:
+        return {}
+    total = max(total, len(shares))
+    weights = {name: max(share, 0.0) for name, share in shares.items()}
+    if not any(weights.values()):
+        weights = dict.fromkeys(shares, 1.0)
+    weight = sum(weights.values())
+    ideal = {name: total * w / weight for name, w in weights.items()}
+    budgets = {name: max(int(value), 1) for name, value in ideal.items()}
+
+    # 최소 1자리 때문에 넘친 만큼은 예산이 큰 레인부터 회수
+    while sum(budgets.values()) > total:
+        name = max(budgets, key=lambda n: (budgets[n], -ideal[n]))
+        budgets[name] -= 1
+
+    by_remainder = sorted(
+        shares, key=lambda n: (ideal[n] - budgets[n], weights[n]), reverse=True
+    )
+    for name in by_remainder[: total - sum(budgets.values())]:
+        budgets[name] += 1
+    return budgets
+
+
+@dataclass
+class Lane:
+    """우선순위 레인 하나 (자기 동시 실행 예산과 대기열)"""
+
+    name: str
+    max_concurrency: int
+    max_queue_depth: int
+    # 놀고 있을 때 자리를 빌려 쓸 수 있는 레인 (앞쪽 우선)
+    borrows_from: tuple[str, ...] = ()
+
+    # 이 레인 예산 중 사용 중인 자리 (빌려준 자리 포함)
+    active: int = 0
+    queued: int = 0
+    # uid → 대기 중인 Future 목록 (OrderedDict 순서 = 라운드로빈 순서)
+    queues: OrderedDict[str, deque[asyncio.Future]] = field(default_factory=OrderedDict)
+    # 다른 레인에서 빌려 쓰고 있는 자리 수 (빌려준 레인 → 수)
+    borrowed: Counter[str] = field(default_factory=Counter)
+
+    rejected_total: int = 0
+    completed_total: int = 0
+    borrowed_total: int = 0
+
+    @property
+    def idle(self) -> bool:
+        """바로 실행할 자리가 있고 기다리는 요청이 없음"""
+        return self.active < self.max_concurrency and self.queued == 0
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "waiting_users": len(self.queues),
+            "max_concurrency": self.max_concurrency,
+            "max_queue_depth": self.max_queue_depth,
+            "borrowing": sum(self.borrowed.values()),
+            "rejected_total": self.rejected_total,
+            "completed_total": self.completed_total,
+            "borrowed_total": self.borrowed_total,
+        }
+
+
+class FairScheduler:
+    """레인별 사용자 라운드로빈 큐를 가진 동시성 제한기"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        max_queue_depth: int = 20,
+        retry_after_seconds: int = 5,
+        lanes: list[Lane] | None = None,
+    ):
+        if not lanes:
+            lanes = [Lane(DEFAULT_LANE, max_concurrency, max_queue_depth)]
+        for lane in lanes:
+            lane.max_concurrency = max(lane.max_concurrency, 1)
+        self.lanes: dict[str, Lane] = {lane.name: lane for lane in lanes}
+        self.default_lane = lanes[0].name
+        self.retry_after_seconds = retry_after_seconds
+
+        # 빌려주는 레인 → 빌려 가는 레인 목록
+        self._lenders: dict[str, list[Lane]] = {}
+        for lane in lanes:
+            for lender in lane.borrows_from:
+                if lender not in self.lanes or lender == lane.name:
+                    raise ValueError(f"Lane {lane.name!r} cannot borrow from {lender!r}")
+                self._lenders.setdefault(lender, []).append(lane)
+
+    @property
+    def max_concurrency(self) -> int:
+        return sum(lane.max_concurrency for lane in self.lanes.values())
+
+    @property
+    def max_queue_depth(self) -> int:
+        return sum(lane.max_queue_depth for lane in self.lanes.values())
+
+    @property
+    def active(self) -> int:
+        return sum(lane.active for lane in self.lanes.values())
+
+    @property
+    def queued(self) -> int:
+        return sum(lane.queued for lane in self.lanes.values())
+
+    def _lane(self, name: str | None) -> Lane:
+        """레인 이름 → Lane (없는 이름은 기본 레인)"""
+        return self.lanes.get(name or self.default_lane) or self.lanes[self.default_lane]
+
+    def lane_concurrency(self, name: str | None) -> int:
+        """레인의 동시 실행 예산 (없는 이름은 기본 레인)"""
+        return self._lane(name).max_concurrency
+
+    async def acquire(self, key: str, lane: str | None = None) -> int:
+        """실행 슬롯 획득 (대기한 시간 ms 반환)
+
+        Raises:
+            TooManyRequestsError: 레인 대기열이 가득 찬 경우
+        """
+        own = self._lane(lane)
+        if own.idle:
+            own.active += 1
+            return 0
+
+        for lender_name in own.borrows_from:
+            lender = self.lanes[lender_name]
+            if lender.idle:
+                lender.active += 1
+                own.borrowed[lender_name] += 1
+                own.borrowed_total += 1
+                return 0
+
+        if own.queued >= own.max_queue_depth:
+            own.rejected_total += 1
+            logger.warning(
+                f"AI queue full (lane={own.name}, active={own.active}, queued={own.queued}), "
+                f"rejecting request from {key}"
+            )
+            raise TooManyRequestsError(
+                "AI 요청이 많아 잠시 후 다시 시도해주세요",
+                retry_after=self.retry_after_seconds,
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        own.queues.setdefault(key, deque()).append(future)
+        own.queued += 1
+        start = time.monotonic()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 넘겨받은 직후 취소됨 → 다음 대기자에게 양보
+                self.release(own.name)
+            else:
+                self._discard(own, key, future)
+            raise
+
+        return int((time.monotonic() - start) * 1000)
+
+    def try_acquire(self, lane: str | None = None) -> bool:
+        """기다리지 않고 바로 잡을 수 있는 슬롯이 있으면 잡고 True (헤지 요청용, release로 반납)"""
+        own = self._lane(lane)
+        if own.idle:
+            own.active += 1
+            return True
+        for lender_name in own.borrows_from:
+            lender = self.lanes[lender_name]
+            if lender.idle:
+                lender.active += 1
+                own.borrowed[lender_name] += 1
+                own.borrowed_total += 1
+                return True
+        return False
+
+    def _discard(self, lane: Lane, key: str, future: asyncio.Future) -> None:
+        """취소된 대기 요청을 큐에서 제거"""
+        queue = lane.queues.get(key)
+        if queue is None or future not in queue:
+            return
+        queue.remove(future)
+        lane.queued -= 1
+        if not queue:
+            del lane.queues[key]
+
+    @staticmethod
+    def _next_waiter(lane: Lane) -> asyncio.Future | None:
+        """다음 사용자 차례의 대기 요청 꺼내기 (이미 끝난 Future는 건너뜀)"""
+        while lane.queues:
+            key, queue = next(iter(lane.queues.items()))
+            future = queue.popleft()
+            lane.queued -= 1
+            if queue:
+                # 이 사용자는 맨 뒤로 (라운드로빈)
+                lane.queues.move_to_end(key)
+            else:
+                del lane.queues[key]
+            if not future.done():
+                return future
+        return None
+
+    def release(self, lane: str | None = None) -> None:
+        """슬롯 반납 (lane은 acquire 때와 같은 레인)
+
+        빌린 자리가 있으면 그것부터 돌려줍니다 (어느 요청이 끝나든 자리 수는 같음).
+        """
+        own = self._lane(lane)
+        own.completed_total += 1
+        for lender_name, count in own.borrowed.items():
+            if count:
+                own.borrowed[lender_name] -= 1
+                self._free_slot(self.lanes[lender_name])
+                return
+        self._free_slot(own)
+
+    def _free_slot(self, lane: Lane) -> None:
+        """lane 예산의 자리 하나가 빔 → 자기 대기자, 없으면 빌려 가는 레인의 대기자에게 넘김"""
+        future = self._next_waiter(lane)
+        if future is not None:
+            # active 수는 그대로 유지한 채 슬롯을 넘김
+            future.set_result(None)
+            return
+
+        for borrower in self._lenders.get(lane.name, []):
+            future = self._next_waiter(borrower)
+            if future is not None:
+                borrower.borrowed[lane.name] += 1
+                borrower.borrowed_total += 1
+                future.set_result(None)
+                return
+
+        lane.active -= 1
+
+    @asynccontextmanager
+    async def slot(self, key: str, lane: str | None = None) -> AsyncIterator[int]:
+        """슬롯을 잡고 있는 동안 실행 (대기 시간 ms를 yield)"""
+        wait_ms = await self.acquire(key, lane)
+        try:
+            yield wait_ms
+        finally:
+            self.release(lane)
+
+    def stats(self) -> dict:
+        """스케줄러 상태 (헬스 엔드포인트용, 전체 합계 + 레인별 상세)"""
+        lanes = {name: lane.stats() for name, lane in self.lanes.items()}
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "waiting_users": sum(stats["waiting_users"] for stats in lanes.values()),
+            "max_concurrency": self.max_concurrency,
+            "max_queue_depth": self.max_queue_depth,
+            "rejected_total": sum(stats["rejected_total"] for stats in lanes.values()),
+            "completed_total": sum(stats["completed_total"] for stats in lanes.values()),
+            "lanes": lanes,
+        }
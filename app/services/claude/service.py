@@ -1,17 +1,45 @@
 """Claude Code CLI 서비스 구현"""
 
 import asyncio
-import base64
-import json
-import os
-import re
-import tempfile
+import dataclasses
+import functools
+import hashlib
+import math
+import multiprocessing
 import time
 import logging
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
 
 from app.config import get_settings
-from app.services.claude.protocol import ChatResponse
+from app.services.claude.cache import ResponseCache, make_cache_key
+from app.services.claude.calendar_json import CalendarJSONExtractor, parse_calendar_output
+from app.services.claude.hedge import HedgeBudget
+from app.services.claude.imaging import preprocess_image
+from app.services.claude.latency import LatencyTracker
+from app.services.claude.limits import ResourceLimitError, ResourceLimits, StderrTail, read_lines
+from app.services.claude.metrics import TokenUsageMetrics, record_stage, timed_stage
+from app.services.claude.pool import ClaudeWorkerPool, WorkerError
+from app.services.claude.process import terminate_process_group
+from app.services.claude.circuit import CircuitBreaker, CircuitState
+from app.services.claude.protocol import AIErrorType, ChatChunk, ChatResponse
+from app.services.claude.scheduler import FairScheduler, Lane, split_concurrency
+from app.services.claude.singleflight import SingleFlight
+from app.services.claude.staging import (
+    StagedImage,
+    decode_image_base64,
+    get_image_stager,
+)
+from app.services.claude.stream import (
+    STREAM_LINE_LIMIT,
+    StreamResult,
+    is_result,
+    parse_line,
+    text_delta,
+    to_result,
+)
 from app.services.claude.personas import (
     PersonaType,
     detect_persona,
@@ -21,67 +49,536 @@ from app.services.claude.personas import (
 
 logger = logging.getLogger(__name__)
 
+# user_id 없이 호출된 요청이 공유하는 큐 키
+ANONYMOUS_USER = "anonymous"
+
+# 서킷 브레이커가 실패로 세는 에러 (요청 자체의 문제는 제외)
+CIRCUIT_FAILURES = (
+    AIErrorType.TIMEOUT,
+    AIErrorType.SERVICE_UNAVAILABLE,
+    AIErrorType.CLI_ERROR,
+    AIErrorType.RESOURCE_LIMIT,
+)
+
+
+@dataclass
+class CLIResult:
+    """CLI 실행 결과 (실행 방식과 무관한 공통 형태)"""
+
+    output: str
+    error: str | None = None
+    timed_out: bool = False
+    usage: dict | None = None  # result 메시지의 토큰 사용량
+    truncated: bool = False  # 출력 길이 상한(max_tokens 등)에서 끊긴 결과
+    limit_exceeded: bool = False  # 출력 크기/자원 제한(rlimit)에 걸려 중단됨 (error에 사유)
+
 
 class ClaudeService:
     """Claude Code CLI 서비스 (AIServiceProtocol 구현)"""
 
+    backend_name = "cli"
+
     def __init__(self):
         self.settings = get_settings()
+        self.scheduler = FairScheduler(
+            max_concurrency=self.settings.claude_max_concurrency,
+            max_queue_depth=self.settings.claude_max_queue_depth,
+            retry_after_seconds=self.settings.claude_queue_retry_after_seconds,
+            lanes=self._build_lanes(),
+        )
+        self.cache = ResponseCache(
+            ttl_by_persona=self.settings.claude_cache_ttl_seconds,
+            max_entries=self.settings.claude_cache_max_entries,
+            disk_dir=self.settings.claude_cache_dir,
+        )
+        self.inflight = SingleFlight()
+        self.latency = LatencyTracker(
+            window=self.settings.claude_adaptive_timeout_window,
+            min_samples=self.settings.claude_adaptive_timeout_min_samples,
+            quantile=self.settings.claude_adaptive_timeout_percentile,
+            multiplier=self.settings.claude_adaptive_timeout_multiplier,
+            margin_seconds=self.settings.claude_adaptive_timeout_margin_seconds,
+            min_timeout_seconds=self.settings.claude_adaptive_timeout_min_seconds,
+        )
+        # 헤지 대상 페르소나의 첫 출력까지 걸린 시간 (헤지 시점 계산용)
+        self.hedge: HedgeBudget | None = None
+        self.first_output = LatencyTracker(
+            window=self.settings.claude_adaptive_timeout_window,
+            min_samples=self.settings.claude_hedge_min_samples,
+        )
+        if self.settings.claude_hedge_enabled:
+            self.hedge = HedgeBudget(
+                ratio=self.settings.claude_hedge_budget_ratio,
+                burst=self.settings.claude_hedge_budget_burst,
+            )
+        self.stager = get_image_stager()
+        self.image_executor: ProcessPoolExecutor | None = None
+        if self.settings.claude_image_preprocess_enabled:
+            # 워커는 첫 작업 제출 시 생성됨 (spawn: 이벤트 루프/스레드 상태를 복제하지 않음)
+            self.image_executor = ProcessPoolExecutor(
+                max_workers=self.settings.claude_image_preprocess_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self.image_stats = {
+            "preprocessed_total": 0,
+            "reencoded_total": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+        }
+        self.usage = TokenUsageMetrics()
+        # 실행 중에 취소된 요청 수 (클라이언트 연결 끊김 등으로 CLI를 중간에 종료)
+        self.cancelled_total = 0
+        # CLI 프로세스 자원 제한 (단발 실행과 워커 풀 공통)과 제한에 걸린 요청 수
+        self.limits = ResourceLimits.from_settings(self.settings)
+        self.limit_exceeded_total = 0
+        self.circuit: CircuitBreaker | None = None
+        if self.settings.claude_circuit_enabled:
+            self.circuit = CircuitBreaker(
+                failure_threshold=self.settings.claude_circuit_failure_threshold,
+                reset_seconds=self.settings.claude_circuit_reset_seconds,
+            )
+        # 페르소나마다 시스템 프롬프트가 고정된 워커 풀 (첫 요청 전 예열은 지정한 페르소나만)
+        self.pools: dict[PersonaType, ClaudeWorkerPool] = {}
+        if self.settings.claude_pool_enabled:
+            prewarm = set(self.settings.claude_pool_prewarm_personas)
+            for persona_type in PersonaType:
+                self.pools[persona_type] = ClaudeWorkerPool(
+                    command=[
+                        self.settings.claude_cli_path,
+                        "--dangerously-skip-permissions",
+                        "-p",
+                        "--input-format",
+                        "stream-json",
+                        "--output-format",
+                        "stream-json",
+                        "--verbose",
+                        "--include-partial-messages",
+                        "--append-system-prompt",
+                        get_system_prompt(persona_type),
+                    ],
+                    min_size=self.settings.claude_pool_min_size
+                    if persona_type.value in prewarm
+                    else 0,
+                    max_size=self.settings.claude_pool_max_size,
+                    max_requests_per_worker=self.settings.claude_pool_max_requests_per_worker,
+                    max_idle_seconds=self.settings.claude_pool_max_idle_seconds,
+                    health_check_interval_seconds=self.settings.claude_pool_health_check_interval_seconds,
+                    limits=self.limits,
+                    max_output_bytes=self.settings.claude_max_stdout_bytes,
+                )
 
-    def _build_prompt(
-        self, user_prompt: str, persona_type: PersonaType, image_path: str | None = None
-    ) -> str:
-        """사용자 프롬프트에 페르소나 시스템 지시사항 추가"""
-        system_prompt = get_system_prompt(persona_type)
+    def _build_lanes(self) -> list[Lane]:
+        """설정의 우선순위 레인 (기본 레인이 맨 앞, 설정이 비어 있으면 레인 하나)
 
+        레인 예산은 claude_max_concurrency를 claude_lane_shares 비율로 나눈 값
+        """
+        settings = self.settings
+        budgets = split_concurrency(settings.claude_max_concurrency, settings.claude_lane_shares)
+        names = sorted(budgets, key=lambda name: name != settings.claude_lane_default)
+        return [
+            Lane(
+                name=name,
+                max_concurrency=budgets[name],
+                max_queue_depth=settings.claude_lane_queue_depth.get(
+                    name, settings.claude_max_queue_depth
+                ),
+                borrows_from=tuple(settings.claude_lane_borrows.get(name, ())),
+            )
+            for name in names
+        ]
+
+    def _lane_for(self, persona_type: PersonaType) -> str:
+        """페르소나가 실행될 스케줄러 레인"""
+        return self.settings.claude_lane_by_persona.get(
+            persona_type.value, self.settings.claude_lane_default
+        )
+
+    def lane_concurrency(self, persona_type: PersonaType) -> int:
+        """페르소나가 실행될 레인의 동시 실행 예산"""
+        return self.scheduler.lane_concurrency(self._lane_for(persona_type))
+
+    async def start(self) -> None:
+        """앱 시작 시 호출 - 워커 풀 예열"""
+        for pool in self.pools.values():
+            await pool.start()
+
+    async def shutdown(self) -> None:
+        """앱 종료 시 호출 - 워커 풀 및 이미지 전처리 프로세스 정리"""
+        if self.pools:
+            await asyncio.gather(
+                *(
+                    pool.shutdown(timeout=self.settings.claude_pool_drain_timeout_seconds)
+                    for pool in self.pools.values()
+                )
+            )
+        if self.image_executor:
+            self.image_executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict:
+        """AI 백엔드 상태 (헬스 엔드포인트용)"""
+        return {
+            "backend": self.backend_name,
+            "scheduler": self.scheduler.stats(),
+            "cache": self.cache.stats(),
+            "inflight": self.inflight.stats(),
+            "latency": self.latency.stats(),
+            "circuit": self.circuit.stats() if self.circuit else None,
+            "hedge": self.hedge.stats() if self.hedge else None,
+            "staging": {**self.stager.stats(), **self.image_stats},
+            "pool": self._pool_stats(),
+            "usage": self.usage.stats(),
+            "cancelled_total": self.cancelled_total,
+            "limit_exceeded_total": self.limit_exceeded_total,
+        }
+
+    def _pool_stats(self) -> dict | None:
+        """페르소나별 풀 상태 합계 + 페르소나별 상세"""
+        if not self.pools:
+            return None
+        personas = {
+            persona_type.value: pool.stats() for persona_type, pool in self.pools.items()
+        }
+        totals = {
+            key: sum(stats[key] for stats in personas.values())
+            for key in ("size", "idle", "busy", "spawned_total", "recycled_total")
+        }
+        return {**totals, "personas": personas}
+
+    def _build_prompt(self, user_prompt: str, image_path: str | None = None) -> str:
+        """CLI에 보낼 사용자 메시지 (페르소나 지시사항은 --append-system-prompt로 따로 전달)"""
         # 이미지가 있으면 프롬프트에 경로 추가
         if image_path:
-            return f"{user_prompt}\n\n이미지: {image_path}\n\n{system_prompt}"
-        return f"{user_prompt}\n\n{system_prompt}"
+            return f"{user_prompt}\n\n이미지: {image_path}"
+        return user_prompt
+
+    async def _prepare_image(
+        self, image_source: bytes | StagedImage | None
+    ) -> tuple[StagedImage | None, StagedImage | None]:
+        """CLI에 넘길 이미지 준비 → (사용할 이미지, 직접 만들어서 정리해야 할 이미지)
+
+        전처리가 켜져 있으면 프로세스 풀에서 축소/재인코딩한 뒤 실제 포맷의 확장자로 저장
+        """
+        if image_source is None:
+            return None, None
+
+        if self.image_executor is None:
+            if isinstance(image_source, StagedImage):
+                return image_source, None
+            staged = self.stager.stage_bytes(image_source)
+            return staged, staged
+
+        if isinstance(image_source, StagedImage):
+            source, size_in = image_source.path, image_source.size
+        else:
+            source, size_in = image_source, len(image_source)
+
+        with timed_stage("image_preprocess"):
+            processed = await asyncio.get_running_loop().run_in_executor(
+                self.image_executor,
+                functools.partial(
+                    preprocess_image,
+                    source,
+                    max_edge=self.settings.claude_image_max_edge,
+                    jpeg_quality=self.settings.claude_image_jpeg_quality,
+                ),
+            )
+        self.image_stats["preprocessed_total"] += 1
+        self.image_stats["bytes_in"] += size_in
+        self.image_stats["bytes_out"] += len(processed.data)
+        if processed.reencoded:
+            self.image_stats["reencoded_total"] += 1
+            logger.info(
+                f"Preprocessed image: {size_in} -> {len(processed.data)} bytes, "
+                f"{processed.width}x{processed.height} {processed.format}"
+            )
+
+        # 원본 그대로이고 확장자도 맞으면 이미 저장된 파일 재사용
+        if (
+            isinstance(image_source, StagedImage)
+            and not processed.reencoded
+            and image_source.path.endswith(processed.suffix)
+        ):
+            return image_source, None
+
+        staged = self.stager.stage_bytes(processed.data, suffix=processed.suffix)
+        return staged, staged
+
+    def _parse_calendar_response(self, output: str) -> tuple[list[dict], str | None]:
+        """달력이 페르소나 응답에서 JSON 파싱 (```json 펜스 또는 순수 JSON)"""
+        with timed_stage("json_parse"):
+            events, message = parse_calendar_output(output)
+        if not events and message is None:
+            logger.warning("Failed to parse calendar response")
+        return events, message
 
-    def _save_temp_image(self, image_base64: str) -> str:
-        """Base64 이미지를 임시 파일로 저장하고 경로 반환"""
-        # data:image/png;base64, 접두어 제거
-        if "," in image_base64:
-            image_base64 = image_base64.split(",", 1)[1]
+    def _subprocess_command(self, message: str, persona_type: PersonaType) -> list[str]:
+        """단발성 CLI 실행 명령 (stream-json 출력)
 
-        image_data = base64.b64decode(image_base64)
+        페르소나 프롬프트는 매 요청 같은 시스템 프롬프트로 넘겨 프롬프트 캐시가 재사용되게 함
+        """
+        return [
+            self.settings.claude_cli_path,
+            "--dangerously-skip-permissions",
+            "-p",
+            message,
+            "--append-system-prompt",
+            get_system_prompt(persona_type),
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--include-partial-messages",
+        ]
+
+    async def _subprocess_messages(
+        self, message: str, persona_type: PersonaType
+    ) -> AsyncIterator[dict]:
+        """CLI 프로세스를 새로 띄워 stdout 메시지를 도착하는 대로 반환"""
+        with timed_stage("spawn"):
+            process = await asyncio.create_subprocess_exec(
+                *self._subprocess_command(message, persona_type),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LINE_LIMIT,
+                # 자식 프로세스까지 그룹으로 종료할 수 있게 새 세션(프로세스 그룹)으로 실행
+                start_new_session=True,
+                preexec_fn=self.limits.preexec_fn(),
+            )
+        # stdout/stderr 모두 상한까지만 메모리에 둠 (stderr는 에러 메시지용 꼬리만)
+        stderr = StderrTail(process.stderr)
+        lines = read_lines(process.stdout, self.settings.claude_max_stdout_bytes)
 
-        # 임시 파일 생성 (확장자는 png로 기본 설정)
-        fd, temp_path = tempfile.mkstemp(suffix=".png")
         try:
-            os.write(fd, image_data)
+            async for line in lines:
+                message = parse_line(line)
+                if message is not None:
+                    yield message
+
+            await process.wait()
+            if process.returncode != 0:
+                await stderr.wait()
+                limit = self.limits.describe_exit(process.returncode, stderr.text)
+                if limit:
+                    raise ResourceLimitError(limit)
+                raise WorkerError(
+                    stderr.text or f"CLI exited with code {process.returncode}"
+                )
         finally:
-            os.close(fd)
+            # 타임아웃/취소(클라이언트 연결 끊김 등)로 중간에 끝나면 프로세스 그룹째 종료
+            await lines.aclose()
+            await terminate_process_group(process, self.settings.claude_kill_grace_seconds)
+            stderr.cancel()
 
-        return temp_path
+    async def _pooled_messages(
+        self, pool: ClaudeWorkerPool, message: str
+    ) -> AsyncIterator[dict]:
+        """워커 풀에서 대기 중인 CLI 프로세스를 빌려 stdout 메시지 반환"""
+        # 중간에 취소되면 lease 블록에서 워커가 broken 처리되어 종료됨
+        lease_start = time.perf_counter()
+        async with pool.lease() as worker:
+            record_stage("pool_lease", (time.perf_counter() - lease_start) * 1000)
+            await worker.send(message)
+            async for message in worker.messages():
+                yield message
 
-    def _parse_calendar_response(self, output: str) -> tuple[list[dict], str | None]:
-        """달력이 페르소나 응답에서 JSON 파싱"""
+    def _stream_backend(
+        self,
+        user_prompt: str,
+        image_path: str | None,
+        persona_type: PersonaType,
+        timeout: int,
+    ) -> AsyncIterator[str | CLIResult]:
+        """AI 백엔드 실행 → 텍스트 조각(str)들, 마지막에 CLIResult (다른 백엔드는 이 메서드를 교체)"""
+        return self._stream_cli(self._build_prompt(user_prompt, image_path), persona_type, timeout)
+
+    def _hedge_delay(self, persona_type: PersonaType, has_image: bool) -> float | None:
+        """헤지 요청을 보낼 시점 (초, 첫 출력 시간 표본이 부족하면 None)"""
+        observed = self.first_output.quantile_for(
+            persona_type.value, has_image, self.settings.claude_hedge_percentile
+        )
+        if observed is None:
+            return None
+        return max(observed, self.settings.claude_hedge_min_delay_seconds)
+
+    @staticmethod
+    def _is_usable(item: str | CLIResult) -> bool:
+        """헤지 경쟁에서 이긴 것으로 볼 출력 (텍스트 조각 또는 성공 결과)"""
+        if isinstance(item, CLIResult):
+            return item.error is None and not item.timed_out
+        return True
+
+    async def _run_backend(
+        self,
+        user_prompt: str,
+        image_path: str | None,
+        persona_type: PersonaType,
+        timeout: int,
+    ) -> AsyncIterator[str | CLIResult]:
+        """백엔드 실행 (헤지 대상이면 첫 출력이 늦을 때 같은 요청을 한 번 더 실행)
+
+        먼저 쓸 만한 출력(텍스트 조각 또는 성공 결과)을 낸 쪽의 스트림을 그대로 이어서 내보내고
+        다른 쪽은 바로 종료합니다. 한쪽이 실패로 끝나면 다른 쪽을 기다리고, 둘 다 실패하면 마지막 실패 결과.
+        헤지 요청은 레인에 빈 슬롯이 있고 HedgeBudget이 허락할 때만 보냅니다.
+        """
+        primary = self._stream_backend(user_prompt, image_path, persona_type, timeout)
+        if self.hedge is None or persona_type.value not in self.settings.claude_hedge_personas:
+            # 중간에 닫히면(출력 상한, 취소) 백엔드 스트림도 바로 닫아 CLI 종료
+            async with aclosing(primary):
+                async for item in primary:
+                    yield item
+            return
+
+        has_image = image_path is not None
+        hedge_at = self._hedge_delay(persona_type, has_image)
+        self.hedge.on_request()
+        lane = self._lane_for(persona_type)
+        hedge_slot = False
+        start = time.monotonic()
+
+        attempts = [primary]
+        tasks: dict[asyncio.Future, AsyncIterator] = {
+            asyncio.ensure_future(anext(primary)): primary
+        }
+        winner = first_item = failure = None
         try:
-            # JSON 블록 추출 (```json ... ``` 또는 순수 JSON)
-            json_match = re.search(r"```json\s*(.*?)\s*```", output, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # 순수 JSON 시도
-                json_str = output.strip()
+            while tasks and winner is None:
+                done, _ = await asyncio.wait(
+                    tasks, timeout=hedge_at, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # 첫 출력이 평소보다 늦음 → 빈 슬롯과 예산이 있으면 같은 요청을 한 번 더
+                    hedge_at = None
+                    if not self.scheduler.try_acquire(lane):
+                        continue
+                    if not self.hedge.try_spend():
+                        self.scheduler.release(lane)
+                        continue
+                    hedge_slot = True
+                    remaining = math.ceil(timeout - (time.monotonic() - start))
+                    hedge = self._stream_backend(
+                        user_prompt, image_path, persona_type, max(remaining, 1)
+                    )
+                    attempts.append(hedge)
+                    tasks[asyncio.ensure_future(anext(hedge))] = hedge
+                    logger.info(
+                        f"Hedging Claude request ({persona_type.value}) after "
+                        f"{int((time.monotonic() - start) * 1000)}ms without output"
+                    )
+                    continue
 
-            data = json.loads(json_str)
+                # 동시에 끝났으면 원래 요청 우선
+                for task in [t for t in tasks if t in done]:
+                    attempt = tasks.pop(task)
+                    try:
+                        item = task.result()
+                    except StopAsyncIteration:
+                        continue
+                    if self._is_usable(item):
+                        winner, first_item = attempt, item
+                        break
+                    failure = item
 
-            events = data.get("events", [])
-            message = data.get("message")
+            if winner is None:
+                yield failure or CLIResult(output="", error="Claude CLI finished without a result")
+                return
 
-            return events, message
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning(f"Failed to parse calendar response: {e}")
-            return [], None
+            self.first_output.record(persona_type.value, has_image, time.monotonic() - start)
+            if winner is not primary:
+                self.hedge.record_win()
+                logger.info(f"Hedged Claude request won ({persona_type.value})")
+            await self._close_attempts(tasks, [a for a in attempts if a is not winner])
+            yield first_item
+            async for item in winner:
+                yield item
+        finally:
+            await self._close_attempts(tasks, attempts)
+            if hedge_slot:
+                self.scheduler.release(lane)
+
+    @staticmethod
+    async def _close_attempts(
+        tasks: dict[asyncio.Future, AsyncIterator], attempts: list[AsyncIterator]
+    ) -> None:
+        """진행 중인 읽기를 취소하고 실행을 종료 (CLI 프로세스는 각 스트림의 정리 과정에서 종료)"""
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+        for task in tasks:
+            if not task.cancelled():
+                task.exception()
+        tasks.clear()
+        for attempt in attempts:
+            await attempt.aclose()
+
+    async def _stream_cli(
+        self, message: str, persona_type: PersonaType, timeout: int
+    ) -> AsyncIterator[str | CLIResult]:
+        """CLI 출력을 읽으면서 텍스트 조각(str)을, 마지막에 CLIResult를 반환"""
+        pool = self.pools.get(persona_type)
+        if pool:
+            messages = self._pooled_messages(pool, message)
+        else:
+            messages = self._subprocess_messages(message, persona_type)
+
+        deadline = time.monotonic() + timeout
+        started = time.perf_counter()
+        first_message = True
+        parts: list[str] = []
+        result: StreamResult | None = None
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    message = await asyncio.wait_for(anext(messages), remaining)
+                except StopAsyncIteration:
+                    break
+                if first_message:
+                    # 프로세스 시작(또는 워커 대여)부터 첫 stdout 메시지까지
+                    record_stage("first_byte", (time.perf_counter() - started) * 1000)
+                    first_message = False
+
+                delta = text_delta(message)
+                if delta:
+                    parts.append(delta)
+                    yield delta
+                elif is_result(message):
+                    result = to_result(message)
+        except asyncio.TimeoutError:
+            # 타임아웃 전까지 받은 텍스트는 부분 응답으로 살림
+            yield CLIResult(output="".join(parts), timed_out=True)
+            return
+        except ResourceLimitError as e:
+            yield CLIResult(output="", error=str(e), limit_exceeded=True)
+            return
+        except WorkerError as e:
+            yield CLIResult(output="", error=str(e))
+            return
+        finally:
+            # 취소된 경우에도 여기서 CLI 프로세스(또는 대여한 워커)가 종료됨
+            await messages.aclose()
+            record_stage("generate", (time.perf_counter() - started) * 1000)
+
+        if result is None:
+            yield CLIResult(output="", error="Claude CLI finished without a result")
+        elif result.is_error:
+            yield CLIResult(
+                output="",
+                error=result.text or "CLI returned an error result",
+                usage=result.usage,
+            )
+        else:
+            yield CLIResult(output=result.text, usage=result.usage)
 
     async def chat(
         self,
         prompt: str,
         timeout_seconds: int | None = None,
         image_base64: str | None = None,
+        user_id: str | None = None,
+        image: StagedImage | None = None,
     ) -> ChatResponse:
         """
         Claude CLI로 채팅 요청
@@ -98,101 +595,392 @@ class ClaudeService:
             prompt: 사용자 프롬프트 (호출어 포함)
             timeout_seconds: 타임아웃 (초)
             image_base64: Base64 인코딩된 이미지 (선택)
+            user_id: 요청한 사용자 UID (공정 큐 키)
+            image: 이미 임시 파일로 저장된 이미지 (선택, 파일 정리는 호출자 책임)
 
         Returns:
             ChatResponse: 응답 또는 에러
+
+        Raises:
+            TooManyRequestsError: 대기열이 가득 찬 경우
+        """
+        response = None
+        async for chunk in self.chat_stream(
+            prompt,
+            timeout_seconds=timeout_seconds,
+            image_base64=image_base64,
+            user_id=user_id,
+            image=image,
+        ):
+            if chunk.response is not None:
+                response = chunk.response
+        return response
+
+    async def chat_stream(
+        self,
+        prompt: str,
+        timeout_seconds: int | None = None,
+        image_base64: str | None = None,
+        user_id: str | None = None,
+        image: StagedImage | None = None,
+    ) -> AsyncIterator[ChatChunk]:
+        """
+        Claude CLI 스트리밍 채팅 요청
+
+        CLI가 출력하는 텍스트 조각을 도착하는 대로 ChatChunk(text=...)로 내보내고,
+        마지막에 ChatChunk(response=ChatResponse)를 한 번 내보냅니다.
+        인자와 페르소나 감지 규칙은 chat()과 같습니다.
+
+        Raises:
+            TooManyRequestsError: 대기열이 가득 찬 경우
         """
         settings = self.settings
-        timeout = min(
+        max_timeout = min(
             timeout_seconds or settings.claude_timeout_seconds,
             settings.claude_max_timeout_seconds,
         )
 
         # 페르소나 감지
-        persona_type, actual_prompt = detect_persona(prompt)
+        with timed_stage("persona"):
+            persona_type, actual_prompt = detect_persona(prompt)
 
         if persona_type is None:
             # 호출어가 없으면 AI 응답 안함
-            return ChatResponse(
+            yield ChatChunk(
+                response=ChatResponse(
+                    output="",
+                    elapsed_ms=0,
+                    success=False,
+                    error="No AI trigger detected",
+                    error_type=AIErrorType.NO_TRIGGER,
+                )
+            )
+            return
+
+        persona = get_persona(persona_type)
+
+        # 이미지 디코딩 (해시는 캐시 키에 사용)
+        image_data = None
+        image_hash = image.sha256 if image else None
+        if image_base64 and image is None:
+            try:
+                with timed_stage("image_decode"):
+                    image_data = decode_image_base64(image_base64)
+            except Exception as e:
+                logger.error(f"Failed to decode image: {e}")
+                yield ChatChunk(
+                    response=ChatResponse(
+                        output="",
+                        elapsed_ms=0,
+                        success=False,
+                        error=f"Failed to process image: {e}",
+                        error_type=AIErrorType.INVALID_IMAGE,
+                        persona_name=persona.display_name,
+                    )
+                )
+                return
+            image_hash = hashlib.sha256(image_data).hexdigest()
+
+        # 최근 실행 시간 기반 타임아웃 (요청/설정 타임아웃이 상한, 대기열 대기 시간은 제외)
+        timeout = max_timeout
+        if settings.claude_adaptive_timeout_enabled:
+            timeout = self.latency.timeout_for(
+                persona_type.value, image_hash is not None, max_timeout
+            )
+
+        # 캐시 적중 시 CLI 실행 없이 바로 응답
+        request_key = make_cache_key(persona_type, actual_prompt, image_hash)
+        cacheable = self.cache.is_cacheable(persona_type)
+        if cacheable:
+            lookup_start = time.monotonic()
+            cached = await self.cache.get(request_key)
+            if cached is not None:
+                response = self._response_from_cache(
+                    cached, int((time.monotonic() - lookup_start) * 1000)
+                )
+                logger.info(f"AI cache hit ({persona.display_name})")
+                async for chunk in self._replay(response):
+                    yield chunk
+                return
+
+        # 같은 요청이 이미 실행 중이면 그 결과를 함께 받음
+        while not self.inflight.lead(request_key):
+            wait_start = time.monotonic()
+            shared = await self.inflight.wait(request_key)
+            if shared is not None:
+                logger.info(f"Coalesced AI request ({persona.display_name})")
+                response = dataclasses.replace(
+                    shared,
+                    elapsed_ms=int((time.monotonic() - wait_start) * 1000),
+                    queue_wait_ms=0,
+                )
+                async for chunk in self._replay(response):
+                    yield chunk
+                return
+
+        # 서킷이 열려 있으면 CLI를 띄우지 않고 바로 실패
+        if self.circuit and not self.circuit.allow():
+            response = ChatResponse(
                 output="",
                 elapsed_ms=0,
                 success=False,
-                error="No AI trigger detected",
+                error=(
+                    "AI service temporarily unavailable, "
+                    f"retry in {self.circuit.retry_after}s"
+                ),
+                error_type=AIErrorType.SERVICE_UNAVAILABLE,
+                persona_name=persona.display_name,
             )
+            self.inflight.resolve(request_key, response)
+            self.inflight.finish(request_key)
+            yield ChatChunk(response=response)
+            return
+
+        probe = self.circuit is not None and self.circuit.state == CircuitState.HALF_OPEN
+        outcome_recorded = False
+        try:
+            async with self.scheduler.slot(
+                user_id or ANONYMOUS_USER, self._lane_for(persona_type)
+            ) as queue_wait_ms:
+                record_stage("queue", queue_wait_ms)
+                async for chunk in self._execute(
+                    persona_type, actual_prompt, timeout, image_data or image
+                ):
+                    if chunk.response is not None:
+                        outcome_recorded = self._record_outcome(chunk.response, probe)
+                        chunk.response.queue_wait_ms = queue_wait_ms
+                        if cacheable and self._is_cacheable_response(
+                            persona_type, chunk.response
+                        ):
+                            await self.cache.put(
+                                request_key,
+                                persona_type,
+                                self._response_to_cache(chunk.response),
+                            )
+                        self.inflight.resolve(request_key, chunk.response)
+                    yield chunk
+        finally:
+            if probe and not outcome_recorded:
+                self.circuit.abandon_probe()
+            self.inflight.finish(request_key)
 
+    def _salvage_partial(
+        self,
+        persona_type: PersonaType,
+        output: str,
+        elapsed_ms: int,
+        timeout: int,
+    ) -> ChatResponse | None:
+        """타임아웃 전까지 받은 출력으로 만든 부분 응답 (쓸 만한 내용이 없으면 None)
+
+        달력이는 완성된 일정이 하나 이상 있을 때만 (잘린 JSON에서 끝까지 닫힌 일정만 사용)
+        """
+        if not output.strip():
+            return None
+        parsed_events = ai_message = None
+        if persona_type == PersonaType.CALENDAR:
+            parsed_events, ai_message = self._parse_calendar_response(output)
+            if not parsed_events:
+                return None
+        logger.info(f"Salvaged {len(output)} chars of partial output after timeout")
+        return ChatResponse(
+            output=output,
+            elapsed_ms=elapsed_ms,
+            success=True,
+            error=f"Request timed out after {timeout} seconds",
+            error_type=AIErrorType.TIMEOUT,
+            persona_name=get_persona(persona_type).display_name,
+            parsed_events=parsed_events,
+            ai_message=ai_message,
+            truncated=True,
+        )
+
+    def _record_outcome(self, response: ChatResponse, probe: bool = False) -> bool:
+        """CLI 실행 결과를 서킷 브레이커에 반영 (반영했으면 True)
+
+        타임아웃으로 잘린 부분 응답은 성공 응답이어도 실패로 셈
+        probe: half_open에서 시험 요청으로 들어간 실행인지 (아니면 half_open 중 결과는 무시됨)
+        """
+        if self.circuit is None:
+            return False
+        if response.error_type in CIRCUIT_FAILURES:
+            self.circuit.record_failure(probe=probe)
+            return True
+        if response.success:
+            self.circuit.record_success(probe=probe)
+            return True
+        return False
+
+    @staticmethod
+    async def _replay(response: ChatResponse) -> AsyncIterator[ChatChunk]:
+        """이미 완성된 응답을 스트림 형태로 내보냄"""
+        if response.success and response.output:
+            yield ChatChunk(text=response.output)
+        for event in response.parsed_events or []:
+            yield ChatChunk(event=event)
+        yield ChatChunk(response=response)
+
+    @staticmethod
+    def _is_cacheable_response(
+        persona_type: PersonaType, response: ChatResponse
+    ) -> bool:
+        """성공한 응답만 캐시 (잘린 응답 제외, 달력이는 일정을 찾은 경우만)"""
+        if not response.success or response.truncated:
+            return False
+        if persona_type == PersonaType.CALENDAR:
+            return bool(response.parsed_events)
+        return True
+
+    @staticmethod
+    def _response_to_cache(response: ChatResponse) -> dict:
+        return {
+            "output": response.output,
+            "persona_name": response.persona_name,
+            "parsed_events": response.parsed_events,
+            "ai_message": response.ai_message,
+        }
+
+    @staticmethod
+    def _response_from_cache(payload: dict, elapsed_ms: int) -> ChatResponse:
+        return ChatResponse(
+            output=payload["output"],
+            elapsed_ms=elapsed_ms,
+            success=True,
+            persona_name=payload.get("persona_name"),
+            parsed_events=payload.get("parsed_events"),
+            ai_message=payload.get("ai_message"),
+            cache_hit=True,
+        )
+
+    async def _execute(
+        self,
+        persona_type: PersonaType,
+        actual_prompt: str,
+        timeout: int,
+        image_source: bytes | StagedImage | None,
+    ) -> AsyncIterator[ChatChunk]:
+        """스케줄러 슬롯을 잡은 상태에서 CLI 실행 및 응답 생성
+
+        전처리 후 새로 저장한 이미지는 끝나면 지우고,
+        호출자가 넘긴 StagedImage의 정리는 호출자 책임입니다.
+        """
+        settings = self.settings
         persona = get_persona(persona_type)
 
         # 이미지 처리
-        temp_image_path = None
-        if image_base64:
+        staged_image = owned_image = None
+        if image_source is not None:
             try:
-                temp_image_path = self._save_temp_image(image_base64)
-                logger.info(f"Saved temp image: {temp_image_path}")
+                staged_image, owned_image = await self._prepare_image(image_source)
+                logger.info(
+                    f"Saved temp image: {staged_image.path} ({staged_image.backend.value})"
+                )
             except Exception as e:
-                logger.error(f"Failed to save temp image: {e}")
-                return ChatResponse(
-                    output="",
-                    elapsed_ms=0,
-                    success=False,
-                    error=f"Failed to process image: {e}",
-                    persona_name=persona.display_name,
+                logger.error(f"Failed to prepare image: {e}")
+                yield ChatChunk(
+                    response=ChatResponse(
+                        output="",
+                        elapsed_ms=0,
+                        success=False,
+                        error=f"Failed to process image: {e}",
+                        error_type=AIErrorType.INVALID_IMAGE,
+                        persona_name=persona.display_name,
+                    )
                 )
+                return
 
+        temp_image_path = staged_image.path if staged_image else None
+        start_time = time.monotonic()
         try:
-            full_prompt = self._build_prompt(actual_prompt, persona_type, temp_image_path)
-
-            cmd = [
-                settings.claude_cli_path,
-                "--dangerously-skip-permissions",
-                "-p",
-                full_prompt,
-            ]
-
             logger.info(
-                f"Executing Claude CLI with persona={persona.display_name}, "
-                f"timeout={timeout}s, has_image={temp_image_path is not None}"
+                f"Executing Claude ({self.backend_name}) with persona={persona.display_name}, "
+                f"timeout={timeout}s, has_image={temp_image_path is not None}, "
+                f"pooled={persona_type in self.pools}"
             )
-            start_time = time.monotonic()
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.DEVNULL,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            # 달력이는 일정 JSON을 스트리밍 중에 파싱해 완성된 일정부터 내보냄
+            extractor = CalendarJSONExtractor() if persona_type == PersonaType.CALENDAR else None
 
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout,
-                )
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                elapsed_ms = int((time.monotonic() - start_time) * 1000)
-                logger.warning(f"Claude CLI timeout after {elapsed_ms}ms")
-                return ChatResponse(
-                    output="",
-                    elapsed_ms=elapsed_ms,
-                    success=False,
-                    error=f"Request timed out after {timeout} seconds",
-                    persona_name=persona.display_name,
-                )
+            result = None
+            parts: list[str] = []
+            remaining_chars = settings.claude_max_output_chars
+            async with aclosing(
+                self._run_backend(actual_prompt, temp_image_path, persona_type, timeout)
+            ) as items:
+                async for item in items:
+                    if isinstance(item, CLIResult):
+                        result = item
+                        continue
+                    if len(item) > remaining_chars:
+                        # 출력 크기 상한 → 여기까지만 내보내고 CLI 중단 (aclosing이 종료)
+                        item = item[:remaining_chars]
+                        result = CLIResult(output="".join(parts) + item, truncated=True)
+                    parts.append(item)
+                    remaining_chars -= len(item)
+                    if item:
+                        yield ChatChunk(text=item)
+                        if extractor:
+                            for event in extractor.feed(item):
+                                yield ChatChunk(event=event)
+                    if result is not None:
+                        logger.warning(
+                            f"Claude output exceeded {settings.claude_max_output_chars} chars, "
+                            "stopping"
+                        )
+                        break
 
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
+            self.usage.record(persona_type.value, result.usage)
+            if result.timed_out or result.error is None:
+                self.latency.record(
+                    persona_type.value,
+                    staged_image is not None,
+                    elapsed_ms / 1000,
+                    timed_out=result.timed_out,
+                )
 
-            if process.returncode != 0:
-                error_msg = stderr.decode("utf-8", errors="replace").strip()
-                logger.error(f"Claude CLI error: {error_msg}")
-                return ChatResponse(
-                    output="",
-                    elapsed_ms=elapsed_ms,
-                    success=False,
-                    error=error_msg or f"CLI exited with code {process.returncode}",
-                    persona_name=persona.display_name,
+            if result.timed_out:
+                logger.warning(
+                    f"Claude CLI timeout after {elapsed_ms}ms "
+                    f"({len(result.output)} chars received)"
+                )
+                partial = self._salvage_partial(
+                    persona_type, result.output, elapsed_ms, timeout
+                )
+                if partial is not None:
+                    yield ChatChunk(response=partial)
+                    return
+                yield ChatChunk(
+                    response=ChatResponse(
+                        output="",
+                        elapsed_ms=elapsed_ms,
+                        success=False,
+                        error=f"Request timed out after {timeout} seconds",
+                        error_type=AIErrorType.TIMEOUT,
+                        persona_name=persona.display_name,
+                    )
                 )
+                return
 
-            output = stdout.decode("utf-8", errors="replace").strip()
+            if result.error is not None:
+                logger.error(f"Claude CLI error: {result.error}")
+                if result.limit_exceeded:
+                    self.limit_exceeded_total += 1
+                yield ChatChunk(
+                    response=ChatResponse(
+                        output="",
+                        elapsed_ms=elapsed_ms,
+                        success=False,
+                        error=result.error,
+                        error_type=AIErrorType.RESOURCE_LIMIT
+                        if result.limit_exceeded
+                        else AIErrorType.CLI_ERROR,
+                        persona_name=persona.display_name,
+                    )
+                )
+                return
+
+            output = result.output
             logger.info(
                 f"Claude CLI success ({persona.display_name}) in {elapsed_ms}ms, "
                 f"output length: {len(output)}"
@@ -205,39 +993,52 @@ class ClaudeService:
                 parsed_events, ai_message = self._parse_calendar_response(output)
                 logger.info(f"Parsed {len(parsed_events)} events from calendar response")
 
-            return ChatResponse(
-                output=output,
-                elapsed_ms=elapsed_ms,
-                success=True,
-                persona_name=persona.display_name,
-                parsed_events=parsed_events,
-                ai_message=ai_message,
+            yield ChatChunk(
+                response=ChatResponse(
+                    output=output,
+                    elapsed_ms=elapsed_ms,
+                    success=True,
+                    persona_name=persona.display_name,
+                    parsed_events=parsed_events,
+                    ai_message=ai_message,
+                    truncated=result.truncated,
+                )
             )
 
+        except asyncio.CancelledError:
+            # 클라이언트가 떠난 요청 - 백엔드 실행은 _stream_backend 정리 과정에서 중단됨
+            self.cancelled_total += 1
+            logger.info(
+                f"Claude ({self.backend_name}) request cancelled after "
+                f"{int((time.monotonic() - start_time) * 1000)}ms"
+            )
+            raise
         except FileNotFoundError:
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
             error = f"Claude CLI not found at: {settings.claude_cli_path}"
             logger.error(error)
-            return ChatResponse(
-                output="",
-                elapsed_ms=elapsed_ms,
-                success=False,
-                error=error,
+            yield ChatChunk(
+                response=ChatResponse(
+                    output="",
+                    elapsed_ms=elapsed_ms,
+                    success=False,
+                    error=error,
+                    error_type=AIErrorType.SERVICE_UNAVAILABLE,
+                )
             )
         except Exception as e:
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
             logger.exception("Unexpected error in Claude CLI execution")
-            return ChatResponse(
-                output="",
-                elapsed_ms=elapsed_ms,
-                success=False,
-                error=str(e),
+            yield ChatChunk(
+                response=ChatResponse(
+                    output="",
+                    elapsed_ms=elapsed_ms,
+                    success=False,
+                    error=str(e),
+                    error_type=AIErrorType.CLI_ERROR,
+                )
             )
         finally:
-            # 임시 이미지 파일 정리
-            if temp_image_path and os.path.exists(temp_image_path):
-                try:
-                    os.remove(temp_image_path)
-                    logger.debug(f"Removed temp image: {temp_image_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to remove temp image: {e}")
+            # 직접 만든 임시 이미지 파일만 정리
+            if owned_image:
+                owned_image.remove()
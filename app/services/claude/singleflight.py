@@ -0,0 +1,61 @@
+"""진행 중인 동일 AI 요청 합치기 (single-flight)
+
+같은 키(페르소나, 프롬프트, 이미지 해시)의 요청이 이미 실행 중이면
+새 CLI 프로세스를 띄우지 않고 먼저 시작한 요청(leader)의 결과를 함께 받습니다.
+결과를 저장해두지 않으므로 캐시와 달리 오래된 응답을 돌려줄 일이 없습니다.
+"""
+
+import asyncio
+import logging
+
+from app.services.claude.protocol import ChatResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """키별 진행 중 요청 레지스트리"""
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.coalesced_total = 0
+
+    def lead(self, key: str) -> bool:
+        """이 키의 leader로 등록 (이미 진행 중이면 False)"""
+        if key in self._inflight:
+            return False
+        self._inflight[key] = asyncio.get_running_loop().create_future()
+        return True
+
+    async def wait(self, key: str) -> ChatResponse | None:
+        """leader의 결과를 기다림
+
+        leader가 결과 없이 끝나면(취소 등) None - 호출자가 직접 실행해야 함
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            return None
+        self.coalesced_total += 1
+        # 기다리던 쪽이 취소돼도 공유 Future는 건드리지 않음
+        return await asyncio.shield(future)
+
+    def resolve(self, key: str, response: ChatResponse) -> None:
+        """leader 결과를 대기 중인 요청들에게 전달"""
+        future = self._inflight.get(key)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def finish(self, key: str) -> None:
+        """leader 종료 - 결과 없이 끝났으면 대기자들은 None을 받음"""
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    def is_inflight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "coalesced_total": self.coalesced_total,
+        }
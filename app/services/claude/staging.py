@@ -0,0 +1,230 @@
+"""CLI에 넘길 이미지 임시 파일 관리
+
+CLI는 이미지를 파일 경로로 읽으므로, 요청 이미지를 임시 파일로 저장(staging)하고
+경로와 SHA-256 해시를 함께 돌려줍니다.
+
+저장 방식 (backend)
+- memfd: 익명 메모리 파일(memfd_create)에 쓰고, CLI가 확장자로 이미지를 인식하도록
+  `/proc/<pid>/fd/<fd>`를 가리키는 `.png` 심볼릭 링크를 만들어 경로로 넘김
+- tmpfs: 메모리 파일시스템 디렉토리(/dev/shm)에 임시 파일 생성
+- disk: 기본 임시 디렉토리(tempfile)에 생성
+- auto: memfd → tmpfs → disk 순으로 사용 가능한 방식 선택
+
+몇 초 뒤 지울 데이터를 디스크에 쓰지 않기 위함이며,
+memfd/tmpfs 파일 생성에 실패하면 요청 단위로 disk로 대체합니다.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import secrets
+import tempfile
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+
+from app.config import get_settings
+from app.services.claude.metrics import timed_stage
+
+logger = logging.getLogger(__name__)
+
+_PREFIX = "claude-image-"
+
+
+class ImageTooLargeError(ValueError):
+    """이미지 크기 제한 초과"""
+
+    pass
+
+
+class StagingBackend(str, Enum):
+    """이미지 저장 방식"""
+
+    AUTO = "auto"
+    MEMFD = "memfd"
+    TMPFS = "tmpfs"
+    DISK = "disk"
+
+
+@dataclass
+class StagedImage:
+    """임시 파일로 저장된 이미지"""
+
+    path: str
+    sha256: str
+    size: int
+    backend: StagingBackend = StagingBackend.DISK
+    # memfd 방식일 때 열려 있는 파일 디스크립터 (remove()에서 닫음)
+    fd: int = -1
+
+    def remove(self) -> None:
+        """임시 파일 삭제 (이미 없으면 무시)"""
+        try:
+            os.remove(self.path)
+            logger.debug(f"Removed temp image: {self.path}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove temp image: {e}")
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def decode_image_base64(image_base64: str) -> bytes:
+    """Base64 이미지 디코딩 (data:image/png;base64, 접두어 허용)"""
+    if "," in image_base64:
+        image_base64 = image_base64.split(",", 1)[1]
+
+    return base64.b64decode(image_base64)
+
+
+def _memfd_supported() -> bool:
+    return hasattr(os, "memfd_create") and os.path.isdir(f"/proc/{os.getpid()}/fd")
+
+
+def _dir_writable(path: str | None) -> bool:
+    return bool(path) and os.path.isdir(path) and os.access(path, os.W_OK | os.X_OK)
+
+
+def resolve_backend(preferred: StagingBackend | str, tmpfs_dir: str | None) -> StagingBackend:
+    """설정한 방식이 이 환경에서 불가능하면 다음 방식으로 내려감 (memfd → tmpfs → disk)"""
+    preferred = StagingBackend(preferred)
+    order = [StagingBackend.MEMFD, StagingBackend.TMPFS, StagingBackend.DISK]
+    start = 0 if preferred == StagingBackend.AUTO else order.index(preferred)
+
+    for backend in order[start:]:
+        if backend == StagingBackend.MEMFD and not _memfd_supported():
+            continue
+        if backend == StagingBackend.TMPFS and not _dir_writable(tmpfs_dir):
+            continue
+        if preferred not in (StagingBackend.AUTO, backend):
+            logger.warning(f"Image staging backend '{preferred.value}' unavailable, using '{backend.value}'")
+        return backend
+    return StagingBackend.DISK
+
+
+class ImageWriter:
+    """이미지를 청크 단위로 임시 파일에 쓰면서 해시 계산
+
+    전체 이미지를 메모리에 올리지 않고 업로드 스트림을 그대로 파일로 흘려보낼 때 사용
+    """
+
+    def __init__(
+        self,
+        suffix: str = ".png",
+        max_bytes: int | None = None,
+        backend: StagingBackend = StagingBackend.DISK,
+        tmpfs_dir: str | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self._hash = hashlib.sha256()
+        self._size = 0
+
+        if backend == StagingBackend.MEMFD:
+            self._fd = os.memfd_create(_PREFIX.rstrip("-"), os.MFD_CLOEXEC)
+            link_dir = tmpfs_dir if _dir_writable(tmpfs_dir) else tempfile.gettempdir()
+            self.path = os.path.join(link_dir, f"{_PREFIX}{secrets.token_hex(8)}{suffix}")
+            try:
+                # CLI는 별도 프로세스이므로 /proc/self가 아닌 이 프로세스의 pid 경로를 가리킴
+                os.symlink(f"/proc/{os.getpid()}/fd/{self._fd}", self.path)
+            except OSError:
+                os.close(self._fd)
+                raise
+        else:
+            directory = tmpfs_dir if backend == StagingBackend.TMPFS else None
+            self._fd, self.path = tempfile.mkstemp(suffix=suffix, prefix=_PREFIX, dir=directory)
+
+    def write(self, chunk: bytes) -> None:
+        self._size += len(chunk)
+        if self.max_bytes is not None and self._size > self.max_bytes:
+            self.abort()
+            raise ImageTooLargeError(
+                f"Image exceeds maximum size of {self.max_bytes} bytes"
+            )
+        self._hash.update(chunk)
+        view = memoryview(chunk)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def close(self) -> StagedImage:
+        """쓰기 완료 후 StagedImage 반환 (memfd는 삭제 전까지 fd를 열어둠)"""
+        fd = -1
+        if self.backend == StagingBackend.MEMFD:
+            fd = self._fd
+        else:
+            os.close(self._fd)
+        self._fd = -1
+        return StagedImage(
+            path=self.path,
+            sha256=self._hash.hexdigest(),
+            size=self._size,
+            backend=self.backend,
+            fd=fd,
+        )
+
+    def abort(self) -> None:
+        """쓰던 파일 정리"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ImageStager:
+    """설정된 방식으로 ImageWriter를 만들고, 실패 시 disk로 대체"""
+
+    def __init__(
+        self,
+        backend: StagingBackend | str = StagingBackend.AUTO,
+        tmpfs_dir: str | None = "/dev/shm",
+    ):
+        self.tmpfs_dir = tmpfs_dir
+        self.backend = resolve_backend(backend, tmpfs_dir)
+        self.staged_total = 0
+        self.fallback_total = 0
+
+    def writer(self, suffix: str = ".png", max_bytes: int | None = None) -> ImageWriter:
+        """새 이미지 쓰기 시작"""
+        self.staged_total += 1
+        if self.backend != StagingBackend.DISK:
+            try:
+                return ImageWriter(suffix, max_bytes, self.backend, self.tmpfs_dir)
+            except OSError as e:
+                self.fallback_total += 1
+                logger.warning(f"Image staging via {self.backend.value} failed, falling back to disk: {e}")
+        return ImageWriter(suffix, max_bytes, StagingBackend.DISK)
+
+    def stage_bytes(self, data: bytes, suffix: str = ".png") -> StagedImage:
+        """메모리에 있는 이미지를 임시 파일로 저장"""
+        with timed_stage("image_write"):
+            writer = self.writer(suffix=suffix)
+            try:
+                writer.write(data)
+            except BaseException:
+                writer.abort()
+                raise
+            return writer.close()
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.backend.value,
+            "staged_total": self.staged_total,
+            "fallback_total": self.fallback_total,
+        }
+
+
+@lru_cache
+def get_image_stager() -> ImageStager:
+    """설정 기반 ImageStager (프로세스당 하나)"""
+    settings = get_settings()
+    return ImageStager(
+        backend=settings.claude_image_staging,
+        tmpfs_dir=settings.claude_image_tmpfs_dir,
+    )
@@ -0,0 +1,74 @@
+"""Claude CLI stream-json 프로토콜 헬퍼
+
+`--input-format stream-json` / `--output-format stream-json` 모드에서
+CLI와 주고받는 NDJSON 메시지를 만들고 해석합니다.
+"""
+
+import json
+from dataclasses import dataclass
+
+# stream-json 한 줄 최대 길이 (asyncio StreamReader limit)
+STREAM_LINE_LIMIT = 8 * 1024 * 1024
+
+
+@dataclass
+class StreamResult:
+    """CLI result 메시지 요약"""
+
+    text: str
+    is_error: bool
+    usage: dict | None = None
+
+
+def build_user_message(text: str) -> bytes:
+    """stdin으로 보낼 user 메시지 한 줄 생성"""
+    payload = {
+        "type": "user",
+        "message": {
+            "role": "user",
+            "content": [{"type": "text", "text": text}],
+        },
+    }
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def parse_line(line: bytes) -> dict | None:
+    """stdout 한 줄을 메시지로 파싱 (JSON이 아니면 None)"""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def is_result(message: dict) -> bool:
+    """최종 result 메시지 여부"""
+    return message.get("type") == "result"
+
+
+def text_delta(message: dict) -> str | None:
+    """부분 메시지(--include-partial-messages)에서 텍스트 조각 추출"""
+    if message.get("type") != "stream_event":
+        return None
+    event = message.get("event") or {}
+    if event.get("type") != "content_block_delta":
+        return None
+    delta = event.get("delta") or {}
+    if delta.get("type") != "text_delta":
+        return None
+    return delta.get("text") or None
+
+
+def to_result(message: dict) -> StreamResult:
+    """result 메시지를 StreamResult로 변환"""
+    text = message.get("result")
+    if not isinstance(text, str):
+        text = ""
+    return StreamResult(
+        text=text.strip(),
+        is_error=bool(message.get("is_error")) or message.get("subtype") != "success",
+        usage=message.get("usage"),
+    )
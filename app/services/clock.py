@@ -0,0 +1,24 @@
+"""서비스 기준 시각 (KST)
+
+서버는 UTC로 돌지만 사용자는 한국에 있으므로 "오늘", "내일" 같은 날짜 기준은 모두 KST로 맞춥니다.
+(UTC 15:00~24:00에는 서버 날짜가 KST보다 하루 늦음)
+
+- 응답 캐시 키의 날짜 버킷
+- 빠른 파서가 상대 날짜를 해석하는 기준일
+- Messages API 백엔드에 알려주는 현재 날짜
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+# 한국 표준시 (서머타임 없음)
+KST = timezone(timedelta(hours=9), "KST")
+
+
+def now_kst() -> datetime:
+    """현재 시각 (KST)"""
+    return datetime.now(KST)
+
+
+def today_kst() -> date:
+    """오늘 날짜 (KST)"""
+    return now_kst().date()
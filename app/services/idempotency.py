@@ -0,0 +1,153 @@
+"""Idempotency-Key 저장소 - 재전송된 AI 요청의 중복 실행 방지
+
+모바일 네트워크에서 응답을 못 받은 클라이언트가 같은 요청을 다시 보내면
+CLI가 다시 실행되고 PendingEvent도 하나 더 생깁니다.
+클라이언트가 Idempotency-Key 헤더를 보내면 (사용자 uid, 경로, 키)별로
+- 처음 요청: 실행하고 결과를 ttl_seconds 동안 보관
+- 실행 중에 같은 요청: 먼저 온 요청의 결과를 기다렸다가 같은 결과 반환
+- 끝난 뒤 같은 요청: 보관한 결과 그대로 반환 (다시 실행 안 함)
+
+실패(예외)한 요청과 retain이 False인 결과(예: 파싱 실패 응답)는 보관하지 않으므로
+같은 키로 재시도하면 다시 실행됩니다. 실행 중에 합류한 요청은 그래도 같은 결과를 받습니다.
+같은 키를 다른 요청 본문에 쓰면 IdempotencyKeyReuseError (422).
+저장소는 프로세스 메모리에 있으므로 같은 프로세스로 온 재전송만 합쳐집니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from app.exceptions import IdempotencyKeyReuseError
+
+logger = logging.getLogger(__name__)
+
+
+def make_fingerprint(*parts: Any) -> str:
+    """요청 내용 지문 (같은 키가 같은 요청에 쓰였는지 확인용)"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    done: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+    result: Any = None
+    expires_at: float | None = None  # time.monotonic(), 완료 후 설정
+
+
+class IdempotencyStore:
+    """(사용자, 경로, 키)별 진행 중/완료된 요청 결과 저장소"""
+
+    def __init__(self, ttl_seconds: int = 600, max_entries: int = 2000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+
+        self.executed_total = 0
+        self.replayed_total = 0
+        self.joined_total = 0
+
+    async def run(
+        self,
+        owner_uid: str,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        work: Callable[[], Awaitable[Any]],
+        retain: Callable[[Any], bool] | None = None,
+    ) -> tuple[Any, bool]:
+        """키당 한 번만 실행 → (결과, 저장된 결과를 돌려줬는지)
+
+        retain이 있으면 True를 돌려준 결과만 ttl_seconds 동안 보관
+
+        Raises:
+            IdempotencyKeyReuseError: 같은 키가 다른 요청 내용으로 쓰인 경우
+            work()가 던진 예외 (저장되지 않음)
+        """
+        entry_key = (owner_uid, scope, key)
+        while True:
+            self._purge_expired()
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return await self._execute(entry_key, fingerprint, work, retain), False
+
+            if entry.fingerprint != fingerprint:
+                raise IdempotencyKeyReuseError(
+                    "Idempotency-Key가 다른 요청에 이미 사용되었습니다"
+                )
+
+            if entry.expires_at is not None:
+                self.replayed_total += 1
+                logger.info(f"Idempotent replay ({scope}, user={owner_uid})")
+                return entry.result, True
+
+            # 먼저 온 요청이 실행 중 → 끝날 때까지 기다림 (기다리는 쪽 취소가 전파되지 않게)
+            self.joined_total += 1
+            if await asyncio.shield(entry.done):
+                logger.info(f"Idempotent request joined in-flight ({scope}, user={owner_uid})")
+                return entry.result, True
+            # 먼저 온 요청이 실패/취소됨 → 이 요청이 다시 실행
+
+    async def _execute(
+        self,
+        entry_key: tuple[str, str, str],
+        fingerprint: str,
+        work: Callable[[], Awaitable[Any]],
+        retain: Callable[[Any], bool] | None,
+    ) -> Any:
+        entry = _Entry(fingerprint=fingerprint)
+        self._entries[entry_key] = entry
+        self.executed_total += 1
+        try:
+            result = await work()
+        except BaseException:
+            if self._entries.get(entry_key) is entry:
+                del self._entries[entry_key]
+            entry.done.set_result(False)
+            raise
+
+        entry.result = result
+        if retain is None or retain(result):
+            entry.expires_at = time.monotonic() + self.ttl_seconds
+            self._entries.move_to_end(entry_key)
+            self._evict_overflow()
+        elif self._entries.get(entry_key) is entry:
+            del self._entries[entry_key]
+        entry.done.set_result(True)
+        return result
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            entry_key
+            for entry_key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for entry_key in expired:
+            del self._entries[entry_key]
+
+    def _evict_overflow(self) -> None:
+        """완료된 결과가 max_entries를 넘으면 오래된 것부터 삭제 (실행 중인 요청은 유지)"""
+        overflow = len(self._entries) - self.max_entries
+        for entry_key in list(self._entries):
+            if overflow <= 0:
+                break
+            if self._entries[entry_key].expires_at is not None:
+                del self._entries[entry_key]
+                overflow -= 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "executed_total": self.executed_total,
+            "replayed_total": self.replayed_total,
+            "joined_total": self.joined_total,
+        }
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""부하 테스트용 가짜 claude CLI
+
+실제 CLI처럼 stream-json을 출력하는 독립 실행 파일입니다.
+CLAUDE_CLI_PATH로 지정하면 서버의 서브프로세스/워커 풀 경로를 그대로 타면서
+모델 호출 없이 지연 시간, 출력 크기, 실패율을 조절할 수 있습니다.
+
+지원하는 실행 방식 (서버가 쓰는 것과 같음)
+- 단발성: fake_claude.py -p "<메시지>" --append-system-prompt "<페르소나>" --output-format stream-json ...
+- 워커 풀: fake_claude.py -p --input-format stream-json ... (stdin의 user 메시지마다 응답)
+
+환경 변수
+- FAKE_CLAUDE_STARTUP_MS: 프로세스 시작 지연 (콜드 스타트 흉내, 기본 300)
+- FAKE_CLAUDE_LATENCY_MS: 응답 생성 시간 중앙값 (기본 2000)
+- FAKE_CLAUDE_LATENCY_SIGMA: 로그정규분포 sigma (0이면 고정 지연, 기본 0.5)
+- FAKE_CLAUDE_FIRST_TOKEN_MS: 첫 텍스트 조각까지 시간 (기본 LATENCY의 20%)
+- FAKE_CLAUDE_OUTPUT_CHARS: 일반 페르소나 응답 길이 (기본 300)
+- FAKE_CLAUDE_CHUNK_CHARS: 텍스트 조각 하나의 길이 (스트리밍 간격, 기본 20)
+- FAKE_CLAUDE_FAILURE_RATE: 에러로 종료할 확률 0~1 (기본 0)
+- FAKE_CLAUDE_HANG_RATE: 응답 없이 멈출 확률 0~1 (타임아웃 흉내, 기본 0)
+- FAKE_CLAUDE_SEED: 난수 시드 (재현용)
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+STARTUP_MS = _env_float("FAKE_CLAUDE_STARTUP_MS", 300)
+LATENCY_MS = _env_float("FAKE_CLAUDE_LATENCY_MS", 2000)
+LATENCY_SIGMA = _env_float("FAKE_CLAUDE_LATENCY_SIGMA", 0.5)
+FIRST_TOKEN_MS = _env_float("FAKE_CLAUDE_FIRST_TOKEN_MS", -1)
+OUTPUT_CHARS = int(_env_float("FAKE_CLAUDE_OUTPUT_CHARS", 300))
+CHUNK_CHARS = max(int(_env_float("FAKE_CLAUDE_CHUNK_CHARS", 20)), 1)
+FAILURE_RATE = _env_float("FAKE_CLAUDE_FAILURE_RATE", 0)
+HANG_RATE = _env_float("FAKE_CLAUDE_HANG_RATE", 0)
+
+_rng = random.Random(os.environ.get("FAKE_CLAUDE_SEED"))
+
+
+def _emit(message: dict) -> None:
+    sys.stdout.write(json.dumps(message, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def _latency_seconds() -> float:
+    if LATENCY_SIGMA <= 0:
+        return LATENCY_MS / 1000
+    return _rng.lognormvariate(0, LATENCY_SIGMA) * LATENCY_MS / 1000
+
+
+def _calendar_output(message: str) -> str:
+    """달력이 응답 흉내 (일괄 파싱 프롬프트면 항목마다 일정 하나)"""
+    items = [line for line in message.splitlines() if line.startswith("[")]
+    events = []
+    for index, line in enumerate(items or [message], start=1):
+        event = {
+            "title": line.split("]", 1)[-1].strip()[:30] or "일정",
+            "start_time": "2026-03-02T10:00:00",
+            "end_time": "2026-03-02T11:00:00",
+            "all_day": False,
+            "description": None,
+            "recurrence": None,
+        }
+        if items:
+            event["item"] = index
+        events.append(event)
+    body = json.dumps({"events": events, "message": "일정을 찾았어요"}, ensure_ascii=False)
+    return f"```json\n{body}\n```"
+
+
+def _answer(message: str, system_prompt: str) -> bool:
+    """요청 하나 처리 (False면 프로세스 종료)"""
+    roll = _rng.random()
+    if roll < HANG_RATE:
+        time.sleep(3600)
+    if roll < HANG_RATE + FAILURE_RATE:
+        sys.stderr.write("fake claude: simulated failure\n")
+        sys.stderr.flush()
+        return False
+
+    if "달력이" in system_prompt:
+        output = _calendar_output(message)
+    else:
+        output = ("가" * OUTPUT_CHARS)[:OUTPUT_CHARS]
+
+    total = _latency_seconds()
+    first = FIRST_TOKEN_MS / 1000 if FIRST_TOKEN_MS >= 0 else total * 0.2
+    chunks = [output[i : i + CHUNK_CHARS] for i in range(0, len(output), CHUNK_CHARS)] or [""]
+    interval = max(total - first, 0) / len(chunks)
+
+    _emit({"type": "system", "subtype": "init"})
+    time.sleep(first)
+    for chunk in chunks:
+        _emit({
+            "type": "stream_event",
+            "event": {
+                "type": "content_block_delta",
+                "delta": {"type": "text_delta", "text": chunk},
+            },
+        })
+        time.sleep(interval)
+
+    input_tokens = (len(message) + len(system_prompt)) // 2
+    _emit({
+        "type": "result",
+        "subtype": "success",
+        "is_error": False,
+        "result": output,
+        "usage": {
+            "input_tokens": len(message) // 2,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": input_tokens - len(message) // 2,
+            "output_tokens": len(output) // 2,
+        },
+    })
+    return True
+
+
+def _option(args: list[str], name: str) -> str | None:
+    if name in args:
+        index = args.index(name)
+        if index + 1 < len(args) and not args[index + 1].startswith("--"):
+            return args[index + 1]
+    return None
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    system_prompt = _option(args, "--append-system-prompt") or ""
+    time.sleep(STARTUP_MS / 1000)
+
+    if _option(args, "--input-format") == "stream-json":
+        # 워커 풀 모드: stdin이 닫힐 때까지 메시지마다 응답
+        for line in sys.stdin:
+            try:
+                payload = json.loads(line)
+                message = payload["message"]["content"][0]["text"]
+            except (ValueError, KeyError, IndexError, TypeError):
+                continue
+            if not _answer(message, system_prompt):
+                return 1
+        return 0
+
+    message = _option(args, "-p") or ""
+    return 0 if _answer(message, system_prompt) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
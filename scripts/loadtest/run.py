@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""AI 엔드포인트 부하 테스트
+
+목표 RPS로 /ai/chat, /calendar/ai/parse에 요청을 보내고
+처리량, 상태 코드별 개수, 지연 p50/p95/p99, CLI 프로세스 수를 보고합니다.
+요청은 응답을 기다리지 않고 일정 간격으로 보냅니다 (open-loop).
+서버가 밀리면 동시 요청 수가 늘어나므로 실제 트래픽과 같은 방식으로 포화 지점을 볼 수 있습니다.
+
+가짜 CLI로 서버 띄우기:
+    CLAUDE_CLI_PATH=$PWD/scripts/loadtest/fake_claude.py \\
+    FAKE_CLAUDE_LATENCY_MS=3000 FAKE_CLAUDE_FAILURE_RATE=0.01 \\
+    uvicorn app.main:app --port 8000
+
+부하 보내기:
+    python scripts/loadtest/run.py --rps 5 --duration 60 --endpoint chat
+    python scripts/loadtest/run.py --rps 2 --duration 60 --endpoint calendar --token <ID 토큰>
+
+두 엔드포인트 모두 인증이 필요합니다. --token / LOADTEST_TOKEN이 없으면
+.env의 TEST_FIREBASE_ID / TEST_FIREBASE_PASSWORD / TEST_FIREBASE_API_KEY로 발급받습니다.
+캘린더 엔드포인트는 토큰의 사용자가 캘린더 멤버여야 합니다.
+
+프롬프트는 요청마다 번호를 붙여 응답 캐시/중복 요청 합치기를 피합니다 (--repeat면 같은 프롬프트).
+캘린더 프롬프트는 로컬 빠른 파서가 처리하지 못하는 문구(일정 두 개)를 씁니다.
+빠른 파서가 처리하면 CLI를 부르지 않아 AI 경로의 부하가 측정되지 않기 때문이며,
+번호 접미사 유무와 관계없이 신뢰도가 기준(calendar_quick_parse_min_confidence)보다 낮게 나옵니다.
+서버 설정을 바꾸지 않아도 되도록 CALENDAR_QUICK_PARSE_ENABLED를 끄는 대신 프롬프트로 해결했습니다.
+프로세스 수는 서버와 같은 호스트에서 실행할 때만 셉니다 (/proc의 claude 명령줄).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+CHAT_PROMPT = "말랑아 오늘 저녁 메뉴 추천해줘"
+# 일정이 두 개라 빠른 파서가 거절함 (항상 AI 파싱 경로)
+CALENDAR_TEXT = "다음 주 화요일 오후 3시 치과 예약, 수요일 오전 10시 은행"
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """nearest-rank 분위수 (samples는 정렬된 상태)"""
+    if not samples:
+        return 0.0
+    index = min(max(int(q * len(samples) + 0.5) - 1, 0), len(samples) - 1)
+    return samples[index]
+
+
+async def firebase_token() -> str | None:
+    """테스트 계정으로 Firebase ID 토큰 발급 (설정이 없으면 None)"""
+    from app.config import get_settings
+
+    settings = get_settings()
+    if not all([
+        settings.test_firebase_id,
+        settings.test_firebase_password,
+        settings.test_firebase_api_key,
+    ]):
+        return None
+
+    url = (
+        "https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword"
+        f"?key={settings.test_firebase_api_key}"
+    )
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            url,
+            json={
+                "email": settings.test_firebase_id,
+                "password": settings.test_firebase_password,
+                "returnSecureToken": True,
+            },
+        )
+        response.raise_for_status()
+        return response.json()["idToken"]
+
+
+def count_cli_processes() -> int:
+    """이 호스트에서 실행 중인 claude CLI(가짜 포함) 프로세스 수"""
+    count = 0
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            cmdline = (entry / "cmdline").read_bytes().split(b"\0")
+        except OSError:
+            continue
+        if any(
+            part.endswith(b"claude") or part.endswith(b"fake_claude.py")
+            for part in cmdline[:2]
+        ) and b"--output-format" in cmdline:
+            count += 1
+    return count
+
+
+class LoadTest:
+    """요청 발생기 + 결과 집계"""
+
+    def __init__(self, args: argparse.Namespace, token: str | None):
+        self.args = args
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.latencies: dict[str, list[float]] = {}
+        self.statuses: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.process_samples: list[int] = []
+        self.server_samples: list[dict] = []
+        self._seq = 0
+
+    def _request(self) -> tuple[str, str, dict]:
+        self._seq += 1
+        suffix = "" if self.args.repeat else f" ({self._seq})"
+        endpoints = ["chat", "calendar"] if self.args.endpoint == "mixed" else [self.args.endpoint]
+        endpoint = endpoints[self._seq % len(endpoints)]
+        if endpoint == "chat":
+            return endpoint, "/ai/chat", {"prompt": CHAT_PROMPT + suffix}
+        return endpoint, "/calendar/ai/parse", {"text": CALENDAR_TEXT + suffix}
+
+    async def _send(self, client: httpx.AsyncClient) -> None:
+        endpoint, path, body = self._request()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started = time.perf_counter()
+        try:
+            response = await client.post(path, json=body, headers=self.headers)
+            status = str(response.status_code)
+            if response.status_code == 200 and endpoint == "calendar":
+                if not response.json().get("success"):
+                    status = "200-failed"
+        except httpx.TimeoutException:
+            status = "client-timeout"
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        finally:
+            self.in_flight -= 1
+        self.statuses[f"{endpoint} {status}"] += 1
+        self.latencies.setdefault(endpoint, []).append(time.perf_counter() - started)
+
+    async def _sample(self, client: httpx.AsyncClient, stop: asyncio.Event) -> None:
+        """1초마다 CLI 프로세스 수와 /health/ai 스케줄러/풀 상태 기록"""
+        while not stop.is_set():
+            self.process_samples.append(count_cli_processes())
+            try:
+                response = await client.get("/health/ai", timeout=2)
+                stats = response.json()
+                self.server_samples.append(
+                    {"scheduler": stats.get("scheduler"), "pool": stats.get("pool")}
+                )
+            except (httpx.HTTPError, ValueError):
+                pass
+            try:
+                await asyncio.wait_for(stop.wait(), 1)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> None:
+        interval = 1 / self.args.rps
+        timeout = httpx.Timeout(self.args.timeout)
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=100)
+        async with httpx.AsyncClient(
+            base_url=self.args.url, timeout=timeout, limits=limits
+        ) as client:
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(self._sample(client, stop))
+            tasks = []
+            started = time.perf_counter()
+            next_at = started
+            while next_at - started < self.args.duration:
+                tasks.append(asyncio.create_task(self._send(client)))
+                next_at += interval
+                await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+            sent_for = time.perf_counter() - started
+            await asyncio.gather(*tasks)
+            self.elapsed = time.perf_counter() - started
+            self.sent_for = sent_for
+            stop.set()
+            await sampler
+
+    def report(self) -> dict:
+        total = sum(self.statuses.values())
+        ok = sum(n for key, n in self.statuses.items() if key.endswith(" 200"))
+        result = {
+            "target_rps": self.args.rps,
+            "sent": total,
+            "offered_rps": round(total / self.sent_for, 2),
+            "throughput_rps": round(ok / self.elapsed, 2),
+            "elapsed_seconds": round(self.elapsed, 1),
+            "max_in_flight": self.max_in_flight,
+            "statuses": dict(sorted(self.statuses.items())),
+            "latency_ms": {},
+            "cli_processes": {
+                "max": max(self.process_samples, default=0),
+                "avg": round(sum(self.process_samples) / len(self.process_samples), 1)
+                if self.process_samples
+                else 0,
+            },
+        }
+        for endpoint, samples in self.latencies.items():
+            samples.sort()
+            result["latency_ms"][endpoint] = {
+                name: round(percentile(samples, q) * 1000)
+                for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+            } | {"max": round(samples[-1] * 1000)}
+        if self.server_samples:
+            result["server_last"] = self.server_samples[-1]
+        return result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="AI 엔드포인트 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8000", help="서버 주소")
+    parser.add_argument("--rps", type=float, default=2, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=30, help="요청을 보내는 시간 (초)")
+    parser.add_argument(
+        "--endpoint", choices=["chat", "calendar", "mixed"], default="chat", help="대상 엔드포인트"
+    )
+    parser.add_argument("--timeout", type=float, default=180, help="클라이언트 타임아웃 (초)")
+    parser.add_argument("--token", default=os.environ.get("LOADTEST_TOKEN"), help="Bearer 토큰")
+    parser.add_argument(
+        "--repeat", action="store_true", help="매번 같은 프롬프트 (캐시/중복 합치기 확인용)"
+    )
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    token = args.token
+    if token is None:
+        token = await firebase_token()
+        if token is None:
+            sys.exit("--token, LOADTEST_TOKEN 또는 TEST_FIREBASE_* 설정이 필요합니다")
+
+    test = LoadTest(args, token)
+    await test.run()
+    print(json.dumps(test.report(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
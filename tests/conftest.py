@@ -3,6 +3,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.config import get_settings
 from app.main import app
 from app.services.claude.dependencies import get_claude_service
 from app.services.calendar.dependencies import (
@@ -22,6 +23,12 @@ from tests.fakes import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_disk_response_cache(monkeypatch):
+    """테스트 중에는 AI 응답 디스크 캐시를 쓰지 않음"""
+    monkeypatch.setattr(get_settings(), "claude_cache_dir", None)
+
+
 @pytest.fixture
 def client():
     """FastAPI 테스트 클라이언트"""
@@ -19,6 +19,7 @@ from app.schemas.calendar import (
     CategoryInfo,
 )
 from app.services.calendar import NotFoundError, DuplicateError, ForbiddenError
+from app.services.calendar.pending import PendingEventDraft
 
 
 class FakeMemberService:
@@ -331,7 +332,7 @@ class FakePendingEvent:
     """Fake PendingEvent 모델"""
 
     id: UUID
-    event_data: list[dict]
+    event_data: dict
     source_text: str | None
     source_image_hash: str | None
     created_by: UUID
@@ -355,6 +356,7 @@ class FakePendingEventService:
         self._by_user: dict[str, list[UUID]] = {}
         self._member_by_uid: dict[str, UUID] = {}
         self._event_service = event_service
+        self.create_many_calls = 0
 
     def set_member_mapping(self, firebase_uid: str, member_id: UUID):
         """Firebase UID와 Member ID 매핑 설정"""
@@ -377,7 +379,7 @@ class FakePendingEventService:
 
         pending = FakePendingEvent(
             id=pending_id,
-            event_data=event_data,
+            event_data={"events": event_data},
             source_text=source_text,
             source_image_hash=source_image_hash,
             created_by=member_id,
@@ -395,9 +397,43 @@ class FakePendingEventService:
 
         return pending
 
+    def create_many(
+        self,
+        drafts: list[PendingEventDraft],
+        user_uid: str,
+        expires_minutes: int | None = None,
+    ) -> list[FakePendingEvent]:
+        self.create_many_calls += 1
+        return [
+            self.create(
+                event_data=draft.event_data,
+                user_uid=user_uid,
+                source_text=draft.source_text,
+                source_image_hash=draft.source_image_hash,
+                ai_message=draft.ai_message,
+                confidence=draft.confidence,
+                expires_minutes=expires_minutes,
+            )
+            for draft in drafts
+        ]
+
     def get_by_id(self, pending_id: UUID) -> FakePendingEvent | None:
         return self._pending.get(pending_id)
 
+    def find_by_image_hash(
+        self, source_image_hash: str, source_text: str | None = None
+    ) -> FakePendingEvent | None:
+        now = datetime.now(timezone.utc)
+        matches = [
+            p
+            for p in self._pending.values()
+            if p.source_image_hash == source_image_hash
+            and p.source_text == source_text
+            and p.status == "pending"
+            and p.expires_at > now
+        ]
+        return max(matches, key=lambda p: p.created_at, default=None)
+
     def get_pending_by_user(self, user_uid: str) -> list[FakePendingEvent]:
         pending_ids = self._by_user.get(user_uid, [])
         return [
@@ -434,7 +470,7 @@ class FakePendingEventService:
                     description=e.get("description"),
                     recurrence_rule=e.get("recurrence"),
                 )
-                for e in pending.event_data
+                for e in pending.event_data.get("events", [])
             ]
         )
 
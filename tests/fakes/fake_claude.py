@@ -1,6 +1,12 @@
 """Fake Claude 서비스"""
 
-from app.services.claude import ChatResponse, AIServiceProtocol
+import asyncio
+from typing import AsyncIterator
+
+from app.exceptions import TooManyRequestsError
+from app.services.claude import AIErrorType, ChatChunk, ChatResponse, AIServiceProtocol
+from app.services.claude.personas import PersonaType
+from app.services.claude.staging import StagedImage
 
 
 class FakeClaudeService:
@@ -17,11 +23,29 @@ class FakeClaudeService:
         self.persona_name = persona_name
         self._should_fail = False
         self._error_message = None
+        self._error_type: AIErrorType | None = None
         self._call_count = 0
         self._last_prompt = None
         self._last_image_base64 = None
+        self._last_user_id = None
+        self._last_image: StagedImage | None = None
+        self._queue_wait_ms = 0
+        self._truncated = False
+        self._queue_full_retry_after: int | None = None
         self._parsed_events: list[dict] | None = None
         self._ai_message: str | None = None
+        self._stats: dict = {}
+        self._stream_chunks: list[str] | None = None
+        self._delay = 0.0
+        self._lane_concurrency = 4
+
+    def set_lane_concurrency(self, concurrency: int):
+        """레인 동시 실행 예산 설정"""
+        self._lane_concurrency = concurrency
+
+    def set_stats(self, stats: dict):
+        """헬스 엔드포인트용 상태 설정"""
+        self._stats = stats
 
     def set_success(
         self,
@@ -30,29 +54,52 @@ class FakeClaudeService:
         persona_name: str = "말랑이",
         parsed_events: list[dict] | None = None,
         ai_message: str | None = None,
+        queue_wait_ms: int = 0,
+        truncated: bool = False,
     ):
         """성공 응답 설정"""
         self.response = response
         self.elapsed_ms = elapsed_ms
         self.persona_name = persona_name
+        self._queue_wait_ms = queue_wait_ms
+        self._truncated = truncated
         self._should_fail = False
         self._parsed_events = parsed_events
         self._ai_message = ai_message
 
-    def set_failure(self, error_message: str):
+    def set_failure(
+        self, error_message: str, error_type: AIErrorType = AIErrorType.CLI_ERROR
+    ):
         """실패 응답 설정"""
         self._should_fail = True
         self._error_message = error_message
+        self._error_type = error_type
 
     def set_no_trigger(self):
         """트리거 없음 응답 설정"""
-        self._should_fail = True
-        self._error_message = "No AI trigger detected"
+        self.set_failure("No AI trigger detected", AIErrorType.NO_TRIGGER)
 
     def set_timeout(self, timeout_seconds: int = 120):
         """타임아웃 응답 설정"""
-        self._should_fail = True
-        self._error_message = f"Request timed out after {timeout_seconds} seconds"
+        self.set_failure(
+            f"Request timed out after {timeout_seconds} seconds", AIErrorType.TIMEOUT
+        )
+
+    def set_unavailable(self, error_message: str = "AI service temporarily unavailable"):
+        """서비스 불가 (CLI 없음/서킷 열림) 응답 설정"""
+        self.set_failure(error_message, AIErrorType.SERVICE_UNAVAILABLE)
+
+    def set_stream_chunks(self, chunks: list[str]):
+        """chat_stream에서 내보낼 텍스트 조각 설정"""
+        self._stream_chunks = chunks
+
+    def set_delay(self, seconds: float):
+        """chat이 응답하기 전에 기다리는 시간 (동시 실행/취소 테스트용)"""
+        self._delay = seconds
+
+    def set_queue_full(self, retry_after: int = 5):
+        """대기열 가득 참 (429) 설정"""
+        self._queue_full_retry_after = retry_after
 
     def set_calendar_response(
         self,
@@ -84,16 +131,38 @@ class FakeClaudeService:
         """마지막 호출 이미지"""
         return self._last_image_base64
 
+    @property
+    def last_image(self) -> StagedImage | None:
+        """마지막 호출 업로드 이미지"""
+        return self._last_image
+
+    @property
+    def last_user_id(self) -> str | None:
+        """마지막 호출 사용자 UID"""
+        return self._last_user_id
+
     async def chat(
         self,
         prompt: str,
         timeout_seconds: int | None = None,
         image_base64: str | None = None,
+        user_id: str | None = None,
+        image: StagedImage | None = None,
     ) -> ChatResponse:
         """채팅 요청 (Fake)"""
         self._call_count += 1
         self._last_prompt = prompt
         self._last_image_base64 = image_base64
+        self._last_user_id = user_id
+        self._last_image = image
+        if self._delay:
+            await asyncio.sleep(self._delay)
+
+        if self._queue_full_retry_after is not None:
+            raise TooManyRequestsError(
+                "AI 요청이 많아 잠시 후 다시 시도해주세요",
+                retry_after=self._queue_full_retry_after,
+            )
 
         if self._should_fail:
             return ChatResponse(
@@ -101,7 +170,8 @@ class FakeClaudeService:
                 elapsed_ms=self.elapsed_ms,
                 success=False,
                 error=self._error_message,
-                persona_name=self.persona_name if "trigger" not in (self._error_message or "") else None,
+                error_type=self._error_type,
+                persona_name=self.persona_name if self._error_type != AIErrorType.NO_TRIGGER else None,
             )
 
         return ChatResponse(
@@ -111,4 +181,31 @@ class FakeClaudeService:
             persona_name=self.persona_name,
             parsed_events=self._parsed_events,
             ai_message=self._ai_message,
+            queue_wait_ms=self._queue_wait_ms,
+            truncated=self._truncated,
         )
+
+    async def chat_stream(
+        self,
+        prompt: str,
+        timeout_seconds: int | None = None,
+        image_base64: str | None = None,
+        user_id: str | None = None,
+        image: StagedImage | None = None,
+    ) -> AsyncIterator[ChatChunk]:
+        """스트리밍 채팅 요청 (Fake) - 설정된 조각들 후 최종 응답"""
+        response = await self.chat(prompt, timeout_seconds, image_base64, user_id, image)
+        if response.success:
+            for text in self._stream_chunks or [response.output]:
+                yield ChatChunk(text=text)
+            for event in response.parsed_events or []:
+                yield ChatChunk(event=event)
+        yield ChatChunk(response=response)
+
+    def lane_concurrency(self, persona_type: PersonaType) -> int:
+        """레인 동시 실행 예산 (Fake)"""
+        return self._lane_concurrency
+
+    def get_stats(self) -> dict:
+        """AI 백엔드 상태 (Fake)"""
+        return self._stats
@@ -0,0 +1,16 @@
+"""Fake 시계 (app.services.clock의 현재 시각 고정)"""
+
+from datetime import datetime
+
+from app.services import clock
+
+
+def freeze_clock(monkeypatch, now: datetime) -> None:
+    """clock.now_kst()/today_kst()가 now(timezone 포함)를 기준으로 동작하게 고정"""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz) if tz is not None else now.replace(tzinfo=None)
+
+    monkeypatch.setattr(clock, "datetime", FrozenDatetime)
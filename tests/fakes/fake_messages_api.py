@@ -0,0 +1,127 @@
+"""Fake Messages API 서버 (ClaudeAPIService 테스트용)
+
+로컬 포트에 실제 uvicorn 서버를 띄워 SSE 스트리밍 응답을 돌려줍니다.
+받은 요청 본문과 클라이언트 연결(포트)을 기록하므로 keep-alive 연결 재사용도 확인할 수 있습니다.
+
+Usage:
+    with FakeMessagesAPI() as api:
+        api.set_response("안녕")
+        monkeypatch.setattr(get_settings(), "claude_api_base_url", api.base_url)
+        ...
+        assert len(api.connections) == 1
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def _sse(data: dict) -> str:
+    return f"event: {data['type']}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class FakeMessagesAPI:
+    """스트리밍 Messages API 흉내 서버"""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.headers: list[dict] = []
+        self.connections: set[int] = set()
+        self._text = "안녕하세요"
+        self._chunk_size = 5
+        self._delay_seconds = 0.0
+        self._status_code = 200
+        self._stream_error: str | None = None
+        self._usage = {
+            "input_tokens": 10,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 500,
+        }
+
+        self.app = FastAPI()
+        self.app.post("/v1/messages")(self._messages)
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+        self.base_url = ""
+
+    def set_response(self, text: str, chunk_size: int = 5) -> None:
+        """성공 응답 텍스트 (chunk_size 글자씩 text_delta로 나눠 보냄)"""
+        self._text = text
+        self._chunk_size = chunk_size
+
+    def set_delay(self, seconds: float) -> None:
+        """첫 이벤트 전 지연 (타임아웃 테스트용)"""
+        self._delay_seconds = seconds
+
+    def set_status(self, status_code: int) -> None:
+        """HTTP 에러 응답 (예: 529 overloaded)"""
+        self._status_code = status_code
+
+    def set_stream_error(self, message: str) -> None:
+        """스트림 중간에 error 이벤트"""
+        self._stream_error = message
+
+    async def _messages(self, request: Request):
+        self.requests.append(await request.json())
+        self.headers.append(dict(request.headers))
+        self.connections.add(request.client.port)
+
+        if self._status_code != 200:
+            return JSONResponse(
+                {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}},
+                status_code=self._status_code,
+            )
+        return StreamingResponse(self._stream(), media_type="text/event-stream")
+
+    async def _stream(self):
+        if self._delay_seconds:
+            await asyncio.sleep(self._delay_seconds)
+        yield _sse({
+            "type": "message_start",
+            "message": {"id": "msg_fake", "role": "assistant", "usage": self._usage},
+        })
+        yield _sse({"type": "content_block_start", "index": 0, "content_block": {"type": "text"}})
+        for i in range(0, len(self._text), self._chunk_size):
+            yield _sse({
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": self._text[i : i + self._chunk_size]},
+            })
+            if self._stream_error:
+                yield _sse({
+                    "type": "error",
+                    "error": {"type": "api_error", "message": self._stream_error},
+                })
+                return
+        yield _sse({"type": "content_block_stop", "index": 0})
+        yield _sse({
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": len(self._text)},
+        })
+        yield _sse({"type": "message_stop"})
+
+    def __enter__(self) -> "FakeMessagesAPI":
+        config = uvicorn.Config(
+            self.app, host="127.0.0.1", port=0, log_level="warning", ws="none"
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 5
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Fake Messages API server did not start")
+            time.sleep(0.01)
+        port = self._server.servers[0].sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
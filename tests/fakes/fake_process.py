@@ -0,0 +1,90 @@
+"""Fake CLI 서브프로세스 (asyncio.create_subprocess_exec 대체용)"""
+
+import asyncio
+import json
+
+
+def result_line(text: str, is_error: bool = False, usage: dict | None = None) -> bytes:
+    """stream-json result 메시지 한 줄"""
+    message = {
+        "type": "result",
+        "subtype": "error_during_execution" if is_error else "success",
+        "is_error": is_error,
+        "result": text,
+    }
+    if usage is not None:
+        message["usage"] = usage
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def delta_line(text: str) -> bytes:
+    """stream-json 부분 메시지(text_delta) 한 줄"""
+    message = {
+        "type": "stream_event",
+        "event": {
+            "type": "content_block_delta",
+            "delta": {"type": "text_delta", "text": text},
+        },
+    }
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class FakeProcess:
+    """테스트용 Fake 프로세스
+
+    Usage:
+        process = FakeProcess([delta_line("안녕"), result_line("안녕")])
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            ...
+    """
+
+    def __init__(
+        self,
+        stdout_lines: list[bytes] | None = None,
+        stderr: bytes = b"",
+        returncode: int = 0,
+        hang: bool = False,
+    ):
+        # 실제로 존재할 수 없는 pid (프로세스 그룹 시그널이 다른 프로세스에 가지 않도록)
+        self.pid = 4_194_305
+        self.returncode: int | None = None
+        self._exit_code = returncode
+        self._hang = hang
+        self._killed = asyncio.Event()
+        self.kill_count = 0
+
+        self.stdout = asyncio.StreamReader()
+        for line in stdout_lines or []:
+            self.stdout.feed_data(line)
+        if not hang:
+            self.stdout.feed_eof()
+
+        self.stderr = asyncio.StreamReader()
+        self.stderr.feed_data(stderr)
+        self.stderr.feed_eof()
+
+    def finish(self, stdout_lines: list[bytes], returncode: int = 0):
+        """hang=True로 만든 프로세스에 출력을 보내고 정상 종료시킴"""
+        for line in stdout_lines:
+            self.stdout.feed_data(line)
+        self.stdout.feed_eof()
+        self.returncode = returncode
+        self._killed.set()
+
+    def kill(self):
+        self.kill_count += 1
+        self.returncode = -9
+        self._killed.set()
+        if not self.stdout.at_eof():
+            self.stdout.feed_eof()
+
+    def terminate(self):
+        self.kill()
+
+    async def wait(self) -> int:
+        if self.returncode is None:
+            if self._hang:
+                await self._killed.wait()
+            else:
+                self.returncode = self._exit_code
+        return self.returncode
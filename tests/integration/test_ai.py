@@ -1,12 +1,18 @@
 """AI 채팅 엔드포인트 통합 테스트"""
 
+import hashlib
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.config import get_settings
 from app.main import app
 from app.services.claude.dependencies import get_claude_service
 from app.dependencies.auth import get_current_user
 from app.dependencies.entities import FirebaseUser
+from app.dependencies.idempotency import get_idempotency_store
+from app.services.idempotency import IdempotencyStore
 from tests.fakes import FakeClaudeService
 
 
@@ -33,6 +39,15 @@ class TestAIChatEndpoint:
         assert data["truncated"] is False
         assert data["persona"] == "말랑이"
 
+    def test_chat_truncated_partial_response(self, client_with_fakes, fake_claude):
+        """타임아웃으로 잘린 부분 응답은 200 + truncated=true"""
+        fake_claude.set_success(response="옛날 옛적에", truncated=True)
+
+        response = client_with_fakes.post("/ai/chat", json={"prompt": "말랑아 이야기해줘"})
+
+        assert response.status_code == 200
+        assert response.json()["truncated"] is True
+
     def test_chat_timeout(self, client_with_fakes, fake_claude):
         """타임아웃 시 408 반환"""
         fake_claude.set_timeout(timeout_seconds=120)
@@ -61,7 +76,7 @@ class TestAIChatEndpoint:
 
     def test_chat_service_unavailable(self, client_with_fakes, fake_claude):
         """Claude CLI 없을 때 503 반환"""
-        fake_claude.set_failure("Claude CLI not found at: claude")
+        fake_claude.set_unavailable("Claude CLI not found at: claude")
 
         response = client_with_fakes.post(
             "/ai/chat",
@@ -85,6 +100,54 @@ class TestAIChatEndpoint:
         data = response.json()["detail"]
         assert data["error_type"] == "no_trigger"
 
+    def test_chat_queue_full(self, client_with_fakes, fake_claude):
+        """대기열이 가득 차면 429 + Retry-After 반환"""
+        fake_claude.set_queue_full(retry_after=7)
+
+        response = client_with_fakes.post(
+            "/ai/chat",
+            json={"prompt": "말랑아 test"},
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+
+    def test_chat_reports_queue_wait(self, client_with_fakes, fake_claude, fake_user):
+        """대기열 대기 시간과 사용자 UID 전달 확인"""
+        fake_claude.set_success(response="ok", queue_wait_ms=250)
+
+        response = client_with_fakes.post(
+            "/ai/chat",
+            json={"prompt": "말랑아 test"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["queue_wait_ms"] == 250
+        assert fake_claude.last_user_id == fake_user.uid
+
+    def test_chat_idempotency_key_replays(self, client_with_fakes, fake_claude):
+        """같은 Idempotency-Key로 재전송하면 Claude를 다시 호출하지 않음 (에러 응답은 보관 안 함)"""
+        store = IdempotencyStore()
+        app.dependency_overrides[get_idempotency_store] = lambda: store
+        headers = {"Idempotency-Key": "chat-1"}
+
+        fake_claude.set_timeout()
+        failed = client_with_fakes.post(
+            "/ai/chat", json={"prompt": "말랑아 test"}, headers=headers
+        )
+        assert failed.status_code == 408
+
+        fake_claude.set_success(response="ok")
+        responses = [
+            client_with_fakes.post("/ai/chat", json={"prompt": "말랑아 test"}, headers=headers)
+            for _ in range(2)
+        ]
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert responses[1].json() == responses[0].json()
+        assert responses[1].headers["Idempotent-Replayed"] == "true"
+        assert fake_claude.call_count == 2
+
     def test_chat_no_auth(self, client):
         """인증 없이 요청 시 403 반환"""
         response = client.post(
@@ -146,3 +209,155 @@ class TestAIChatEndpoint:
 
             assert response.status_code == 200
             assert response.json()["persona"] == expected_persona
+
+
+class TestAIChatUploadEndpoint:
+    """POST /ai/chat/upload (multipart) 테스트"""
+
+    def test_upload_with_image(self, client_with_fakes, fake_claude, fake_user):
+        """이미지 파일이 임시 파일로 스트리밍되어 서비스에 전달"""
+        fake_claude.set_success(response="고양이 사진이네!", persona_name="말랑이")
+        image = b"\x89PNG\r\n\x1a\n" + b"x" * 4096
+
+        response = client_with_fakes.post(
+            "/ai/chat/upload",
+            data={"prompt": "말랑아 이거 뭐야?", "timeout_seconds": "60"},
+            files={"image": ("cat.png", image, "image/png")},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["response"] == "고양이 사진이네!"
+        assert fake_claude.last_prompt == "말랑아 이거 뭐야?"
+        assert fake_claude.last_user_id == fake_user.uid
+        assert fake_claude.last_image.size == len(image)
+        assert fake_claude.last_image.sha256 == hashlib.sha256(image).hexdigest()
+        # 응답 후 임시 파일 정리
+        assert not os.path.exists(fake_claude.last_image.path)
+
+    def test_upload_without_image(self, client_with_fakes, fake_claude):
+        """이미지 없이 프롬프트만 보내도 동작"""
+        fake_claude.set_success(response="안녕!")
+
+        response = client_with_fakes.post(
+            "/ai/chat/upload",
+            data={"prompt": "말랑아 안녕"},
+            files={"image": ("", b"", "application/octet-stream")},
+        )
+
+        assert response.status_code == 200
+        assert fake_claude.last_image is None
+
+    def test_upload_image_too_large(self, client_with_fakes, fake_claude, monkeypatch):
+        """최대 크기를 넘는 이미지는 413"""
+        monkeypatch.setattr(get_settings(), "claude_max_image_bytes", 1024)
+
+        response = client_with_fakes.post(
+            "/ai/chat/upload",
+            data={"prompt": "말랑아 이거 뭐야?"},
+            files={"image": ("big.png", b"x" * 2048, "image/png")},
+        )
+
+        assert response.status_code == 413
+        assert fake_claude.call_count == 0
+
+    def test_upload_missing_prompt(self, client_with_fakes, fake_claude):
+        """프롬프트가 없으면 422"""
+        response = client_with_fakes.post(
+            "/ai/chat/upload",
+            files={"image": ("cat.png", b"png", "image/png")},
+        )
+
+        assert response.status_code == 422
+        assert fake_claude.call_count == 0
+
+    def test_upload_requires_multipart(self, client_with_fakes):
+        """JSON 본문은 415"""
+        response = client_with_fakes.post(
+            "/ai/chat/upload",
+            json={"prompt": "말랑아 안녕"},
+        )
+
+        assert response.status_code == 415
+
+    def test_upload_no_auth(self, client):
+        """인증 없이 요청 시 403 반환"""
+        response = client.post(
+            "/ai/chat/upload",
+            data={"prompt": "말랑아 안녕"},
+        )
+        assert response.status_code == 403
+
+
+class TestAIChatStreamEndpoint:
+    """POST /ai/chat/stream (SSE) 테스트"""
+
+    @staticmethod
+    def _parse_events(body: str) -> list[tuple[str, dict]]:
+        import json
+
+        events = []
+        for block in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.split("\n"))
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_success(self, client_with_fakes, fake_claude):
+        """delta 이벤트들 후 done 이벤트"""
+        fake_claude.set_success(response="안녕! 반가워", elapsed_ms=900)
+        fake_claude.set_stream_chunks(["안녕! ", "반가워"])
+
+        response = client_with_fakes.post(
+            "/ai/chat/stream",
+            json={"prompt": "말랑아 안녕"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._parse_events(response.text)
+        assert events[0] == ("delta", {"text": "안녕! "})
+        assert events[1] == ("delta", {"text": "반가워"})
+        name, data = events[2]
+        assert name == "done"
+        assert data["response"] == "안녕! 반가워"
+        assert data["elapsed_time_ms"] == 900
+        assert data["persona"] == "말랑이"
+
+    def test_stream_calendar_events_in_done(self, client_with_fakes, fake_claude):
+        """done 이벤트에 파싱된 일정 포함"""
+        fake_claude.set_calendar_response(
+            events=[
+                {
+                    "title": "치과",
+                    "start_time": "2026-01-23T15:00:00",
+                    "end_time": "2026-01-23T16:00:00",
+                }
+            ],
+            message="치과 일정이에요!",
+        )
+
+        response = client_with_fakes.post(
+            "/ai/chat/stream",
+            json={"prompt": "달력아 내일 3시 치과"},
+        )
+
+        events = self._parse_events(response.text)
+        name, data = events[-1]
+        assert name == "done"
+        assert data["persona"] == "달력이"
+        assert data["pending_events"][0]["title"] == "치과"
+        # 완성된 일정은 done 전에 event로도 전달
+        assert ("event", "치과") in [(n, d.get("title")) for n, d in events]
+
+    def test_stream_immediate_failure_uses_http_status(
+        self, client_with_fakes, fake_claude
+    ):
+        """첫 조각 전에 실패하면 일반 HTTP 에러"""
+        fake_claude.set_no_trigger()
+
+        response = client_with_fakes.post(
+            "/ai/chat/stream",
+            json={"prompt": "그냥 메시지"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error_type"] == "no_trigger"
@@ -1,17 +1,30 @@
 """Calendar AI 통합 테스트"""
 
+import base64
+import hashlib
+from contextlib import nullcontext
+from datetime import datetime, timezone
+
 import pytest
 from fastapi.testclient import TestClient
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from app.config import get_settings
 from app.main import app
+from app.routers.calendar import ai as calendar_ai_router
 from app.dependencies import get_current_user
 from app.dependencies.entities import FirebaseUser
+from app.dependencies.idempotency import get_idempotency_store
 from app.services.claude.dependencies import get_claude_service
 from app.services.calendar.dependencies import (
     get_member_service,
+    get_parse_job_manager,
     get_pending_event_service,
+    get_pending_event_service_factory,
 )
+from app.services.calendar.jobs import ParseJobManager
+from app.services.idempotency import IdempotencyStore
+from tests.fakes.fake_clock import freeze_clock
 from tests.fakes.fake_claude import FakeClaudeService
 from tests.fakes.fake_calendar import FakeMemberService, FakePendingEventService
 
@@ -48,6 +61,12 @@ def fake_pending_service():
     return FakePendingEventService()
 
 
+@pytest.fixture
+def ai_only(monkeypatch):
+    """로컬 파서를 끄고 항상 AI 파싱 경로 사용"""
+    monkeypatch.setattr(get_settings(), "calendar_quick_parse_enabled", False)
+
+
 @pytest.fixture
 def client_with_fakes(
     fake_user, fake_claude, fake_member_service, fake_pending_service
@@ -66,7 +85,7 @@ class TestCalendarAIParse:
     """POST /calendar/ai/parse 테스트"""
 
     def test_parse_success(
-        self, client_with_fakes, fake_claude, fake_member_service
+        self, client_with_fakes, fake_claude, fake_member_service, ai_only
     ):
         """일정 파싱 성공"""
         fake_claude.set_calendar_response(
@@ -94,6 +113,74 @@ class TestCalendarAIParse:
         assert data["events"][0]["title"] == "치과 예약"
         assert data["message"] == "내일 3시 치과 예약이에요!"
 
+    def test_parse_quick_path_skips_ai(self, client_with_fakes, fake_claude, fake_pending_service):
+        """간단한 문구는 로컬 파서로 처리 (AI 호출 없음)"""
+        response = client_with_fakes.post(
+            "/calendar/ai/parse",
+            json={"text": "매주 월수금 오후 4시 피아노"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["events"][0]["title"] == "피아노"
+        assert data["events"][0]["recurrence"] == "FREQ=WEEKLY;BYDAY=MO,WE,FR"
+        assert data["events"][0]["start_time"].endswith("T16:00:00")
+        assert fake_claude.call_count == 0
+        pending = fake_pending_service.get_by_id(UUID(data["pending_id"]))
+        assert pending.confidence >= 0.8
+
+    def test_parse_quick_path_uses_kst_today(self, client_with_fakes, fake_claude, monkeypatch):
+        """서버(UTC)가 아직 전날이어도 "내일"은 KST 기준으로 해석"""
+        # UTC 2026-10-16 20:30 = KST 2026-10-17 05:30
+        freeze_clock(monkeypatch, datetime(2026, 10, 16, 20, 30, tzinfo=timezone.utc))
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse",
+            json={"text": "내일 오후 3시 치과"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["events"][0]["start_time"] == "2026-10-18T15:00:00"
+        assert fake_claude.call_count == 0
+
+    def test_parse_server_timing_header(self, client_with_fakes, fake_claude, ai_only):
+        """단계별 소요 시간을 Server-Timing 헤더로 노출"""
+        fake_claude.set_calendar_response(
+            events=[
+                {
+                    "title": "치과",
+                    "start_time": "2026-01-23T15:00:00",
+                    "end_time": "2026-01-23T16:00:00",
+                    "all_day": False,
+                }
+            ],
+            message="ok",
+        )
+
+        response = client_with_fakes.post("/calendar/ai/parse", json={"text": "내일 치과"})
+
+        assert "db_insert;dur=" in response.headers["server-timing"]
+
+    def test_parse_low_confidence_falls_back_to_ai(self, client_with_fakes, fake_claude):
+        """여러 일정이 섞인 문구는 AI로"""
+        fake_claude.set_calendar_response(
+            events=[
+                {"title": "치과", "start_time": "2026-01-23T15:00:00", "end_time": "2026-01-23T16:00:00"},
+                {"title": "학원", "start_time": "2026-01-23T17:00:00", "end_time": "2026-01-23T18:00:00"},
+            ],
+            message="두 개 찾았어요",
+        )
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse",
+            json={"text": "내일 3시 치과 그리고 5시 학원"},
+        )
+
+        assert len(response.json()["events"]) == 2
+        assert fake_claude.call_count == 1
+
     def test_parse_with_image(self, client_with_fakes, fake_claude):
         """이미지 포함 파싱"""
         fake_claude.set_calendar_response(
@@ -122,7 +209,131 @@ class TestCalendarAIParse:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
-        assert fake_claude.last_image_base64 == test_image
+        # 라우터에서 한 번 디코딩해 임시 파일로 넘김 (해시는 디코딩한 바이트 기준)
+        assert fake_claude.last_image.sha256 == hashlib.sha256(
+            base64.b64decode(test_image)
+        ).hexdigest()
+
+    def test_parse_upload_with_image(self, client_with_fakes, fake_claude):
+        """multipart 업로드 이미지로 파싱"""
+        fake_claude.set_calendar_response(
+            events=[
+                {
+                    "title": "학예회",
+                    "start_time": "2026-01-24T10:00:00",
+                    "end_time": "2026-01-24T12:00:00",
+                    "all_day": False,
+                }
+            ],
+            message="가정통신문에서 학예회 일정을 찾았어요!",
+        )
+        image = b"\xff\xd8\xff\xe0" + b"j" * 1024
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/upload",
+            files={"image": ("notice.jpg", image, "image/jpeg")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["events"][0]["title"] == "학예회"
+        assert fake_claude.last_prompt == "달력아 이 이미지에서 일정을 추출해줘"
+        assert fake_claude.last_image.size == len(image)
+
+    def test_parse_upload_empty(self, client_with_fakes, fake_claude):
+        """텍스트와 이미지 둘 다 없으면 실패"""
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/upload",
+            files={"text": (None, "")},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["success"] is False
+        assert fake_claude.call_count == 0
+
+    def test_parse_same_image_reuses_pending(
+        self, client_with_fakes, fake_claude, fake_member_service, fake_pending_service
+    ):
+        """같은 사용자가 같은 이미지를 다시 올리면 기존 PendingEvent 반환 (AI 재호출 없음)"""
+        member = fake_member_service.get_by_firebase_uid("test-uid")
+        fake_pending_service.set_member_mapping("test-uid", member.id)
+        fake_claude.set_calendar_response(
+            events=[{"title": "학예회", "start_time": "2026-01-24T10:00:00", "end_time": "2026-01-24T12:00:00", "all_day": False}],
+            message="학예회 일정을 찾았어요!",
+        )
+        files = {"image": ("notice.jpg", b"\xff\xd8\xff" + b"n" * 512, "image/jpeg")}
+
+        first = client_with_fakes.post("/calendar/ai/parse/upload", files=files)
+        second = client_with_fakes.post("/calendar/ai/parse/upload", files=files)
+
+        assert first.status_code == second.status_code == 200
+        assert second.json()["pending_id"] == first.json()["pending_id"]
+        assert second.json()["events"][0]["title"] == "학예회"
+        assert fake_claude.call_count == 1
+        pending = fake_pending_service.get_by_id(UUID(first.json()["pending_id"]))
+        assert pending.source_image_hash == hashlib.sha256(files["image"][1]).hexdigest()
+
+    def test_parse_same_image_from_other_member(
+        self, client_with_fakes, fake_claude, fake_pending_service
+    ):
+        """다른 가족이 올린 같은 이미지는 파싱 결과만 복사해서 새 PendingEvent 생성"""
+        image = b"\x89PNG\r\n\x1a\n" + b"p" * 256
+        other = fake_pending_service.create(
+            event_data=[{"title": "운동회", "start_time": "2026-05-05T09:00:00", "end_time": "2026-05-05T15:00:00", "all_day": False}],
+            user_uid="other-parent-uid",
+            source_text="[이미지]",
+            source_image_hash=hashlib.sha256(image).hexdigest(),
+            ai_message="운동회가 있어요",
+        )
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse",
+            json={"image_base64": base64.b64encode(image).decode()},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["pending_id"] != str(other.id)
+        assert data["events"][0]["title"] == "운동회"
+        assert data["message"] == "운동회가 있어요"
+        assert fake_claude.call_count == 0
+
+    def test_parse_same_image_different_text_not_reused(
+        self, client_with_fakes, fake_claude, fake_pending_service
+    ):
+        """같은 이미지라도 요청 텍스트가 다르면 새로 파싱"""
+        image = b"\x89PNG\r\n\x1a\n" + b"q" * 256
+        fake_pending_service.create(
+            event_data=[{"title": "운동회", "start_time": "2026-05-05T09:00:00", "end_time": "2026-05-05T15:00:00", "all_day": False}],
+            user_uid="test-uid",
+            source_text="[이미지]",
+            source_image_hash=hashlib.sha256(image).hexdigest(),
+        )
+        fake_claude.set_calendar_response(
+            events=[{"title": "급식 없음", "start_time": "2026-05-06T00:00:00", "end_time": "2026-05-06T23:59:00", "all_day": True}],
+            message="급식 없는 날이에요",
+        )
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse",
+            json={"text": "급식 일정만", "image_base64": base64.b64encode(image).decode()},
+        )
+
+        assert response.json()["events"][0]["title"] == "급식 없음"
+        assert fake_claude.call_count == 1
+
+    def test_parse_invalid_base64_image(self, client_with_fakes, fake_claude):
+        """디코딩할 수 없는 이미지는 실패 응답"""
+        response = client_with_fakes.post(
+            "/calendar/ai/parse",
+            json={"image_base64": "!!!not-base64"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["success"] is False
+        assert fake_claude.call_count == 0
 
     def test_parse_no_events_found(self, client_with_fakes, fake_claude):
         """일정을 찾지 못한 경우"""
@@ -142,7 +353,7 @@ class TestCalendarAIParse:
         assert data["success"] is False
         assert "일정을 찾을 수 없습니다" in data["error"]
 
-    def test_parse_ai_failure(self, client_with_fakes, fake_claude):
+    def test_parse_ai_failure(self, client_with_fakes, fake_claude, ai_only):
         """AI 호출 실패"""
         fake_claude.set_failure("Claude API error")
 
@@ -176,6 +387,339 @@ class TestCalendarAIParse:
         assert "가족 구성원으로 등록되지 않았습니다" in response.json()["detail"]
 
 
+def _event(title: str, day: int, item: int | None = None) -> dict:
+    event = {
+        "title": title,
+        "start_time": f"2026-03-{day:02d}T10:00:00",
+        "end_time": f"2026-03-{day:02d}T11:00:00",
+        "all_day": False,
+    }
+    if item is not None:
+        event["item"] = item
+    return event
+
+
+class TestCalendarAIParseBatch:
+    """POST /calendar/ai/parse/batch 테스트"""
+
+    def test_batch_packs_texts_into_one_call(
+        self, client_with_fakes, fake_claude, fake_pending_service, ai_only
+    ):
+        """텍스트 여러 개를 AI 호출 한 번으로 파싱하고 한 번에 저장"""
+        fake_claude.set_calendar_response(
+            events=[_event("입학식", 2, item=1), _event("소풍", 10, item=2), _event("상담", 20, item=2)],
+            message="일정을 찾았어요",
+        )
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/batch",
+            json={"items": [{"id": "a", "text": "3월 2일 입학식"}, {"text": "소풍이랑 상담"}]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ai_calls"] == 1
+        assert fake_claude.call_count == 1
+        assert "[1] 3월 2일 입학식\n[2] 소풍이랑 상담" in fake_claude.last_prompt
+        assert [item["id"] for item in data["items"]] == ["a", "2"]
+        assert [e["title"] for e in data["items"][0]["events"]] == ["입학식"]
+        assert [e["title"] for e in data["items"][1]["events"]] == ["소풍", "상담"]
+        assert all(item["pending_id"] for item in data["items"])
+        assert fake_pending_service.create_many_calls == 1
+        # 저장된 일정에는 항목 번호가 남지 않음
+        pending = fake_pending_service.get_by_id(UUID(data["items"][0]["pending_id"]))
+        assert "item" not in pending.event_data["events"][0]
+
+    def test_batch_quick_path_and_invalid_items(self, client_with_fakes, fake_claude):
+        """로컬 파서로 충분한 항목은 AI 호출 없음, 빈 항목은 항목별 실패"""
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/batch",
+            json={"items": [{"text": "내일 오후 3시 치과"}, {"text": ""}]},
+        )
+
+        data = response.json()
+        assert data["ai_calls"] == 0
+        assert fake_claude.call_count == 0
+        assert data["items"][0]["success"] is True
+        assert data["items"][1]["success"] is False
+
+    def test_batch_untagged_response_reparsed_per_item(self, client_with_fakes, fake_claude, ai_only):
+        """항목 번호 없는 응답이면 항목별로 다시 파싱"""
+        fake_claude.set_calendar_response(events=[_event("회의", 3)], message="ok")
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/batch",
+            json={"items": [{"text": "회의 하나"}, {"text": "회의 둘"}]},
+        )
+
+        data = response.json()
+        assert data["ai_calls"] == 3
+        assert all(item["success"] for item in data["items"])
+
+    def test_batch_ai_failure_marks_items(self, client_with_fakes, fake_claude, ai_only):
+        fake_claude.set_failure("Claude API error")
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/batch",
+            json={"items": [{"text": "회의 하나"}, {"text": "회의 둘"}]},
+        )
+
+        data = response.json()
+        assert [item["success"] for item in data["items"]] == [False, False]
+        assert data["items"][0]["error"] == "Claude API error"
+
+    def test_batch_images_staged_within_lane_budget(
+        self, client_with_fakes, fake_claude, monkeypatch
+    ):
+        """이미지 항목은 달력이 레인 예산만큼만 동시에 디코딩/임시 저장"""
+        fake_claude.set_lane_concurrency(2)
+        fake_claude.set_calendar_response(events=[_event("운동회", 5)], message="ok")
+        fake_claude.set_delay(0.02)
+        stage = calendar_ai_router._stage_base64_image
+        live, peak = [0], [0]
+
+        def tracking_stage(image_base64):
+            image = stage(image_base64)
+            live[0] += 1
+            peak[0] = max(peak[0], live[0])
+            remove = image.remove
+
+            def tracked_remove():
+                live[0] -= 1
+                remove()
+
+            image.remove = tracked_remove
+            return image
+
+        monkeypatch.setattr(calendar_ai_router, "_stage_base64_image", tracking_stage)
+        images = [base64.b64encode(f"image-{i}".encode()).decode() for i in range(6)]
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/batch",
+            json={"items": [{"image_base64": image} for image in images]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["ai_calls"] == 6
+        assert peak[0] == 2
+        assert live[0] == 0
+
+    def test_batch_duplicate_ids(self, client_with_fakes):
+        response = client_with_fakes.post(
+            "/calendar/ai/parse/batch",
+            json={"items": [{"id": "x", "text": "a"}, {"id": "x", "text": "b"}]},
+        )
+
+        assert response.status_code == 422
+
+
+class TestCalendarAIIdempotency:
+    """Idempotency-Key 재전송 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_store(self):
+        store = IdempotencyStore()
+        app.dependency_overrides[get_idempotency_store] = lambda: store
+        return store
+
+    def test_resend_returns_same_pending(
+        self, client_with_fakes, fake_claude, fake_pending_service, ai_only
+    ):
+        """같은 키로 다시 보내면 AI 호출/PendingEvent 생성 없이 같은 응답"""
+        fake_claude.set_calendar_response(
+            events=[_event("치과", 23)],
+            message="치과 예약이에요!",
+        )
+        headers = {"Idempotency-Key": "parse-1"}
+
+        first = client_with_fakes.post(
+            "/calendar/ai/parse", json={"text": "내일 치과"}, headers=headers
+        )
+        second = client_with_fakes.post(
+            "/calendar/ai/parse", json={"text": "내일 치과"}, headers=headers
+        )
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert "Idempotent-Replayed" not in first.headers
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert fake_claude.call_count == 1
+        assert len(fake_pending_service.get_pending_by_user("test-uid")) == 1
+
+    def test_key_reused_for_other_body(self, client_with_fakes, fake_claude, ai_only):
+        fake_claude.set_calendar_response(events=[_event("치과", 23)], message="ok")
+        headers = {"Idempotency-Key": "parse-2"}
+        client_with_fakes.post("/calendar/ai/parse", json={"text": "내일 치과"}, headers=headers)
+
+        response = client_with_fakes.post(
+            "/calendar/ai/parse", json={"text": "모레 치과"}, headers=headers
+        )
+
+        assert response.status_code == 422
+        assert fake_claude.call_count == 1
+
+    def test_failed_parse_retried(self, client_with_fakes, fake_claude, ai_only):
+        """실패 응답은 보관하지 않으므로 같은 키로 재시도하면 다시 파싱"""
+        fake_claude.set_failure("Claude API error")
+        headers = {"Idempotency-Key": "parse-3"}
+        client_with_fakes.post("/calendar/ai/parse", json={"text": "내일 치과"}, headers=headers)
+
+        fake_claude.set_calendar_response(events=[_event("치과", 23)], message="ok")
+        response = client_with_fakes.post(
+            "/calendar/ai/parse", json={"text": "내일 치과"}, headers=headers
+        )
+
+        assert response.json()["success"] is True
+        assert "Idempotent-Replayed" not in response.headers
+        assert fake_claude.call_count == 2
+
+    def test_failed_batch_retried(self, client_with_fakes, fake_claude, ai_only):
+        """모든 항목이 실패한 배치는 보관하지 않으므로 같은 키로 재시도하면 다시 파싱"""
+        fake_claude.set_failure("Claude API error")
+        headers = {"Idempotency-Key": "batch-1"}
+        body = {"items": [{"text": "회의 하나"}, {"text": "회의 둘"}]}
+        client_with_fakes.post("/calendar/ai/parse/batch", json=body, headers=headers)
+        failed_calls = fake_claude.call_count
+
+        fake_claude.set_calendar_response(events=[_event("회의", 23)], message="ok")
+        response = client_with_fakes.post("/calendar/ai/parse/batch", json=body, headers=headers)
+
+        assert all(item["success"] for item in response.json()["items"])
+        assert "Idempotent-Replayed" not in response.headers
+        assert fake_claude.call_count > failed_calls
+
+    def test_partly_successful_batch_replayed(
+        self, client_with_fakes, fake_claude, fake_pending_service, ai_only
+    ):
+        """성공한 항목이 있는 배치는 보관 (재전송해도 PendingEvent를 다시 만들지 않음)"""
+        fake_claude.set_calendar_response(events=[_event("회의", 23)], message="ok")
+        headers = {"Idempotency-Key": "batch-2"}
+        body = {"items": [{"text": "회의 하나"}, {"text": ""}]}
+        first = client_with_fakes.post("/calendar/ai/parse/batch", json=body, headers=headers)
+
+        second = client_with_fakes.post("/calendar/ai/parse/batch", json=body, headers=headers)
+
+        assert [item["success"] for item in first.json()["items"]] == [True, False]
+        assert second.json() == first.json()
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert len(fake_pending_service.get_pending_by_user("test-uid")) == 1
+
+    def test_without_key_runs_every_time(self, client_with_fakes, fake_claude, ai_only):
+        fake_claude.set_calendar_response(events=[_event("치과", 23)], message="ok")
+
+        for _ in range(2):
+            client_with_fakes.post("/calendar/ai/parse", json={"text": "내일 치과"})
+
+        assert fake_claude.call_count == 2
+
+
+@pytest.fixture
+def job_manager():
+    return ParseJobManager(max_workers=2, max_pending=5)
+
+
+@pytest.fixture
+def job_client(client_with_fakes, fake_pending_service, job_manager):
+    """작업이 요청 사이에도 계속 돌도록 이벤트 루프를 유지하는 클라이언트"""
+    app.dependency_overrides[get_pending_event_service_factory] = (
+        lambda: lambda: nullcontext(fake_pending_service)
+    )
+    app.dependency_overrides[get_parse_job_manager] = lambda: job_manager
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestCalendarAIParseJobs:
+    """POST /calendar/ai/jobs, GET /calendar/ai/jobs/{id} 테스트"""
+
+    def test_submit_and_long_poll(self, job_client, fake_claude, fake_pending_service, ai_only):
+        """제출 즉시 202, 롱폴링으로 결과 수신"""
+        fake_claude.set_calendar_response(
+            events=[
+                {
+                    "title": "치과 예약",
+                    "start_time": "2026-01-23T15:00:00",
+                    "end_time": "2026-01-23T16:00:00",
+                    "all_day": False,
+                }
+            ],
+            message="내일 3시 치과 예약이에요!",
+        )
+
+        submitted = job_client.post("/calendar/ai/jobs", json={"text": "내일 오후 3시 치과"})
+
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+        assert submitted.json()["status"] in ("queued", "running", "done")
+
+        response = job_client.get(f"/calendar/ai/jobs/{job_id}", params={"wait": 5})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "done"
+        assert data["result"]["success"] is True
+        assert data["result"]["events"][0]["title"] == "치과 예약"
+        # 결과는 PendingEvent에 저장되어 /confirm으로 등록 가능
+        assert fake_pending_service.get_by_id(UUID(data["result"]["pending_id"])) is not None
+
+    def test_job_with_image(self, job_client, fake_claude):
+        """이미지는 작업이 끝날 때까지 유지된 뒤 삭제"""
+        fake_claude.set_calendar_response(
+            events=[
+                {
+                    "title": "회의",
+                    "start_time": "2026-01-24T10:00:00",
+                    "end_time": "2026-01-24T11:00:00",
+                    "all_day": False,
+                }
+            ],
+            message="찾았어요",
+        )
+        test_image = base64.b64encode(b"fake-image-bytes").decode()
+
+        submitted = job_client.post("/calendar/ai/jobs", json={"image_base64": test_image})
+        response = job_client.get(
+            f"/calendar/ai/jobs/{submitted.json()['job_id']}", params={"wait": 5}
+        )
+
+        assert response.json()["status"] == "done"
+        assert fake_claude.last_image.sha256 == hashlib.sha256(b"fake-image-bytes").hexdigest()
+
+    def test_job_not_visible_to_other_user(self, job_client, fake_claude, ai_only):
+        """다른 사용자의 작업은 404"""
+        fake_claude.set_failure("not needed")
+        job_id = job_client.post("/calendar/ai/jobs", json={"text": "회의"}).json()["job_id"]
+
+        app.dependency_overrides[get_current_user] = lambda: FirebaseUser(
+            uid="other-uid", email="other@example.com", name="Other", token_data={}
+        )
+        response = job_client.get(f"/calendar/ai/jobs/{job_id}")
+
+        assert response.status_code == 404
+
+    def test_unknown_job(self, job_client):
+        response = job_client.get(f"/calendar/ai/jobs/{uuid4()}")
+
+        assert response.status_code == 404
+
+    def test_submit_empty(self, job_client, fake_claude):
+        """텍스트/이미지 둘 다 없으면 400"""
+        response = job_client.post("/calendar/ai/jobs", json={})
+
+        assert response.status_code == 400
+        assert fake_claude.call_count == 0
+
+    def test_submit_too_many_pending(self, job_client, job_manager):
+        """미완료 작업이 상한에 닿으면 429"""
+        job_manager.max_pending = 0
+
+        response = job_client.post("/calendar/ai/jobs", json={"text": "회의"})
+
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+
+
 class TestCalendarAIConfirm:
     """POST /calendar/ai/confirm/{pending_id} 테스트"""
 
@@ -100,3 +100,45 @@ class TestDBHealthCheck:
         fake_db.execute.assert_called_once()
 
         app.dependency_overrides.clear()
+
+
+class TestAIHealthCheck:
+    """AI 백엔드 헬스체크 테스트"""
+
+    def test_ai_health_reports_stats(self, client_with_fakes, fake_claude):
+        """AI 서비스 상태를 그대로 노출"""
+        fake_claude.set_stats({"pool": {"size": 2, "idle": 1, "busy": 1}})
+
+        response = client_with_fakes.get("/health/ai")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["pool"]["idle"] == 1
+
+    def test_ai_health_degraded_when_circuit_open(self, client_with_fakes, fake_claude):
+        """서킷이 열려 있으면 degraded"""
+        fake_claude.set_stats({"circuit": {"state": "open", "retry_after_seconds": 12}})
+
+        response = client_with_fakes.get("/health/ai")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["circuit"]["state"] == "open"
+
+
+class TestMetrics:
+    """단계별 소요 시간 엔드포인트 테스트"""
+
+    def test_metrics_reports_stage_histograms(self, client):
+        from app.services.claude.metrics import record_stage
+
+        record_stage("spawn", 12.0)
+
+        response = client.get("/health/metrics")
+
+        assert response.status_code == 200
+        spawn = response.json()["stages"]["spawn"]
+        assert spawn["count"] >= 1
+        assert "p95_ms" in spawn
@@ -0,0 +1,54 @@
+"""일괄 파싱 헬퍼 단위 테스트"""
+
+from app.services.calendar.batch import build_batch_prompt, pack_items, split_events
+
+
+class TestPackItems:
+    """호출 단위 묶기 테스트"""
+
+    def test_respects_item_limit(self):
+        items = [(str(i), "수업") for i in range(5)]
+
+        batches = pack_items(items, max_items=2, max_chars=1000)
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_respects_char_limit(self):
+        items = [("a", "x" * 30), ("b", "x" * 30), ("c", "x" * 30)]
+
+        batches = pack_items(items, max_items=10, max_chars=70)
+
+        assert [[i for i, _ in b] for b in batches] == [["a", "b"], ["c"]]
+
+    def test_oversized_item_gets_own_batch(self):
+        batches = pack_items([("a", "x" * 100), ("b", "y")], max_items=10, max_chars=50)
+
+        assert [[i for i, _ in b] for b in batches] == [["a"], ["b"]]
+
+
+class TestSplitEvents:
+    """응답 일정의 항목별 분리 테스트"""
+
+    def test_split_by_item_tag(self):
+        events = [
+            {"title": "입학식", "item": 1},
+            {"title": "소풍", "item": "2"},
+            {"title": "방학식", "item": "[2]"},
+        ]
+
+        per_item, untagged = split_events(events, 2)
+
+        assert untagged == 0
+        assert per_item == [[{"title": "입학식"}], [{"title": "소풍"}, {"title": "방학식"}]]
+
+    def test_missing_or_invalid_tags_counted(self):
+        per_item, untagged = split_events([{"title": "a"}, {"title": "b", "item": 9}], 2)
+
+        assert per_item == [[], []]
+        assert untagged == 2
+
+    def test_prompt_numbers_items(self):
+        prompt = build_batch_prompt(["3월 2일 입학식", "4월 10일 소풍"])
+
+        assert prompt.startswith("달력아 ")
+        assert "[1] 3월 2일 입학식\n[2] 4월 10일 소풍" in prompt
@@ -0,0 +1,59 @@
+"""달력이 응답 JSON 점진 추출 테스트"""
+
+from app.services.claude.calendar_json import CalendarJSONExtractor, parse_calendar_output
+
+RESPONSE = (
+    "일정을 찾았어요!\n```json\n"
+    '{"events": [{"title": "치과 {정기}", "start_time": "2026-01-23T15:00:00"}, '
+    '{"title": "학원 \\"수학\\"", "tags": ["a", {"b": 1}]}], '
+    '"message": "두 개 등록할게요"}\n```'
+)
+
+
+class TestCalendarJSONExtractor:
+    """스트리밍 파싱"""
+
+    def test_char_by_char(self):
+        """한 글자씩 받아도 각 일정이 닫히는 순간 반환"""
+        extractor = CalendarJSONExtractor()
+        emitted = []
+        for i, ch in enumerate(RESPONSE):
+            for event in extractor.feed(ch):
+                emitted.append((i, event["title"]))
+
+        assert [title for _, title in emitted] == ["치과 {정기}", '학원 "수학"']
+        # 첫 일정은 전체 응답이 끝나기 훨씬 전에 나옴
+        assert emitted[0][0] < RESPONSE.index("학원")
+        assert extractor.done
+        events, message = extractor.result()
+        assert len(events) == 2
+        assert message == "두 개 등록할게요"
+
+    def test_bare_object(self):
+        events, message = parse_calendar_output('{"events": [{"title": "회의"}], "message": "ok"}')
+
+        assert events == [{"title": "회의"}]
+        assert message == "ok"
+
+    def test_truncated_keeps_completed_events(self):
+        """중간에 끊겨도 완성된 일정은 유지"""
+        extractor = CalendarJSONExtractor()
+        extractor.feed(RESPONSE[: RESPONSE.index("학원") + 3])
+
+        events, message = extractor.result()
+
+        assert [e["title"] for e in events] == ["치과 {정기}"]
+        assert message is None
+
+    def test_nested_events_key_ignored(self):
+        """최상위가 아닌 events 키는 무시"""
+        extractor = CalendarJSONExtractor()
+        emitted = extractor.feed('{"meta": {"events": [{"x": 1}]}, "events": [{"title": "A"}]}')
+
+        assert emitted == [{"title": "A"}]
+
+    def test_prose_without_json(self):
+        assert parse_calendar_output("일정이 없어요 {헤헤}") == ([], None)
+
+    def test_invalid_json(self):
+        assert parse_calendar_output("```json\n{invalid json}\n```") == ([], None)
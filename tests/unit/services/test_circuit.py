@@ -0,0 +1,160 @@
+"""CircuitBreaker 단위 테스트"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.claude.circuit import CircuitBreaker, CircuitState
+from app.services.claude.protocol import AIErrorType
+from app.services.claude.service import ClaudeService
+from tests.fakes.fake_process import FakeProcess, result_line
+
+
+class TestCircuitBreaker:
+    """상태 전이 테스트"""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()  # 연속 실패 초기화
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow() is False
+        assert breaker.retry_after > 0
+        assert breaker.stats()["rejected_total"] == 1
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # 시험 요청 진행 중
+
+        breaker.record_success(probe=True)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow() is True
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        assert breaker.allow() is True
+
+        breaker.reset_seconds = 30
+        breaker.record_failure(probe=True)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats()["opened_total"] == 2
+
+    def test_late_results_ignored_while_probing(self):
+        """열리기 전에 들어온 요청의 늦은 결과는 시험 요청 진행 중에 상태를 바꾸지 않음"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        assert breaker.allow() is True  # 시험 요청 시작
+
+        breaker.reset_seconds = 30
+        breaker.record_failure()  # 늦게 끝난 이전 요청의 실패
+        breaker.record_success()  # 늦게 끝난 이전 요청의 성공
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow() is False  # 시험 요청은 여전히 하나
+        assert breaker.stats()["opened_total"] == 1
+
+        breaker.record_success(probe=True)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats()["consecutive_failures"] == 0
+
+    def test_abandoned_probe_allows_another(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        assert breaker.allow() is True
+
+        breaker.abandon_probe()
+
+        assert breaker.allow() is True
+
+
+class TestClaudeServiceCircuit:
+    """ClaudeService 서킷 브레이커 연동 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        service = ClaudeService()
+        service.circuit = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_cli(self, service):
+        """연속 실패 후에는 프로세스를 띄우지 않고 service_unavailable"""
+        for _ in range(2):
+            process = FakeProcess(stderr=b"rate limited", returncode=1)
+            with patch("asyncio.create_subprocess_exec", return_value=process):
+                response = await service.chat("말랑아 hi", timeout_seconds=10)
+            assert response.error_type == AIErrorType.CLI_ERROR
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            response = await service.chat("말랑아 hi", timeout_seconds=10)
+
+        mock_exec.assert_not_called()
+        assert response.success is False
+        assert response.error_type == AIErrorType.SERVICE_UNAVAILABLE
+        assert service.get_stats()["circuit"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_closes_circuit(self, service):
+        service.circuit.record_failure()
+        service.circuit.record_failure()
+        service.circuit.reset_seconds = 0
+
+        process = FakeProcess([result_line("ok")])
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("말랑아 hi", timeout_seconds=10)
+
+        assert response.success is True
+        assert service.circuit.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_late_failure_does_not_reopen_during_probe(self, service):
+        """열리기 전에 들어온 요청이 시험 요청 도중 실패해도 시험 요청 결과로 판정"""
+        late = FakeProcess(stderr=b"rate limited", returncode=1, hang=True)
+        probe = FakeProcess(hang=True)
+        with patch("asyncio.create_subprocess_exec", side_effect=[late, probe]):
+            early = asyncio.create_task(service.chat("말랑아 먼저", timeout_seconds=10))
+            while service.scheduler.active < 1:
+                await asyncio.sleep(0.01)
+            # 그 사이 다른 요청들이 실패해 서킷이 열리고 대기 시간이 지남
+            service.circuit.record_failure()
+            service.circuit.record_failure()
+            service.circuit.reset_seconds = 0
+            probing = asyncio.create_task(service.chat("말랑아 시험", timeout_seconds=10))
+            while service.scheduler.active < 2:
+                await asyncio.sleep(0.01)
+            service.circuit.reset_seconds = 30
+
+            late.finish([], returncode=1)
+            assert (await early).error_type == AIErrorType.CLI_ERROR
+            assert service.circuit.state == CircuitState.HALF_OPEN
+
+            probe.finish([result_line("ok")])
+            assert (await probing).success is True
+
+        assert service.circuit.state == CircuitState.CLOSED
+        assert service.circuit.stats()["opened_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_errors_do_not_trip(self, service):
+        """호출어 없음/잘못된 이미지는 실패로 세지 않음"""
+        for _ in range(3):
+            await service.chat("그냥 메시지")
+            await service.chat("말랑아 hi", image_base64="!!!not-base64!!!")
+
+        assert service.circuit.state == CircuitState.CLOSED
@@ -0,0 +1,163 @@
+"""ClaudeAPIService 단위 테스트 - 로컬 Fake Messages API 서버 사용"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.config import get_settings
+from app.services.claude.api import KST, ClaudeAPIService, current_date_text
+from app.services.claude.protocol import AIErrorType
+from tests.fakes.fake_messages_api import FakeMessagesAPI
+
+
+@pytest.fixture
+def messages_api():
+    with FakeMessagesAPI() as api:
+        yield api
+
+
+@pytest.fixture
+async def service(messages_api, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "claude_api_base_url", messages_api.base_url)
+    monkeypatch.setattr(settings, "claude_api_key", "test-key")
+    service = ClaudeAPIService()
+    yield service
+    await service.shutdown()
+
+
+class TestClaudeAPIService:
+    """Messages API 호출 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_text(self, service, messages_api):
+        """text_delta 조각을 스트리밍하고 합친 텍스트를 응답으로"""
+        messages_api.set_response("안녕하세요 반가워요", chunk_size=4)
+
+        chunks = [c async for c in service.chat_stream("말랑아 안녕", timeout_seconds=10)]
+
+        assert [c.text for c in chunks if c.text] == ["안녕하세", "요 반가", "워요"]
+        response = chunks[-1].response
+        assert response.success is True
+        assert response.output == "안녕하세요 반가워요"
+        assert response.persona_name == "말랑이"
+
+    @pytest.mark.asyncio
+    async def test_request_body(self, service, messages_api):
+        """페르소나는 캐시 가능한 system 블록 + 오늘 날짜 블록, 사용자 메시지는 호출어 제외"""
+        await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        body = messages_api.requests[0]
+        assert body["stream"] is True
+        assert body["model"] == get_settings().claude_api_model
+        assert body["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert "말랑이" in body["system"][0]["text"]
+        # 오늘 날짜(KST)는 캐시 블록 뒤의 별도 블록
+        assert datetime.now(KST).strftime("%Y-%m-%d") in body["system"][1]["text"]
+        assert "cache_control" not in body["system"][1]
+        assert body["messages"] == [
+            {"role": "user", "content": [{"type": "text", "text": "안녕"}]}
+        ]
+        assert messages_api.headers[0]["x-api-key"] == "test-key"
+
+    def test_current_date_text_in_kst(self):
+        """UTC로 저녁이면 KST로는 다음 날 새벽"""
+        now = datetime(2026, 10, 16, 20, 30, tzinfo=timezone.utc)
+
+        assert current_date_text(now) == "현재 날짜와 시각: 2026-10-17 (토요일) 05:30 KST"
+
+    @pytest.mark.asyncio
+    async def test_image_sent_as_base64_block(self, service, messages_api, monkeypatch):
+        """이미지는 파일 경로 대신 image 블록으로"""
+        import base64
+
+        monkeypatch.setattr(service, "image_executor", None)
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+        await service.chat(
+            "말랑아 이거 봐",
+            timeout_seconds=10,
+            image_base64=base64.b64encode(png).decode(),
+        )
+
+        content = messages_api.requests[0]["messages"][0]["content"]
+        assert content[0]["type"] == "image"
+        assert content[0]["source"]["media_type"] == "image/png"
+        assert base64.b64decode(content[0]["source"]["data"]) == png
+        assert content[1] == {"type": "text", "text": "이거 봐"}
+
+    @pytest.mark.asyncio
+    async def test_calendar_events_parsed(self, service, messages_api):
+        """달력이 응답은 CLI 백엔드와 같은 방식으로 일정 파싱"""
+        messages_api.set_response(
+            '```json\n{"events": [{"title": "치과", "start_time": "2026-01-23T15:00:00"}], '
+            '"message": "등록할게요"}\n```',
+            chunk_size=7,
+        )
+
+        response = await service.chat("달력아 내일 3시 치과", timeout_seconds=10)
+
+        assert response.success is True
+        assert response.parsed_events[0]["title"] == "치과"
+        assert response.ai_message == "등록할게요"
+
+    @pytest.mark.asyncio
+    async def test_connection_reused(self, service, messages_api):
+        """연속 요청은 keep-alive 연결 하나를 재사용"""
+        for i in range(3):
+            response = await service.chat(f"말랑아 안녕 {i}", timeout_seconds=10)
+            assert response.success is True
+
+        assert len(messages_api.requests) == 3
+        assert len(messages_api.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_usage_recorded(self, service):
+        """message_start/message_delta 사용량 합산"""
+        await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        usage = service.get_stats()["usage"]["mallangi"]
+        assert usage["cache_read_input_tokens"] == 500
+        assert usage["output_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_http_error(self, service, messages_api):
+        """HTTP 에러 상태는 실패 응답 (서킷 브레이커가 세는 에러)"""
+        messages_api.set_status(529)
+
+        response = await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        assert response.success is False
+        assert response.error_type == AIErrorType.CLI_ERROR
+        assert "529" in response.error
+        assert service.get_stats()["api"]["errors_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_error_event(self, service, messages_api):
+        """스트림 중 error 이벤트는 실패 응답"""
+        messages_api.set_stream_error("Internal server error")
+
+        response = await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        assert response.success is False
+        assert response.error == "Internal server error"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, service, messages_api):
+        """첫 이벤트가 타임아웃 안에 오지 않으면 timeout"""
+        messages_api.set_delay(3)
+
+        response = await service.chat("말랑아 안녕", timeout_seconds=1)
+
+        assert response.success is False
+        assert response.error_type == AIErrorType.TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_stats(self, service):
+        """헬스 엔드포인트에 백엔드 종류와 API 상태 표시"""
+        await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        stats = service.get_stats()
+        assert stats["backend"] == "api"
+        assert stats["pool"] is None
+        assert stats["api"]["requests_total"] == 1
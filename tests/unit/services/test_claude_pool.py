@@ -0,0 +1,206 @@
+"""ClaudeWorkerPool 단위 테스트 - 실제 서브프로세스로 stream-json 흉내"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from app.services.claude.pool import ClaudeWorkerPool, WorkerError
+
+# stdin의 user 메시지마다 result 메시지를 출력하는 가짜 CLI
+FAKE_STREAM_CLI = textwrap.dedent(
+    """
+    import json, sys, time
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        text = message["message"]["content"][0]["text"]
+        if text == "crash":
+            sys.stderr.write("boom")
+            sys.exit(3)
+        if text == "hang":
+            time.sleep(30)
+        print(json.dumps({"type": "system", "subtype": "init"}), flush=True)
+        print(json.dumps({
+            "type": "result",
+            "subtype": "success",
+            "is_error": False,
+            "result": "echo: " + text,
+        }), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def fake_cli(tmp_path):
+    script = tmp_path / "fake_stream_cli.py"
+    script.write_text(FAKE_STREAM_CLI)
+    return [sys.executable, str(script)]
+
+
+class TestClaudeWorkerPool:
+    """워커 풀 대여/반납/교체 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_min_size(self, fake_cli):
+        """start 시 min_size만큼 워커를 미리 띄움"""
+        pool = ClaudeWorkerPool(fake_cli, min_size=2, max_size=3)
+        await pool.start()
+        try:
+            stats = pool.stats()
+            assert stats["idle"] == 2
+            assert stats["spawned_total"] == 2
+        finally:
+            await pool.shutdown(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_lease_round_trip(self, fake_cli):
+        """대여한 워커로 메시지 전송 후 result 수신"""
+        pool = ClaudeWorkerPool(fake_cli, min_size=1, max_size=1)
+        await pool.start()
+        try:
+            async with pool.lease() as worker:
+                await worker.send("안녕")
+                result = await worker.read_result()
+
+            assert result.text == "echo: 안녕"
+            assert result.is_error is False
+        finally:
+            await pool.shutdown(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_requests(self, fake_cli):
+        """max_requests_per_worker 도달 시 새 워커로 교체"""
+        pool = ClaudeWorkerPool(
+            fake_cli, min_size=1, max_size=1, max_requests_per_worker=2
+        )
+        await pool.start()
+        try:
+            pids = []
+            for i in range(3):
+                async with pool.lease() as worker:
+                    await worker.send(f"msg {i}")
+                    await worker.read_result()
+                    pids.append(worker.pid)
+
+            assert pids[0] == pids[1]
+            assert pids[2] != pids[1]
+            assert pool.stats()["recycled_total"] == 1
+        finally:
+            await pool.shutdown(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_raises_and_is_replaced(self, fake_cli):
+        """워커가 죽으면 WorkerError 후 교체"""
+        pool = ClaudeWorkerPool(fake_cli, min_size=1, max_size=1)
+        await pool.start()
+        try:
+            with pytest.raises(WorkerError) as exc_info:
+                async with pool.lease() as worker:
+                    await worker.send("crash")
+                    await worker.read_result()
+            assert "boom" in str(exc_info.value)
+
+            async with pool.lease() as worker:
+                await worker.send("again")
+                result = await worker.read_result()
+            assert result.text == "echo: again"
+        finally:
+            await pool.shutdown(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_lease_kills_worker(self, fake_cli):
+        """타임아웃으로 취소된 워커는 강제 종료"""
+        pool = ClaudeWorkerPool(
+            fake_cli, min_size=1, max_size=1, max_requests_per_worker=5
+        )
+        await pool.start()
+        try:
+            holder = {}
+
+            async def run():
+                async with pool.lease() as worker:
+                    holder["worker"] = worker
+                    await worker.send("hang")
+                    await worker.read_result()
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(run(), timeout=0.5)
+
+            worker = holder["worker"]
+            assert worker.broken is True
+            await asyncio.wait_for(worker.process.wait(), timeout=5)
+            assert worker.alive is False
+        finally:
+            await pool.shutdown(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_failed_spawn_wakes_waiting_lease(self, fake_cli):
+        """워커 생성이 실패하면 자리가 빈 것을 기다리던 대여 요청이 바로 이어받음"""
+        pool = ClaudeWorkerPool(fake_cli, min_size=0, max_size=1)
+        spawn = pool._spawn
+        release_failure = asyncio.Event()
+
+        async def failing_spawn():
+            await release_failure.wait()
+            pool._spawn = spawn
+            raise OSError("spawn failed")
+
+        pool._spawn = failing_spawn
+
+        async def lease_once():
+            async with pool.lease() as worker:
+                await worker.send("hello")
+                return await worker.read_result()
+
+        first = asyncio.create_task(lease_once())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(lease_once())
+        await asyncio.sleep(0.05)
+        release_failure.set()
+
+        try:
+            with pytest.raises(OSError):
+                await first
+            result = await asyncio.wait_for(second, timeout=5)
+            assert result.text == "echo: hello"
+        finally:
+            await pool.shutdown(timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_shutdown_rejects_new_leases(self, fake_cli):
+        """shutdown 이후 대여 요청은 실패"""
+        pool = ClaudeWorkerPool(fake_cli, min_size=1, max_size=1)
+        await pool.start()
+        await pool.shutdown(timeout=1)
+
+        assert pool.stats()["size"] == 0
+        with pytest.raises(WorkerError):
+            async with pool.lease():
+                pass
+
+
+class TestClaudeServiceWithPool:
+    """워커 풀을 사용하는 ClaudeService.chat 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_chat_uses_pooled_worker(self, fake_cli):
+        """풀이 설정되면 새 프로세스 대신 대기 워커 사용"""
+        from app.services.claude.personas import PersonaType
+        from app.services.claude.service import ClaudeService
+
+        service = ClaudeService()
+        service.pools = {
+            PersonaType.MALLANGI: ClaudeWorkerPool(fake_cli, min_size=1, max_size=1)
+        }
+        await service.start()
+        try:
+            response = await service.chat("말랑아 안녕", timeout_seconds=10)
+
+            assert response.success is True
+            assert response.output.startswith("echo: 안녕")
+            assert response.persona_name == "말랑이"
+            assert service.get_stats()["pool"]["spawned_total"] >= 1
+        finally:
+            await service.shutdown()
@@ -1,9 +1,18 @@
 """ClaudeService 단위 테스트 - 에러 경로"""
 
+import asyncio
+import signal
+
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch
 
+from app.config import get_settings
+from app.services.claude.hedge import HedgeBudget
+from app.services.claude.latency import LatencyTracker
+from app.services.claude.limits import ResourceLimits
+from app.services.claude.personas import PersonaType, get_system_prompt
 from app.services.claude.service import ClaudeService
+from tests.fakes.fake_process import FakeProcess, delta_line, result_line
 
 
 class TestClaudeServiceErrors:
@@ -43,11 +52,7 @@ class TestClaudeServiceErrors:
     @pytest.mark.asyncio
     async def test_process_non_zero_exit_code(self, service):
         """CLI가 0이 아닌 종료 코드 반환 시"""
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(
-            return_value=(b"", b"CLI error: invalid argument")
-        )
+        mock_process = FakeProcess(stderr=b"CLI error: invalid argument", returncode=1)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             response = await service.chat("말랑아 테스트", timeout_seconds=10)
@@ -58,31 +63,95 @@ class TestClaudeServiceErrors:
     @pytest.mark.asyncio
     async def test_timeout_kills_process(self, service):
         """타임아웃 시 프로세스 종료 확인"""
-        import asyncio
-
-        mock_process = AsyncMock()
-        mock_process.kill = MagicMock()
-        mock_process.wait = AsyncMock()
-        mock_process.communicate = AsyncMock(
-            side_effect=asyncio.TimeoutError()
-        )
+        mock_process = FakeProcess(hang=True)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             response = await service.chat("말랑아 테스트", timeout_seconds=1)
 
             assert response.success is False
             assert "timed out" in response.error.lower()
-            mock_process.kill.assert_called_once()
+            assert mock_process.kill_count == 1
+        # 타임아웃은 실행 시간이 아니라 중도 절단 표본으로 기록
+        assert service.latency.stats()["mallangi"]["text"]["timed_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_partial_output(self, service):
+        """타임아웃 전까지 받은 텍스트는 truncated 응답으로 반환 (서킷에는 실패로 기록)"""
+        process = FakeProcess([delta_line("Once upon "), delta_line("a time")], hang=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("마이콜아 tell me a story", timeout_seconds=1)
+
+        assert response.success is True
+        assert response.truncated is True
+        assert response.output == "Once upon a time"
+        assert response.error_type == "timeout"
+        assert process.kill_count == 1
+        assert service.circuit.stats()["consecutive_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_calendar_timeout_keeps_completed_events(self, service):
+        """달력이는 타임아웃 전에 완성된 일정만 살림"""
+        partial = '{"events": [{"title": "치과", "start_time": "2026-03-02T15:00:00"}, {"title": "피'
+        process = FakeProcess([delta_line(partial)], hang=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("달력아 이번주 일정", timeout_seconds=1)
+
+        assert response.success is True
+        assert response.truncated is True
+        assert [e["title"] for e in response.parsed_events] == ["치과"]
+
+    @pytest.mark.asyncio
+    async def test_output_cap_truncates(self, service, monkeypatch):
+        """출력 크기 상한을 넘으면 CLI를 멈추고 상한까지만 반환"""
+        monkeypatch.setattr(service.settings, "claude_max_output_chars", 8)
+        process = FakeProcess([delta_line("말랑말랑 "), delta_line("안녕 안녕")], hang=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            chunks = [c async for c in service.chat_stream("말랑아 길게 말해줘")]
+
+        assert "".join(c.text for c in chunks[:-1]) == "말랑말랑 안녕 "
+        response = chunks[-1].response
+        assert response.success is True
+        assert response.truncated is True
+        assert response.error_type is None
+        assert response.output == "말랑말랑 안녕 "
+        assert process.kill_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stdout_cap_reports_resource_limit(self, service, monkeypatch):
+        """stdout이 상한을 넘으면 더 읽지 않고 CLI를 종료, resource_limit 에러"""
+        monkeypatch.setattr(service.settings, "claude_max_stdout_bytes", 200)
+        process = FakeProcess([delta_line("가" * 40), delta_line("나" * 40)], hang=True)
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("말랑아 길게 말해줘", timeout_seconds=10)
+
+        assert response.success is False
+        assert response.error_type == "resource_limit"
+        assert "200 bytes" in response.error
+        assert process.kill_count == 1
+        assert service.get_stats()["limit_exceeded_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cpu_limit_exit_reports_resource_limit(self, service):
+        """RLIMIT_CPU를 넘어 SIGXCPU로 죽은 CLI는 resource_limit 에러"""
+        service.limits = ResourceLimits(cpu_seconds=30)
+        process = FakeProcess([delta_line("말랑")], returncode=-signal.SIGXCPU)
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as spawn:
+            response = await service.chat("말랑아 테스트", timeout_seconds=10)
+
+        assert response.error_type == "resource_limit"
+        assert response.error == "Claude CLI exceeded CPU time limit (30s)"
+        assert spawn.call_args.kwargs["preexec_fn"] is not None
 
     @pytest.mark.asyncio
     async def test_stderr_decode_error_handling(self, service):
         """stderr 디코딩 에러 처리 (잘못된 UTF-8)"""
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
         # Invalid UTF-8 bytes
-        mock_process.communicate = AsyncMock(
-            return_value=(b"", b"\xff\xfe invalid utf-8")
-        )
+        mock_process = FakeProcess(stderr=b"\xff\xfe invalid utf-8", returncode=1)
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             response = await service.chat("말랑아 테스트", timeout_seconds=10)
@@ -90,3 +159,265 @@ class TestClaudeServiceErrors:
             assert response.success is False
             # Should not raise, should handle gracefully
             assert response.error is not None
+
+
+class TestClaudeServiceStreaming:
+    """stream-json 출력 처리 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return ClaudeService()
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_deltas_then_response(self, service):
+        """텍스트 조각을 먼저 내보내고 마지막에 최종 응답"""
+        process = FakeProcess(
+            [delta_line("안"), delta_line("녕!"), result_line("안녕!")]
+        )
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            chunks = [c async for c in service.chat_stream("말랑아 인사해줘")]
+
+        assert [c.text for c in chunks[:-1]] == ["안", "녕!"]
+        final = chunks[-1].response
+        assert final.success is True
+        assert final.output == "안녕!"
+        assert final.persona_name == "말랑이"
+
+    @pytest.mark.asyncio
+    async def test_chat_returns_result_text(self, service):
+        """chat()은 최종 result 텍스트만 반환"""
+        process = FakeProcess([delta_line("hi"), result_line("hi there")])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("말랑아 hi", timeout_seconds=10)
+
+        assert response.success is True
+        assert response.output == "hi there"
+
+    @pytest.mark.asyncio
+    async def test_calendar_response_parsed(self, service):
+        """달력이 응답은 stream-json result에서 JSON 파싱"""
+        output = '```json\n{"events": [{"title": "치과"}], "message": "등록할게요"}\n```'
+        process = FakeProcess([result_line(output)])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("달력아 내일 3시 치과", timeout_seconds=10)
+
+        assert response.parsed_events == [{"title": "치과"}]
+        assert response.ai_message == "등록할게요"
+
+    @pytest.mark.asyncio
+    async def test_calendar_events_streamed_as_completed(self, service):
+        """달력이 일정은 JSON이 다 오기 전에 완성된 것부터 event 조각으로 전달"""
+        output = (
+            '```json\n{"events": [{"title": "치과"}, {"title": "학원"}], '
+            '"message": "두 개 찾았어요"}\n```'
+        )
+        deltas = [output[:30], output[30:50], output[50:]]
+        process = FakeProcess([delta_line(d) for d in deltas] + [result_line(output)])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            chunks = [c async for c in service.chat_stream("달력아 일정 정리해줘")]
+
+        kinds = [
+            "event" if c.event else "response" if c.response else "text" for c in chunks
+        ]
+        # 첫 일정은 두 번째 텍스트 조각 직후, 나머지 텍스트보다 먼저 도착
+        assert kinds == ["text", "text", "event", "text", "event", "response"]
+        assert [c.event["title"] for c in chunks if c.event] == ["치과", "학원"]
+        assert chunks[-1].response.parsed_events == [{"title": "치과"}, {"title": "학원"}]
+
+    @pytest.mark.asyncio
+    async def test_error_result(self, service):
+        """is_error result는 실패로 처리"""
+        process = FakeProcess([result_line("rate limited", is_error=True)])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            response = await service.chat("말랑아 hi", timeout_seconds=10)
+
+        assert response.success is False
+        assert "rate limited" in response.error
+
+    @pytest.mark.asyncio
+    async def test_no_trigger_stream(self, service):
+        """호출어가 없으면 실패 응답 하나만 내보냄"""
+        chunks = [c async for c in service.chat_stream("그냥 메시지")]
+
+        assert len(chunks) == 1
+        assert chunks[0].response.success is False
+
+
+class TestClaudeServiceSystemPrompt:
+    """페르소나 시스템 프롬프트 전달 및 토큰 사용량 지표 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return ClaudeService()
+
+    @pytest.mark.asyncio
+    async def test_persona_prompt_passed_as_system_prompt(self, service):
+        """페르소나 지시사항은 -p 메시지가 아닌 --append-system-prompt로 전달"""
+        process = FakeProcess([result_line("ok")])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+            await service.chat("달력아 내일 3시 치과", timeout_seconds=10)
+
+        command = list(mock_exec.call_args.args)
+        system_prompt = get_system_prompt(PersonaType.CALENDAR)
+        assert command[command.index("--append-system-prompt") + 1] == system_prompt
+        assert command[command.index("-p") + 1] == "내일 3시 치과"
+
+    @pytest.mark.asyncio
+    async def test_usage_recorded_per_persona(self, service):
+        """result의 usage를 페르소나별로 누적"""
+        usage = {
+            "input_tokens": 20,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 380,
+            "output_tokens": 50,
+        }
+        for _ in range(2):
+            process = FakeProcess([result_line("ok", usage=usage)])
+            with patch("asyncio.create_subprocess_exec", return_value=process):
+                await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        stats = service.get_stats()["usage"]
+        assert stats["mallangi"]["requests"] == 2
+        assert stats["mallangi"]["input_tokens"] == 40
+        assert stats["mallangi"]["avg_input_tokens"] == 400.0
+        assert stats["mallangi"]["cache_read_ratio"] == 0.95
+
+
+class TestClaudeServiceLanes:
+    """페르소나별 스케줄러 레인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_persona_runs_in_its_lane(self):
+        """달력이는 calendar 레인, 나머지 페르소나는 기본(chat) 레인"""
+        service = ClaudeService()
+
+        for prompt in ("달력아 내일 3시 치과", "루팡아 안녕"):
+            process = FakeProcess([result_line("ok")])
+            with patch("asyncio.create_subprocess_exec", return_value=process):
+                await service.chat(prompt, timeout_seconds=10)
+
+        lanes = service.get_stats()["scheduler"]["lanes"]
+        assert lanes["calendar"]["completed_total"] == 1
+        assert lanes["chat"]["completed_total"] == 1
+        assert lanes["calendar"]["max_concurrency"] == 1
+
+    def test_lane_budgets_follow_max_concurrency(self, monkeypatch):
+        """레인 예산은 claude_max_concurrency를 레인 비율대로 나눈 값"""
+        monkeypatch.setattr(get_settings(), "claude_max_concurrency", 8)
+
+        scheduler = ClaudeService().get_stats()["scheduler"]
+
+        assert scheduler["lanes"]["calendar"]["max_concurrency"] == 2
+        assert scheduler["lanes"]["chat"]["max_concurrency"] == 6
+        assert scheduler["max_concurrency"] == 8
+
+    def test_lane_concurrency_by_persona(self, monkeypatch):
+        """페르소나가 실행될 레인의 예산 (배치 이미지 동시 처리 수 등에 사용)"""
+        monkeypatch.setattr(get_settings(), "claude_max_concurrency", 8)
+        service = ClaudeService()
+
+        assert service.lane_concurrency(PersonaType.CALENDAR) == 2
+        assert service.lane_concurrency(PersonaType.MALLANGI) == 6
+
+
+class TestClaudeServiceHedging:
+    """첫 출력이 늦은 요청의 헤지 테스트"""
+
+    CALENDAR_OUTPUT = '{"events": [{"title": "치과"}], "message": "등록할게요"}'
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "claude_hedge_enabled", True)
+        monkeypatch.setattr(get_settings(), "claude_hedge_min_delay_seconds", 0)
+        service = ClaudeService()
+        service.hedge = HedgeBudget(ratio=1, burst=1)
+        # 평소 첫 출력은 50ms 안에 도착
+        service.first_output = LatencyTracker(min_samples=1)
+        service.first_output.record("calendar", False, 0.05)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_stalled_request_hedged(self, service):
+        """첫 출력이 늦으면 한 번 더 실행하고 먼저 응답한 쪽 사용 (멈춘 쪽은 종료)"""
+        stalled = FakeProcess(hang=True)
+        fast = FakeProcess([delta_line(self.CALENDAR_OUTPUT), result_line(self.CALENDAR_OUTPUT)])
+
+        with patch("asyncio.create_subprocess_exec", side_effect=[stalled, fast]) as mock_exec:
+            response = await service.chat("달력아 내일 3시 치과", timeout_seconds=10)
+
+        assert response.success is True
+        assert response.parsed_events == [{"title": "치과"}]
+        assert mock_exec.call_count == 2
+        assert stalled.kill_count == 1
+        stats = service.get_stats()
+        assert stats["hedge"]["hedged_total"] == 1
+        assert stats["hedge"]["wins_total"] == 1
+        assert stats["scheduler"]["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fast_request_not_hedged(self, service):
+        process = FakeProcess([result_line(self.CALENDAR_OUTPUT)])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process) as mock_exec:
+            response = await service.chat("달력아 모레 치과", timeout_seconds=10)
+
+        assert response.success is True
+        assert mock_exec.call_count == 1
+        assert service.get_stats()["hedge"]["hedged_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_waits_for_primary(self, service):
+        """예산이 없으면 헤지하지 않고 원래 요청을 기다림"""
+        service.hedge = HedgeBudget(ratio=0, burst=1)
+        slow = FakeProcess(hang=True)
+
+        async def finish_later():
+            await asyncio.sleep(0.2)
+            slow.finish([result_line(self.CALENDAR_OUTPUT)])
+
+        with patch("asyncio.create_subprocess_exec", return_value=slow) as mock_exec:
+            finisher = asyncio.create_task(finish_later())
+            response = await service.chat("달력아 글피 치과", timeout_seconds=10)
+            await finisher
+
+        assert response.success is True
+        assert mock_exec.call_count == 1
+        assert service.get_stats()["hedge"]["denied_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_failure_falls_back_to_primary(self, service):
+        """헤지 요청이 실패하면 원래 요청 결과를 기다림"""
+        slow = FakeProcess(hang=True)
+        broken = FakeProcess(stderr=b"boom", returncode=1)
+
+        async def finish_later():
+            await asyncio.sleep(0.2)
+            slow.finish([result_line(self.CALENDAR_OUTPUT)])
+
+        with patch("asyncio.create_subprocess_exec", side_effect=[slow, broken]):
+            finisher = asyncio.create_task(finish_later())
+            response = await service.chat("달력아 다음주 치과", timeout_seconds=10)
+            await finisher
+
+        assert response.success is True
+        assert service.get_stats()["hedge"]["wins_total"] == 0
+
+
+class TestHedgeBudget:
+    """헤지 비율 토큰 버킷 테스트"""
+
+    def test_caps_hedges_to_ratio(self):
+        budget = HedgeBudget(ratio=0.1, burst=2)
+        hedged = 0
+        for _ in range(100):
+            budget.on_request()
+            hedged += budget.try_spend()
+
+        assert hedged == 10
+        assert budget.stats()["denied_total"] == 90
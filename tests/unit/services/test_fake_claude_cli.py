@@ -0,0 +1,149 @@
+"""부하 테스트용 가짜 CLI(scripts/loadtest/fake_claude.py)와 부하 스크립트 테스트
+
+가짜 CLI가 ClaudeService의 실제 서브프로세스/워커 풀 경로와 맞물리는지 확인합니다.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import signal
+from pathlib import Path
+
+import pytest
+
+from app.config import get_settings
+from app.services.calendar.quick_parse import quick_parse
+from app.services.claude.personas import PersonaType
+from app.services.claude.pool import ClaudeWorkerPool
+from app.services.claude.service import ClaudeService
+
+LOADTEST_DIR = Path(__file__).resolve().parents[3] / "scripts" / "loadtest"
+FAKE_CLI = LOADTEST_DIR / "fake_claude.py"
+
+
+@pytest.fixture
+def fast_fake(monkeypatch):
+    """지연 없는 가짜 CLI 설정"""
+    monkeypatch.setenv("FAKE_CLAUDE_STARTUP_MS", "0")
+    monkeypatch.setenv("FAKE_CLAUDE_LATENCY_MS", "50")
+    monkeypatch.setenv("FAKE_CLAUDE_LATENCY_SIGMA", "0")
+    monkeypatch.setenv("FAKE_CLAUDE_OUTPUT_CHARS", "45")
+    monkeypatch.setenv("FAKE_CLAUDE_CHUNK_CHARS", "10")
+
+
+@pytest.fixture
+def service(fast_fake):
+    service = ClaudeService()
+    service.settings = service.settings.model_copy(update={"claude_cli_path": str(FAKE_CLI)})
+    return service
+
+
+class TestFakeClaudeCLI:
+    """가짜 CLI로 실제 서브프로세스 경로 실행"""
+
+    @pytest.mark.asyncio
+    async def test_subprocess_streams_output(self, service):
+        """단발성 실행: 텍스트 조각이 스트리밍되고 결과 길이는 설정대로"""
+        chunks = [chunk async for chunk in service.chat_stream("말랑아 안녕", timeout_seconds=10)]
+
+        text = "".join(c.text for c in chunks if c.text)
+        assert len(text) == 45
+        assert chunks[-1].response.success is True
+        assert service.get_stats()["usage"]["mallangi"]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_calendar_persona_returns_events(self, service):
+        """달력이 페르소나에는 일정 JSON 응답"""
+        response = await service.chat("달력아 내일 3시 치과", timeout_seconds=10)
+
+        assert response.success is True
+        assert response.parsed_events[0]["start_time"] == "2026-03-02T10:00:00"
+
+    @pytest.mark.asyncio
+    async def test_failure_rate(self, service, monkeypatch):
+        """FAILURE_RATE=1이면 CLI 에러로 실패"""
+        monkeypatch.setenv("FAKE_CLAUDE_FAILURE_RATE", "1")
+
+        response = await service.chat("말랑아 안녕", timeout_seconds=10)
+
+        assert response.success is False
+        assert response.error_type == "cli_error"
+
+    @pytest.mark.asyncio
+    async def test_cancel_terminates_process_group(self, service, monkeypatch):
+        """요청이 취소되면(클라이언트 연결 끊김) CLI 프로세스 그룹을 종료하고 슬롯 반납"""
+        monkeypatch.setenv("FAKE_CLAUDE_HANG_RATE", "1")
+        spawned = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def spawn(*args, **kwargs):
+            process = await create_subprocess_exec(*args, **kwargs)
+            spawned.append(process)
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", spawn)
+        task = asyncio.create_task(service.chat("말랑아 안녕", timeout_seconds=60))
+        while not spawned:
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        process = spawned[0]
+        assert process.returncode == -signal.SIGTERM
+        with pytest.raises(ProcessLookupError):
+            os.killpg(process.pid, 0)
+        stats = service.get_stats()
+        assert stats["cancelled_total"] == 1
+        assert stats["scheduler"]["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_mode(self, service):
+        """--input-format stream-json이면 한 프로세스가 여러 요청 처리"""
+        service.pools = {
+            PersonaType.MALLANGI: ClaudeWorkerPool(
+                [str(FAKE_CLI), "-p", "--input-format", "stream-json"],
+                min_size=1,
+                max_size=1,
+                max_requests_per_worker=2,
+            )
+        }
+        await service.start()
+        try:
+            for i in range(2):
+                response = await service.chat(f"말랑아 안녕 {i}", timeout_seconds=10)
+                assert response.success is True
+            assert service.get_stats()["pool"]["spawned_total"] == 1
+        finally:
+            await service.shutdown()
+
+
+def test_stream_messages_are_json(fast_fake):
+    """모든 출력 줄이 stream-json 메시지"""
+    import subprocess
+
+    result = subprocess.run(
+        [str(FAKE_CLI), "-p", "말랑아 안녕", "--output-format", "stream-json"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+    messages = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [m["type"] for m in messages][0] == "system"
+    assert messages[-1]["type"] == "result"
+    assert messages[-1]["usage"]["output_tokens"] > 0
+
+
+@pytest.mark.parametrize("suffix", ["", " (1)", " (1234)"])
+def test_loadtest_calendar_text_needs_ai(suffix):
+    """부하 스크립트의 캘린더 프롬프트는 번호 접미사와 관계없이 빠른 파서가 거절 (AI 경로 측정)"""
+    spec = importlib.util.spec_from_file_location("loadtest_run", LOADTEST_DIR / "run.py")
+    run = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(run)
+
+    result = quick_parse(run.CALENDAR_TEXT + suffix)
+
+    assert result.confidence < get_settings().calendar_quick_parse_min_confidence
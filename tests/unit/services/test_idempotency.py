@@ -0,0 +1,137 @@
+"""IdempotencyStore 단위 테스트"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.exceptions import IdempotencyKeyReuseError
+from app.services import idempotency
+from app.services.idempotency import IdempotencyStore, make_fingerprint
+
+
+def _counting_work(result="ok", delay: float = 0):
+    calls = []
+
+    async def work():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        return result
+
+    return work, calls
+
+
+class TestIdempotencyStore:
+    """(사용자, 경로, 키)별 한 번 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_replays_completed_result(self):
+        store = IdempotencyStore()
+        work, calls = _counting_work("first")
+        fp = make_fingerprint({"text": "내일 치과"})
+
+        assert await store.run("u1", "POST /x", "k", fp, work) == ("first", False)
+        assert await store.run("u1", "POST /x", "k", fp, work) == ("first", True)
+        assert len(calls) == 1
+        assert store.stats()["replayed_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_scoped_by_user_and_route(self):
+        store = IdempotencyStore()
+        work, calls = _counting_work()
+        fp = make_fingerprint("same")
+
+        await store.run("u1", "POST /x", "k", fp, work)
+        await store.run("u2", "POST /x", "k", fp, work)
+        await store.run("u1", "POST /y", "k", fp, work)
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_joins_in_flight(self):
+        """실행 중에 온 재전송은 먼저 온 요청의 결과를 기다림"""
+        store = IdempotencyStore()
+        work, calls = _counting_work("shared", delay=0.05)
+        fp = make_fingerprint("same")
+
+        results = await asyncio.gather(
+            store.run("u1", "POST /x", "k", fp, work),
+            store.run("u1", "POST /x", "k", fp, work),
+        )
+
+        assert results == [("shared", False), ("shared", True)]
+        assert len(calls) == 1
+        assert store.stats()["joined_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fingerprint_mismatch_rejected(self):
+        store = IdempotencyStore()
+        work, _ = _counting_work()
+        await store.run("u1", "POST /x", "k", make_fingerprint("a"), work)
+
+        with pytest.raises(IdempotencyKeyReuseError):
+            await store.run("u1", "POST /x", "k", make_fingerprint("b"), work)
+
+    @pytest.mark.asyncio
+    async def test_failure_not_stored(self):
+        """예외로 끝난 요청은 보관하지 않고, 합류한 요청이 다시 실행"""
+        store = IdempotencyStore()
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            await asyncio.sleep(0.02)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return "recovered"
+
+        fp = make_fingerprint("same")
+        first, second = await asyncio.gather(
+            store.run("u1", "POST /x", "k", fp, flaky),
+            store.run("u1", "POST /x", "k", fp, flaky),
+            return_exceptions=True,
+        )
+
+        assert isinstance(first, RuntimeError)
+        assert second == ("recovered", False)
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_result_not_retained(self):
+        """retain이 False면 합류한 요청은 결과를 받지만 다음 재전송은 다시 실행"""
+        store = IdempotencyStore()
+        work, calls = _counting_work({"success": False}, delay=0.02)
+        fp = make_fingerprint("same")
+        retain = lambda result: result["success"]  # noqa: E731
+
+        results = await asyncio.gather(
+            store.run("u1", "POST /x", "k", fp, work, retain),
+            store.run("u1", "POST /x", "k", fp, work, retain),
+        )
+        assert [replayed for _, replayed in results] == [False, True]
+
+        await store.run("u1", "POST /x", "k", fp, work, retain)
+        assert len(calls) == 2
+        assert store.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_and_overflow_entries_dropped(self, monkeypatch):
+        store = IdempotencyStore(ttl_seconds=10, max_entries=2)
+        work, calls = _counting_work()
+        fp = make_fingerprint("same")
+
+        for key in ("a", "b", "c"):
+            await store.run("u1", "POST /x", key, fp, work)
+        assert store.stats()["entries"] == 2
+
+        # 가장 오래된 "a"는 밀려나서 다시 실행
+        await store.run("u1", "POST /x", "a", fp, work)
+        assert len(calls) == 4
+
+        later = time.monotonic() + 11
+        monkeypatch.setattr(idempotency, "time", SimpleNamespace(monotonic=lambda: later))
+        await store.run("u1", "POST /x", "c", fp, work)
+        assert len(calls) == 5
+        assert store.stats()["entries"] == 1
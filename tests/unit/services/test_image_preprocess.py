@@ -0,0 +1,149 @@
+"""이미지 전처리 단위 테스트"""
+
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from app.services.claude.imaging import (
+    ImageProcessingError,
+    preprocess_image,
+    sniff_format,
+)
+from app.services.claude.service import ClaudeService
+from app.services.claude.staging import ImageStager
+
+
+def _encode(image: Image.Image, fmt: str, **kwargs) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+def _photo(width: int, height: int, orientation: int | None = None) -> bytes:
+    """EXIF가 붙은 JPEG 사진"""
+    image = Image.new("RGB", (width, height), (200, 120, 40))
+    exif = Image.Exif()
+    exif[0x010F] = "TestPhone"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    return _encode(image, "JPEG", exif=exif.tobytes())
+
+
+class TestSniffFormat:
+    """매직 바이트 포맷 판별"""
+
+    @pytest.mark.parametrize(
+        "fmt,expected",
+        [("PNG", ("png", ".png")), ("JPEG", ("jpeg", ".jpg")), ("GIF", ("gif", ".gif")), ("WEBP", ("webp", ".webp"))],
+    )
+    def test_known_formats(self, fmt, expected):
+        data = _encode(Image.new("RGB", (4, 4)), fmt)
+        assert sniff_format(data[:16]) == expected
+
+    def test_unknown(self):
+        assert sniff_format(b"not an image") is None
+
+
+class TestPreprocessImage:
+    """축소/EXIF 제거/재인코딩"""
+
+    def test_downscales_large_photo(self):
+        result = preprocess_image(_photo(4000, 3000), max_edge=1568)
+
+        assert result.reencoded is True
+        assert (result.width, result.height) == (1568, 1176)
+        assert result.format == "jpeg" and result.suffix == ".jpg"
+
+        decoded = Image.open(io.BytesIO(result.data))
+        assert decoded.size == (1568, 1176)
+        assert not decoded.getexif()
+
+    def test_applies_exif_orientation(self):
+        """회전 정보(Orientation=6)를 픽셀에 반영한 뒤 EXIF 제거"""
+        result = preprocess_image(_photo(400, 200, orientation=6), max_edge=1568)
+
+        assert (result.width, result.height) == (200, 400)
+
+    def test_small_clean_image_kept(self):
+        """작고 메타데이터 없는 이미지는 그대로 (확장자만 실제 포맷)"""
+        data = _encode(Image.new("RGB", (64, 64)), "JPEG")
+
+        result = preprocess_image(data, max_edge=1568)
+
+        assert result.reencoded is False
+        assert result.data == data
+        assert result.suffix == ".jpg"
+
+    def test_keeps_transparency_as_png(self):
+        data = _encode(Image.new("RGBA", (3000, 1000), (0, 0, 0, 0)), "PNG")
+
+        result = preprocess_image(data, max_edge=1000)
+
+        assert result.format == "png"
+        assert (result.width, result.height) == (1000, 333)
+
+    def test_reads_from_path(self, tmp_path):
+        path = tmp_path / "photo.png"
+        path.write_bytes(_photo(2000, 1000))
+
+        result = preprocess_image(str(path), max_edge=500)
+
+        assert (result.width, result.height) == (500, 250)
+
+    def test_not_an_image(self):
+        with pytest.raises(ImageProcessingError):
+            preprocess_image(b"hello world")
+
+
+class TestServicePrepareImage:
+    """ClaudeService 프로세스 풀 연동"""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        service = ClaudeService()
+        service.stager = ImageStager("tmpfs", str(tmp_path))
+        yield service
+        if service.image_executor:
+            service.image_executor.shutdown(wait=True)
+
+    async def test_preprocesses_in_process_pool(self, service):
+        staged, owned = await service._prepare_image(_photo(3000, 2000))
+
+        try:
+            assert staged is owned
+            assert staged.path.endswith(".jpg")
+            with Image.open(staged.path) as image:
+                assert max(image.size) == service.settings.claude_image_max_edge
+            assert service.get_stats()["staging"]["reencoded_total"] == 1
+        finally:
+            owned.remove()
+
+    async def test_reuses_staged_upload_when_unchanged(self, service):
+        upload = service.stager.stage_bytes(
+            _encode(Image.new("RGB", (32, 32)), "JPEG"), suffix=".jpg"
+        )
+
+        staged, owned = await service._prepare_image(upload)
+
+        assert staged is upload
+        assert owned is None
+        upload.remove()
+
+    async def test_invalid_image_raises(self, service):
+        with pytest.raises(ImageProcessingError):
+            await service._prepare_image(b"not an image")
+
+    async def test_disabled_stages_original(self, service):
+        service.image_executor.shutdown(wait=True)
+        service.image_executor = None
+
+        staged, owned = await service._prepare_image(b"raw-bytes")
+
+        try:
+            with open(staged.path, "rb") as f:
+                assert f.read() == b"raw-bytes"
+        finally:
+            owned.remove()
+        assert not os.path.exists(staged.path)
@@ -0,0 +1,110 @@
+"""이미지 staging 방식 단위 테스트"""
+
+import hashlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.services.claude.staging import (
+    ImageStager,
+    ImageTooLargeError,
+    StagingBackend,
+    resolve_backend,
+)
+
+requires_memfd = pytest.mark.skipif(
+    not hasattr(os, "memfd_create"), reason="memfd_create 미지원 플랫폼"
+)
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+
+class TestResolveBackend:
+    """사용 가능한 방식 선택"""
+
+    def test_disk_always_available(self, tmp_path):
+        assert resolve_backend("disk", str(tmp_path)) == StagingBackend.DISK
+
+    def test_tmpfs_missing_dir_falls_back_to_disk(self, tmp_path):
+        missing = str(tmp_path / "missing")
+        assert resolve_backend("tmpfs", missing) == StagingBackend.DISK
+
+    @requires_memfd
+    def test_auto_prefers_memfd(self, tmp_path):
+        assert resolve_backend("auto", str(tmp_path)) == StagingBackend.MEMFD
+
+    def test_auto_without_memfd_uses_tmpfs(self, tmp_path, monkeypatch):
+        monkeypatch.delattr(os, "memfd_create", raising=False)
+        assert resolve_backend("auto", str(tmp_path)) == StagingBackend.TMPFS
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            resolve_backend("nfs", None)
+
+
+class TestImageStager:
+    """방식별 저장/삭제"""
+
+    @pytest.mark.parametrize("backend", ["disk", "tmpfs", pytest.param("memfd", marks=requires_memfd)])
+    def test_stage_and_remove(self, backend, tmp_path):
+        stager = ImageStager(backend, str(tmp_path))
+
+        image = stager.stage_bytes(IMAGE)
+
+        assert image.backend == StagingBackend(backend)
+        assert image.path.endswith(".png")
+        assert image.size == len(IMAGE)
+        assert image.sha256 == hashlib.sha256(IMAGE).hexdigest()
+        with open(image.path, "rb") as f:
+            assert f.read() == IMAGE
+
+        image.remove()
+        assert not os.path.lexists(image.path)
+        assert image.fd == -1
+
+    def test_tmpfs_writes_into_tmpfs_dir(self, tmp_path):
+        image = ImageStager("tmpfs", str(tmp_path)).stage_bytes(IMAGE)
+        try:
+            assert os.path.dirname(image.path) == str(tmp_path)
+        finally:
+            image.remove()
+
+    @requires_memfd
+    def test_memfd_readable_by_child_process(self, tmp_path):
+        """CLI 같은 별도 프로세스가 링크 경로로 읽을 수 있어야 함"""
+        image = ImageStager("memfd", str(tmp_path)).stage_bytes(IMAGE)
+        try:
+            assert os.path.islink(image.path)
+            result = subprocess.run(
+                [sys.executable, "-c", f"import sys; sys.stdout.buffer.write(open({image.path!r}, 'rb').read())"],
+                capture_output=True,
+                check=True,
+            )
+            assert result.stdout == IMAGE
+        finally:
+            image.remove()
+
+    def test_falls_back_to_disk_on_error(self, tmp_path):
+        """tmpfs 디렉토리가 사라지면 요청 단위로 disk 사용"""
+        tmpfs_dir = tmp_path / "shm"
+        tmpfs_dir.mkdir()
+        stager = ImageStager("tmpfs", str(tmpfs_dir))
+        tmpfs_dir.rmdir()
+
+        image = stager.stage_bytes(IMAGE)
+        try:
+            assert image.backend == StagingBackend.DISK
+            assert stager.stats()["fallback_total"] == 1
+        finally:
+            image.remove()
+
+    @pytest.mark.parametrize("backend", ["disk", "tmpfs", pytest.param("memfd", marks=requires_memfd)])
+    def test_too_large_aborts(self, backend, tmp_path):
+        writer = ImageStager(backend, str(tmp_path)).writer(max_bytes=10)
+
+        with pytest.raises(ImageTooLargeError):
+            writer.write(IMAGE)
+
+        assert not os.path.lexists(writer.path)
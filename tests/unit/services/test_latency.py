@@ -0,0 +1,102 @@
+"""LatencyTracker 단위 테스트 - 적응형 타임아웃"""
+
+import pytest
+
+from app.services.claude.latency import LatencyTracker, percentile
+from app.services.claude.service import ClaudeService
+
+
+class TestLatencyTracker:
+    """실행 시간 기록 및 타임아웃 계산 테스트"""
+
+    def test_percentile_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 0.5) == 50.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile([], 0.99) == 0.0
+
+    def test_upper_bound_until_enough_samples(self):
+        """표본이 부족하면 상한(요청/설정 타임아웃) 그대로"""
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record("michael", False, 8.0)
+
+        assert tracker.timeout_for("michael", False, 120) == 120
+
+    def test_timeout_from_high_percentile(self):
+        """백분위수 × 배수 + 여유, 최솟값 이상"""
+        tracker = LatencyTracker(
+            min_samples=5, quantile=0.99, multiplier=1.5, margin_seconds=5, min_timeout_seconds=10
+        )
+        for seconds in [6.0, 7.0, 8.0, 8.0, 10.0]:
+            tracker.record("michael", False, seconds)
+
+        assert tracker.timeout_for("michael", False, 120) == 20  # 10 * 1.5 + 5
+        assert tracker.timeout_for("michael", False, 15) == 15  # 요청 타임아웃이 상한
+        # 입력 종류별로 따로 집계
+        assert tracker.timeout_for("michael", True, 120) == 120
+
+    def test_min_timeout(self):
+        tracker = LatencyTracker(min_samples=1, min_timeout_seconds=15)
+        tracker.record("mallangi", False, 1.0)
+
+        assert tracker.timeout_for("mallangi", False, 120) == 15
+
+    def test_window_drops_old_samples(self):
+        """창 크기를 넘으면 오래된 표본부터 버림"""
+        tracker = LatencyTracker(window=3, min_samples=3, multiplier=1, margin_seconds=0, min_timeout_seconds=1)
+        for seconds in [100.0, 5.0, 5.0, 5.0]:
+            tracker.record("lupin", False, seconds)
+
+        assert tracker.timeout_for("lupin", False, 120) == 5
+        assert tracker.stats()["lupin"]["text"]["samples"] == 3
+
+    def test_timeouts_do_not_ratchet(self):
+        """타임아웃 값은 표본이 되지 않으므로 타임아웃이 날수록 늘어나지 않음"""
+        tracker = LatencyTracker(
+            min_samples=5, quantile=0.8, multiplier=1, margin_seconds=0, min_timeout_seconds=1
+        )
+        for _ in range(9):
+            tracker.record("michael", False, 8.0)
+        tracker.record("michael", False, 8.0, timed_out=True)
+
+        assert tracker.timeout_for("michael", False, 120) == 8
+        stats = tracker.stats()["michael"]["text"]
+        assert stats["timed_out"] == 1
+        assert stats["p99_seconds"] is None
+
+    def test_frequent_timeouts_fall_back_to_upper_bound(self):
+        """백분위수 위치까지 타임아웃이면 추정할 수 없으므로 상한 (작은 타임아웃에 갇히지 않음)"""
+        tracker = LatencyTracker(
+            min_samples=5, quantile=0.8, multiplier=1, margin_seconds=0, min_timeout_seconds=1
+        )
+        for _ in range(8):
+            tracker.record("michael", False, 8.0)
+        for _ in range(3):
+            tracker.record("michael", False, 8.0, timed_out=True)
+
+        assert tracker.timeout_for("michael", False, 120) == 120
+        assert tracker.quantile_for("michael", False, 0.8) is None
+
+
+class TestClaudeServiceAdaptiveTimeout:
+    """ClaudeService에 적응형 타임아웃 적용"""
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_uses_adaptive_timeout(self):
+        """기록된 실행 시간이 충분하면 요청 타임아웃보다 짧게 적용"""
+        service = ClaudeService()
+        service.latency = LatencyTracker(min_samples=1, multiplier=1, margin_seconds=0, min_timeout_seconds=1)
+        service.latency.record("michael", False, 8.0)
+
+        captured = {}
+
+        async def fake_execute(persona_type, actual_prompt, timeout, image_source):
+            captured["timeout"] = timeout
+            return
+            yield
+
+        service._execute = fake_execute
+        [c async for c in service.chat_stream("마이콜아 hello", timeout_seconds=60)]
+
+        assert captured["timeout"] == 8
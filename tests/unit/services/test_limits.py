@@ -0,0 +1,103 @@
+"""CLI 파이프 읽기 상한 / 자원 제한 단위 테스트"""
+
+import asyncio
+import signal
+import sys
+
+import pytest
+
+from app.services.claude.limits import (
+    ResourceLimitError,
+    ResourceLimits,
+    StderrTail,
+    read_lines,
+)
+
+
+def _reader(data: bytes, limit: int = 2**16) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader(limit=limit)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestCappedReaders:
+    """stdout 총량 / 줄 길이 / stderr 꼬리 상한 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_read_lines_within_cap(self):
+        lines = [line async for line in read_lines(_reader(b"a\nb\n"), max_bytes=4)]
+        assert lines == [b"a\n", b"b\n"]
+
+    @pytest.mark.asyncio
+    async def test_read_lines_total_cap(self):
+        lines = []
+        with pytest.raises(ResourceLimitError):
+            async for line in read_lines(_reader(b"aaaa\nbbbb\n"), max_bytes=8):
+                lines.append(line)
+        assert lines == [b"aaaa\n"]
+
+    @pytest.mark.asyncio
+    async def test_read_lines_line_too_long(self):
+        """StreamReader limit을 넘는 한 줄은 버퍼를 키우지 않고 에러"""
+        reader = _reader(b"x" * 100 + b"\n", limit=16)
+        with pytest.raises(ResourceLimitError, match="line too long"):
+            async for _ in read_lines(reader, max_bytes=0):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stderr_keeps_tail_only(self):
+        tail = StderrTail(_reader(b"x" * 10_000 + b"last error"), max_bytes=64)
+        await tail.wait()
+
+        assert tail.total_bytes == 10_010
+        assert len(tail.text) == 64
+        assert tail.text.endswith("last error")
+
+
+class TestResourceLimits:
+    """setrlimit/nice 적용과 종료 원인 판별 테스트"""
+
+    def test_no_limits_no_preexec(self):
+        assert ResourceLimits().preexec_fn() is None
+
+    def test_describe_exit(self):
+        limits = ResourceLimits(cpu_seconds=10, address_space_mb=2048)
+
+        assert "CPU time" in limits.describe_exit(-signal.SIGXCPU, "")
+        assert "memory" in limits.describe_exit(
+            134, "FATAL ERROR: JavaScript heap out of memory"
+        )
+        assert limits.describe_exit(1, "API error") is None
+        # 설정하지 않은 제한은 원인으로 보지 않음
+        assert ResourceLimits().describe_exit(-signal.SIGXCPU, "") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX rlimit")
+    async def test_limits_applied_in_child(self):
+        limits = ResourceLimits(cpu_seconds=30, open_files=64, nice=5)
+        process = await asyncio.create_subprocess_exec(
+            "sh",
+            "-c",
+            "ulimit -t; ulimit -n; cut -d' ' -f19 /proc/self/stat",
+            stdout=asyncio.subprocess.PIPE,
+            preexec_fn=limits.preexec_fn(),
+        )
+        stdout, _ = await process.communicate()
+
+        cpu, files, nice = stdout.decode().split()
+        assert (cpu, files) == ("30", "64")
+        assert int(nice) >= 5
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX rlimit")
+    async def test_cpu_limit_kills_runaway(self):
+        """CPU 시간 제한을 넘으면 SIGXCPU로 종료되고 원인이 판별됨"""
+        limits = ResourceLimits(cpu_seconds=1)
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "while True: pass", preexec_fn=limits.preexec_fn()
+        )
+        returncode = await asyncio.wait_for(process.wait(), 10)
+
+        assert returncode == -signal.SIGXCPU
+        assert limits.describe_exit(returncode, "") is not None
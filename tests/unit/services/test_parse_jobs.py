@@ -0,0 +1,105 @@
+"""ParseJobManager 단위 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.exceptions import TooManyRequestsError
+from app.services.calendar.jobs import ParseJobManager, ParseJobStatus
+
+
+class TestParseJobManager:
+    """작업 제출/대기/실패 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_and_stores_result(self):
+        manager = ParseJobManager()
+
+        async def work():
+            return "parsed"
+
+        job = manager.submit("uid", work)
+        await manager.wait(job, timeout=1)
+
+        assert job.status == ParseJobStatus.DONE
+        assert job.result == "parsed"
+        assert manager.get(job.id, "uid") is job
+        assert manager.get(job.id, "other-uid") is None
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded(self):
+        manager = ParseJobManager()
+
+        async def work():
+            raise RuntimeError("boom")
+
+        job = manager.submit("uid", work)
+        await manager.wait(job, timeout=1)
+
+        assert job.status == ParseJobStatus.FAILED
+        assert job.error == "boom"
+        assert manager.stats()["failed_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_unfinished_after_timeout(self):
+        manager = ParseJobManager()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        job = manager.submit("uid", work)
+        await manager.wait(job, timeout=0.05)
+
+        assert job.status == ParseJobStatus.RUNNING
+        release.set()
+        await manager.wait(job, timeout=1)
+        assert job.status == ParseJobStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        """max_workers보다 많은 작업은 queued로 대기"""
+        manager = ParseJobManager(max_workers=1)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        first = manager.submit("uid", work)
+        second = manager.submit("uid", work)
+        await asyncio.sleep(0.01)
+
+        assert first.status == ParseJobStatus.RUNNING
+        assert second.status == ParseJobStatus.QUEUED
+
+        release.set()
+        await manager.wait(second, timeout=1)
+        assert second.status == ParseJobStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_too_many_pending(self):
+        manager = ParseJobManager(max_pending=1)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        manager.submit("uid", work)
+        with pytest.raises(TooManyRequestsError):
+            manager.submit("uid", work)
+
+        release.set()
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_expired_results_purged(self):
+        manager = ParseJobManager(result_ttl_seconds=0)
+
+        async def work():
+            return "parsed"
+
+        job = manager.submit("uid", work)
+        await manager.wait(job, timeout=1)
+        await asyncio.sleep(0.01)
+
+        assert manager.get(job.id, "uid") is None
@@ -0,0 +1,79 @@
+"""CLI 프로세스 그룹 종료 단위 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.services.claude.process import kill_process_group, terminate_process_group
+from tests.fakes.fake_process import FakeProcess
+
+# SIGTERM을 무시하는 셸과, 그 셸이 띄운 손자 프로세스 (pid를 한 줄 출력)
+STUBBORN_SCRIPT = 'trap "" TERM; sleep 30 & echo $!; wait'
+
+
+def _running(pid: int) -> bool:
+    """프로세스가 살아 있는지 (좀비는 종료된 것으로 봄)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+async def _spawn(script: str) -> tuple[asyncio.subprocess.Process, int]:
+    process = await asyncio.create_subprocess_exec(
+        "sh", "-c", script, stdout=asyncio.subprocess.PIPE, start_new_session=True
+    )
+    child_pid = int(await process.stdout.readline())
+    return process, child_pid
+
+
+class TestTerminateProcessGroup:
+    """SIGTERM → 유예 → SIGKILL 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sigterm_stops_group(self):
+        process, child_pid = await _spawn("sleep 30 & echo $!; wait")
+
+        await terminate_process_group(process, grace_seconds=5)
+
+        assert process.returncode is not None
+        assert not _running(child_pid)
+
+    @pytest.mark.asyncio
+    async def test_kills_after_grace(self):
+        """SIGTERM을 무시하면 유예 시간 뒤 그룹 전체 SIGKILL"""
+        process, child_pid = await _spawn(STUBBORN_SCRIPT)
+
+        await asyncio.wait_for(terminate_process_group(process, grace_seconds=0.2), 5)
+
+        assert process.returncode == -9
+        for _ in range(50):
+            if not _running(child_pid):
+                break
+            await asyncio.sleep(0.02)
+        assert not _running(child_pid)
+
+    @pytest.mark.asyncio
+    async def test_kill_process_group(self):
+        process, child_pid = await _spawn(STUBBORN_SCRIPT)
+
+        kill_process_group(process)
+        await process.wait()
+
+        assert process.returncode == -9
+        for _ in range(50):
+            if not _running(child_pid):
+                break
+            await asyncio.sleep(0.02)
+        assert not _running(child_pid)
+
+    @pytest.mark.asyncio
+    async def test_non_leader_signals_process_only(self):
+        """그룹 리더가 아닌 프로세스(테스트용 Fake 등)는 프로세스에만 시그널"""
+        process = FakeProcess(hang=True)
+
+        await terminate_process_group(process, grace_seconds=1)
+
+        assert process.kill_count == 1
+        assert process.returncode == -9
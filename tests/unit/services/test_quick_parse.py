@@ -0,0 +1,95 @@
+"""로컬 일정 파서 테스트"""
+
+from datetime import date
+
+import pytest
+
+from app.services.calendar.quick_parse import quick_parse
+
+# 2026-01-22 (목)
+TODAY = date(2026, 1, 22)
+
+
+class TestQuickParseConfident:
+    """로컬에서 처리하는 문구"""
+
+    @pytest.mark.parametrize(
+        "text,title,start,end,all_day,recurrence",
+        [
+            ("내일 오후 3시 치과", "치과", "2026-01-23T15:00:00", "2026-01-23T16:00:00", False, None),
+            ("내일 3시 치과", "치과", "2026-01-23T15:00:00", "2026-01-23T16:00:00", False, None),
+            ("다음주 월요일 종일 현장학습", "현장학습", "2026-01-26T00:00:00", "2026-01-26T23:59:59", True, None),
+            ("이번 주 금요일 3시 반 미용실", "미용실", "2026-01-23T15:30:00", "2026-01-23T16:30:00", False, None),
+            ("모레 오전 10시~11시 30분 상담 등록해줘", "상담", "2026-01-24T10:00:00", "2026-01-24T11:30:00", False, None),
+            ("내일 3시부터 5시까지 수영", "수영", "2026-01-23T15:00:00", "2026-01-23T17:00:00", False, None),
+            ("1월 30일 병원", "병원", "2026-01-30T00:00:00", "2026-01-30T23:59:59", True, None),
+            ("1월 2일 신년회", "신년회", "2027-01-02T00:00:00", "2027-01-02T23:59:59", True, None),
+            ("오늘 15:30 줌 회의 일정 추가해줘", "줌 회의", "2026-01-22T15:30:00", "2026-01-22T16:30:00", False, None),
+            ("3일 후 엄마 생일", "엄마 생일", "2026-01-25T00:00:00", "2026-01-25T23:59:59", True, None),
+            ("매일 아침 8시 등원", "등원", "2026-01-22T08:00:00", "2026-01-22T09:00:00", False, "FREQ=DAILY"),
+            ("매주 월수금 피아노", "피아노", "2026-01-23T00:00:00", "2026-01-23T23:59:59", True, "FREQ=WEEKLY;BYDAY=MO,WE,FR"),
+            ("매주 일요일 일기 쓰기", "일기 쓰기", "2026-01-25T00:00:00", "2026-01-25T23:59:59", True, "FREQ=WEEKLY;BYDAY=SU"),
+            ("격주 토요일 오전 9시 축구", "축구", "2026-01-24T09:00:00", "2026-01-24T10:00:00", False, "FREQ=WEEKLY;INTERVAL=2;BYDAY=SA"),
+            ("매월 15일 관리비", "관리비", "2026-02-15T00:00:00", "2026-02-15T23:59:59", True, "FREQ=MONTHLY;BYMONTHDAY=15"),
+            ("다음달 20일 검진", "검진", "2026-02-20T00:00:00", "2026-02-20T23:59:59", True, None),
+            ("다음 달 20일 검진", "검진", "2026-02-20T00:00:00", "2026-02-20T23:59:59", True, None),
+            ("다다음달 5일 치과", "치과", "2026-03-05T00:00:00", "2026-03-05T23:59:59", True, None),
+            ("내년 3월 2일 입학식", "입학식", "2027-03-02T00:00:00", "2027-03-02T23:59:59", True, None),
+            ("모레 11시 미용실 예약해줘", "미용실", "2026-01-24T11:00:00", "2026-01-24T12:00:00", False, None),
+        ],
+    )
+    def test_parses(self, text, title, start, end, all_day, recurrence):
+        result = quick_parse(text, today=TODAY)
+
+        assert result.confidence >= 0.8
+        assert result.events == [
+            {
+                "title": title,
+                "start_time": start,
+                "end_time": end,
+                "all_day": all_day,
+                "description": None,
+                "recurrence": recurrence,
+            }
+        ]
+
+    def test_message(self):
+        result = quick_parse("내일 오후 3시 치과", today=TODAY)
+
+        assert result.message == "1월 23일 오후 3시 치과 일정이에요!"
+
+    def test_next_month_crosses_year(self):
+        result = quick_parse("다음달 20일 검진", today=date(2026, 12, 3))
+
+        assert result.events[0]["start_time"] == "2027-01-20T00:00:00"
+
+
+class TestQuickParseDefers:
+    """AI로 넘겨야 하는 문구 (낮은 신뢰도)"""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "안녕하세요",
+            "치과 언제였지?",
+            "내일 3시 치과 그리고 5시 학원",
+            "모레 저녁 가족 외식",
+            "1월 30일이랑 2월 3일 병원",
+            "3시 치과",
+            "내일",
+            "2월 30일 모임",
+            "25시 회의 내일",
+            "내일 오후 2시에 아이 학교에서 학부모 상담이 있는데 준비물 챙기기",
+            # 날짜 표현이 제목에 남음 (해석 못 한 날짜)
+            "다음달 검진",
+            "내년 입학식",
+            "다음주 치과",
+            "다음달 31일 모임",
+            # 기존 일정 취소/변경 요청
+            "내일 오후 3시 치과 취소",
+            "내일 3시 치과 5시로 변경해줘",
+            "모레 학원 다음주로 미뤄줘",
+        ],
+    )
+    def test_low_confidence(self, text):
+        assert quick_parse(text, today=TODAY).confidence < 0.8
@@ -0,0 +1,145 @@
+"""ResponseCache 단위 테스트"""
+
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.services.claude.cache import ResponseCache, make_cache_key, normalize_prompt
+from app.services.claude.personas import PersonaType
+from app.services.claude.service import ClaudeService
+from tests.fakes.fake_clock import freeze_clock
+from tests.fakes.fake_process import FakeProcess, result_line
+
+
+class TestCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_normalize_prompt(self):
+        """공백/대소문자 차이는 같은 키"""
+        assert normalize_prompt("  내일   오후 3시\n치과 ") == "내일 오후 3시 치과"
+        assert normalize_prompt("Dentist") == normalize_prompt("dentist")
+
+    def test_key_depends_on_all_parts(self):
+        """페르소나/프롬프트/이미지/날짜가 다르면 다른 키"""
+        today = date(2026, 1, 22)
+        base = make_cache_key(PersonaType.CALENDAR, "내일 치과", None, today)
+
+        assert base == make_cache_key(PersonaType.CALENDAR, "내일  치과", None, today)
+        assert base != make_cache_key(PersonaType.MALLANGI, "내일 치과", None, today)
+        assert base != make_cache_key(PersonaType.CALENDAR, "내일 치과", "abc", today)
+        assert base != make_cache_key(
+            PersonaType.CALENDAR, "내일 치과", None, date(2026, 1, 23)
+        )
+
+    def test_default_bucket_is_kst_date(self, monkeypatch):
+        """서버(UTC)가 아직 전날이어도 KST 날짜로 버킷을 나눔"""
+        # UTC 2026-10-16 20:30 = KST 2026-10-17 05:30
+        freeze_clock(monkeypatch, datetime(2026, 10, 16, 20, 30, tzinfo=timezone.utc))
+
+        key = make_cache_key(PersonaType.CALENDAR, "내일 치과")
+
+        assert key == make_cache_key(
+            PersonaType.CALENDAR, "내일 치과", None, date(2026, 10, 17)
+        )
+        assert key != make_cache_key(
+            PersonaType.CALENDAR, "내일 치과", None, date(2026, 10, 16)
+        )
+
+
+class TestResponseCache:
+    """메모리/디스크 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_and_miss(self):
+        cache = ResponseCache({"calendar": 60})
+
+        assert await cache.get("k") is None
+        await cache.put("k", PersonaType.CALENDAR, {"output": "x"})
+        assert await cache.get("k") == {"output": "x"}
+
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits_memory"] == 1
+
+    @pytest.mark.asyncio
+    async def test_persona_policy(self):
+        """TTL이 없는 페르소나는 저장하지 않음"""
+        cache = ResponseCache({"calendar": 60, "mallangi": 0})
+
+        assert cache.is_cacheable(PersonaType.CALENDAR) is True
+        assert cache.is_cacheable(PersonaType.MALLANGI) is False
+
+        await cache.put("k", PersonaType.MALLANGI, {"output": "x"})
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self):
+        cache = ResponseCache({"calendar": 60})
+        await cache.put("k", PersonaType.CALENDAR, {"output": "x"})
+
+        with patch("app.services.claude.cache.time.time", return_value=10**12):
+            assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = ResponseCache({"calendar": 60}, max_entries=2)
+        for key in ["a", "b", "c"]:
+            await cache.put(key, PersonaType.CALENDAR, {"output": key})
+
+        assert await cache.get("a") is None
+        assert await cache.get("c") == {"output": "c"}
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_instance(self, tmp_path):
+        """디스크에 저장된 항목은 새 인스턴스에서도 적중"""
+        first = ResponseCache({"calendar": 60}, disk_dir=str(tmp_path))
+        await first.put("abcd", PersonaType.CALENDAR, {"output": "saved"})
+
+        second = ResponseCache({"calendar": 60}, disk_dir=str(tmp_path))
+        assert await second.get("abcd") == {"output": "saved"}
+        assert second.stats()["hits_disk"] == 1
+
+        # 디스크 적중 후 메모리로 승격
+        assert await second.get("abcd") == {"output": "saved"}
+        assert second.stats()["hits_memory"] == 1
+
+
+class TestClaudeServiceCache:
+    """ClaudeService 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_calendar_hit_skips_cli(self):
+        """같은 달력이 요청은 두 번째부터 CLI를 실행하지 않음"""
+        service = ClaudeService()
+        service.cache = ResponseCache({"calendar": 60})
+        output = '{"events": [{"title": "치과"}], "message": "등록할게요"}'
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **kw: FakeProcess([result_line(output)]),
+        ) as mock_exec:
+            first = await service.chat("달력아 내일 오후 3시 치과")
+            second = await service.chat("달력아 내일  오후 3시 치과")
+
+        assert mock_exec.call_count == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.parsed_events == [{"title": "치과"}]
+        assert service.get_stats()["cache"]["hits_memory"] == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_persona_not_cached(self):
+        """캐시 정책에 없는 페르소나는 매번 CLI 실행"""
+        service = ClaudeService()
+        service.cache = ResponseCache({"calendar": 60})
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **kw: FakeProcess([result_line("안녕")]),
+        ) as mock_exec:
+            await service.chat("말랑아 안녕")
+            await service.chat("말랑아 안녕")
+
+        assert mock_exec.call_count == 2
@@ -0,0 +1,267 @@
+"""FairScheduler 단위 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.exceptions import TooManyRequestsError
+from app.services.claude.scheduler import FairScheduler, Lane, split_concurrency
+
+
+class TestFairScheduler:
+    """동시성 제한 및 사용자별 공정 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_without_wait(self):
+        """여유가 있으면 즉시 슬롯 획득"""
+        scheduler = FairScheduler(max_concurrency=2)
+
+        assert await scheduler.acquire("a") == 0
+        assert await scheduler.acquire("b") == 0
+        assert scheduler.active == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """동시 실행 수가 max_concurrency를 넘지 않음"""
+        scheduler = FairScheduler(max_concurrency=2, max_queue_depth=10)
+        running = 0
+        peak = 0
+
+        async def job(key: str):
+            nonlocal running, peak
+            async with scheduler.slot(key):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(job(f"user-{i % 3}") for i in range(9)))
+
+        assert peak == 2
+        assert scheduler.active == 0
+        assert scheduler.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_users(self):
+        """한 사용자가 많이 보내도 다른 사용자가 번갈아 실행됨"""
+        scheduler = FairScheduler(max_concurrency=1, max_queue_depth=10)
+        order: list[str] = []
+
+        await scheduler.acquire("holder")
+
+        async def job(key: str):
+            async with scheduler.slot(key):
+                order.append(key)
+
+        tasks = [asyncio.create_task(job("chatty")) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(job("parent")))
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["chatty", "parent", "chatty", "chatty"]
+
+    @pytest.mark.asyncio
+    async def test_queue_full_raises_with_retry_after(self):
+        """대기열이 가득 차면 TooManyRequestsError"""
+        scheduler = FairScheduler(
+            max_concurrency=1, max_queue_depth=1, retry_after_seconds=3
+        )
+        await scheduler.acquire("a")
+        waiter = asyncio.create_task(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TooManyRequestsError) as exc_info:
+            await scheduler.acquire("c")
+
+        assert exc_info.value.retry_after == 3
+        assert scheduler.stats()["rejected_total"] == 1
+
+        scheduler.release()
+        assert await waiter >= 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """대기 중 취소된 요청은 큐에서 제거됨"""
+        scheduler = FairScheduler(max_concurrency=1, max_queue_depth=5)
+        await scheduler.acquire("a")
+
+        waiter = asyncio.create_task(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+        assert scheduler.queued == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler.queued == 0
+        scheduler.release()
+        assert scheduler.active == 0
+
+
+def _lanes(calendar: int = 1, chat: int = 2, queue_depth: int = 10) -> FairScheduler:
+    return FairScheduler(
+        lanes=[
+            Lane("chat", max_concurrency=chat, max_queue_depth=queue_depth),
+            Lane(
+                "calendar",
+                max_concurrency=calendar,
+                max_queue_depth=queue_depth,
+                borrows_from=("chat",),
+            ),
+        ]
+    )
+
+
+class TestLanes:
+    """우선순위 레인 (레인별 예산 + 빌려 쓰기) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_chat_burst_does_not_block_calendar(self):
+        """잡담 레인이 꽉 차도 달력이 레인 예산은 그대로"""
+        scheduler = _lanes(calendar=1, chat=2)
+        await scheduler.acquire("kid", "chat")
+        await scheduler.acquire("kid", "chat")
+        chat_waiter = asyncio.create_task(scheduler.acquire("kid", "chat"))
+        await asyncio.sleep(0)
+
+        assert await scheduler.acquire("parent", "calendar") == 0
+        assert scheduler.lanes["chat"].queued == 1
+
+        scheduler.release("chat")
+        await chat_waiter
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_never_queues(self):
+        """try_acquire는 빈 자리(빌릴 자리 포함)가 없으면 기다리지 않고 False"""
+        scheduler = _lanes(calendar=1, chat=1)
+        await scheduler.acquire("parent", "calendar")
+
+        assert scheduler.try_acquire("calendar") is True  # 잡담 자리를 빌림
+        assert scheduler.try_acquire("calendar") is False
+        assert scheduler.queued == 0
+
+        scheduler.release("calendar")
+        assert scheduler.lanes["chat"].active == 0
+
+    @pytest.mark.asyncio
+    async def test_calendar_borrows_idle_chat_capacity(self):
+        """달력이 레인이 꽉 차면 놀고 있는 잡담 자리를 빌림"""
+        scheduler = _lanes(calendar=1, chat=2)
+
+        await scheduler.acquire("parent", "calendar")
+        assert await scheduler.acquire("parent", "calendar") == 0
+
+        chat = scheduler.lanes["chat"]
+        assert chat.active == 1
+        assert scheduler.lanes["calendar"].stats()["borrowing"] == 1
+
+        # 빌린 자리부터 반납
+        scheduler.release("calendar")
+        assert chat.active == 0
+        scheduler.release("calendar")
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_chat_cannot_borrow_calendar_capacity(self):
+        """잡담은 달력이 레인 자리가 비어 있어도 대기"""
+        scheduler = _lanes(calendar=1, chat=1)
+        await scheduler.acquire("kid", "chat")
+
+        waiter = asyncio.create_task(scheduler.acquire("kid", "chat"))
+        await asyncio.sleep(0)
+
+        assert not waiter.done()
+        assert scheduler.lanes["calendar"].active == 0
+
+        scheduler.release("chat")
+        await waiter
+        scheduler.release("chat")
+
+    @pytest.mark.asyncio
+    async def test_freed_chat_slot_goes_to_waiting_calendar(self):
+        """잡담 대기자가 없으면 비는 잡담 자리를 기다리던 달력이 요청이 받음"""
+        scheduler = _lanes(calendar=1, chat=1)
+        await scheduler.acquire("kid", "chat")
+        await scheduler.acquire("parent", "calendar")
+
+        waiter = asyncio.create_task(scheduler.acquire("parent", "calendar"))
+        await asyncio.sleep(0)
+        assert scheduler.lanes["calendar"].queued == 1
+
+        scheduler.release("chat")
+        await waiter
+
+        assert scheduler.lanes["chat"].active == 1
+        assert scheduler.lanes["calendar"].borrowed_total == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_waiters_keep_priority_on_own_slots(self):
+        """잡담 대기자가 있으면 잡담 자리는 잡담 요청에게 (놀고 있는 자리만 빌려줌)"""
+        scheduler = _lanes(calendar=1, chat=1)
+        await scheduler.acquire("kid", "chat")
+        await scheduler.acquire("parent", "calendar")
+
+        chat_waiter = asyncio.create_task(scheduler.acquire("kid", "chat"))
+        calendar_waiter = asyncio.create_task(scheduler.acquire("parent", "calendar"))
+        await asyncio.sleep(0)
+
+        scheduler.release("chat")
+        await chat_waiter
+        assert not calendar_waiter.done()
+
+        scheduler.release("calendar")
+        await calendar_waiter
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_per_lane(self):
+        """대기열 상한은 레인마다 따로"""
+        scheduler = _lanes(calendar=1, chat=1, queue_depth=1)
+        await scheduler.acquire("kid", "chat")
+        await scheduler.acquire("parent", "calendar")
+        chat_waiter = asyncio.create_task(scheduler.acquire("kid", "chat"))
+        calendar_waiter = asyncio.create_task(scheduler.acquire("parent", "calendar"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TooManyRequestsError):
+            await scheduler.acquire("kid", "chat")
+
+        stats = scheduler.stats()
+        assert stats["lanes"]["chat"]["rejected_total"] == 1
+        assert stats["lanes"]["calendar"]["rejected_total"] == 0
+        assert stats["queued"] == 2
+
+        for task in (chat_waiter, calendar_waiter):
+            task.cancel()
+        await asyncio.gather(chat_waiter, calendar_waiter, return_exceptions=True)
+
+    def test_unknown_lender_rejected(self):
+        """없는 레인에서 빌리도록 설정하면 에러"""
+        with pytest.raises(ValueError):
+            FairScheduler(lanes=[Lane("calendar", 1, 1, borrows_from=("chat",))])
+
+
+class TestSplitConcurrency:
+    """전체 동시 실행 수를 레인 비율대로 나누기"""
+
+    @pytest.mark.parametrize(
+        "total,expected",
+        [
+            (4, {"calendar": 1, "chat": 3}),
+            (8, {"calendar": 2, "chat": 6}),
+            (10, {"calendar": 2, "chat": 8}),
+            # 레인마다 최소 1자리
+            (1, {"calendar": 1, "chat": 1}),
+        ],
+    )
+    def test_split_by_share(self, total, expected):
+        assert split_concurrency(total, {"calendar": 0.25, "chat": 0.75}) == expected
+
+    def test_minimum_seats_keep_total(self):
+        budgets = split_concurrency(3, {"a": 0.1, "b": 0.1, "c": 0.8})
+        assert budgets == {"a": 1, "b": 1, "c": 1}
+
+    def test_no_lanes(self):
+        assert split_concurrency(4, {}) == {}
@@ -0,0 +1,85 @@
+"""SingleFlight 단위 테스트"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.claude.protocol import ChatResponse
+from app.services.claude.service import ClaudeService
+from app.services.claude.singleflight import SingleFlight
+from tests.fakes.fake_process import FakeProcess, result_line
+
+
+class TestSingleFlight:
+    """leader/follower 결과 공유 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_followers_receive_leader_result(self):
+        flight = SingleFlight()
+        assert flight.lead("k") is True
+        assert flight.lead("k") is False
+
+        followers = [asyncio.create_task(flight.wait("k")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        response = ChatResponse(output="ok", elapsed_ms=1, success=True)
+        flight.resolve("k", response)
+        flight.finish("k")
+
+        assert await asyncio.gather(*followers) == [response, response]
+        assert flight.is_inflight("k") is False
+        assert flight.stats()["coalesced_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_aborted_leader_returns_none(self):
+        """leader가 결과 없이 끝나면 follower는 None"""
+        flight = SingleFlight()
+        flight.lead("k")
+        follower = asyncio.create_task(flight.wait("k"))
+        await asyncio.sleep(0)
+
+        flight.finish("k")
+
+        assert await follower is None
+        assert flight.lead("k") is True
+
+
+class TestClaudeServiceCoalescing:
+    """ClaudeService 동시 요청 합치기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_process(self):
+        """같은 요청이 동시에 오면 CLI는 한 번만 실행"""
+        service = ClaudeService()
+        process = FakeProcess(hang=True)
+
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=process
+        ) as mock_exec:
+            first = asyncio.create_task(service.chat("마이콜아 apple?", user_id="a"))
+            await asyncio.sleep(0.05)
+            second = asyncio.create_task(service.chat("마이콜아 apple?", user_id="b"))
+            await asyncio.sleep(0.05)
+
+            process.finish([result_line("사과")])
+            responses = await asyncio.gather(first, second)
+
+        assert mock_exec.call_count == 1
+        assert [r.output for r in responses] == ["사과", "사과"]
+        assert service.get_stats()["inflight"]["coalesced_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_not_coalesced(self):
+        service = ClaudeService()
+
+        with patch(
+            "asyncio.create_subprocess_exec",
+            side_effect=lambda *a, **kw: FakeProcess([result_line("ok")]),
+        ) as mock_exec:
+            await asyncio.gather(
+                service.chat("마이콜아 apple?"),
+                service.chat("마이콜아 banana?"),
+            )
+
+        assert mock_exec.call_count == 2
@@ -0,0 +1,74 @@
+"""단계별 소요 시간 지표 단위 테스트"""
+
+import contextvars
+from unittest.mock import patch
+
+import pytest
+
+from app.services.claude.metrics import (
+    RequestTimings,
+    StageHistogram,
+    get_stage_metrics,
+    record_stage,
+    start_request_timings,
+)
+from app.services.claude.service import ClaudeService
+from tests.fakes.fake_process import FakeProcess, delta_line, result_line
+
+
+class TestStageHistogram:
+    """버킷 히스토그램 테스트"""
+
+    def test_observe_and_quantiles(self):
+        histogram = StageHistogram(buckets=(10, 100, 1000))
+        for ms in [5, 8, 50, 500, 5000]:
+            histogram.observe(ms)
+
+        stats = histogram.stats()
+        assert stats["count"] == 5
+        assert stats["buckets"] == {"10": 2, "100": 1, "1000": 1, "+Inf": 1}
+        assert stats["p50_ms"] == 100
+        assert stats["p99_ms"] is None  # +Inf 버킷
+
+    def test_empty(self):
+        assert StageHistogram().stats()["p50_ms"] is None
+
+
+class TestRequestTimings:
+    """요청별 Server-Timing 수집 테스트"""
+
+    def test_header_sums_repeated_stages(self):
+        timings = RequestTimings()
+        timings.add("generate", 100)
+        timings.add("db_insert", 2.25)
+        timings.add("generate", 50)
+
+        assert timings.header() == "generate;dur=150.0, db_insert;dur=2.2"
+
+    def test_record_stage_only_reaches_current_request(self):
+        def in_request():
+            timings = start_request_timings()
+            record_stage("persona", 1.0)
+            return timings
+
+        timings = contextvars.copy_context().run(in_request)
+        record_stage("persona", 2.0)  # 요청 밖 기록은 전역 히스토그램에만
+
+        assert timings.stages == {"persona": 1.0}
+
+
+class TestClaudeServiceStages:
+    """ClaudeService 단계 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_chat_records_cli_stages(self):
+        service = ClaudeService()
+        timings = start_request_timings()
+        process = FakeProcess([delta_line("hi"), result_line("hi")])
+
+        with patch("asyncio.create_subprocess_exec", return_value=process):
+            await service.chat("말랑아 hi", timeout_seconds=10)
+
+        for stage in ("persona", "queue", "spawn", "first_byte", "generate"):
+            assert stage in timings.stages
+            assert get_stage_metrics().stats()[stage]["count"] >= 1
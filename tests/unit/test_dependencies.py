@@ -1,10 +1,21 @@
 """의존성 모듈 단위 테스트"""
 
+import asyncio
+import hashlib
+import os
+
 import pytest
+from fastapi import HTTPException, Request, Response
 from unittest.mock import patch
 
+from app.dependencies.disconnect import CLIENT_CLOSED_REQUEST, DisconnectGuard
 from app.dependencies.entities import FirebaseUser
+from app.dependencies.idempotency import REPLAYED_HEADER, Idempotency
 from app.dependencies.token_verifier import get_token_verifier
+from app.dependencies import upload as upload_module
+from app.dependencies.upload import parse_image_upload
+from app.services.claude.staging import ImageStager
+from app.services.idempotency import IdempotencyStore
 
 
 class TestFirebaseUser:
@@ -35,3 +46,179 @@ class TestTokenVerifier:
         verifier = get_token_verifier()
 
         assert callable(verifier)
+
+
+class TestParseImageUpload:
+    """멀티파트 스트리밍 파서 테스트"""
+
+    BOUNDARY = "testboundary"
+
+    def _request(self, body: bytes, chunk_size: int = 7) -> Request:
+        """본문을 작은 청크로 나눠 보내는 Request (경계 문자열이 청크에 걸치도록)"""
+        chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+        async def receive():
+            if chunks:
+                return {"type": "http.request", "body": chunks.pop(0), "more_body": bool(chunks)}
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [
+                (b"content-type", f"multipart/form-data; boundary={self.BOUNDARY}".encode())
+            ],
+        }
+        return Request(scope, receive)
+
+    def _body(self, prompt: str, image: bytes | None) -> bytes:
+        b = self.BOUNDARY.encode()
+        body = (
+            b"--" + b + b"\r\n"
+            b'Content-Disposition: form-data; name="prompt"\r\n\r\n'
+            + prompt.encode()
+            + b"\r\n"
+        )
+        if image is not None:
+            body += (
+                b"--" + b + b"\r\n"
+                b'Content-Disposition: form-data; name="image"; filename="a.png"\r\n'
+                b"Content-Type: image/png\r\n\r\n" + image + b"\r\n"
+            )
+        return body + b"--" + b + b"--\r\n"
+
+    async def test_streams_image_to_temp_file(self):
+        """필드는 메모리에, 이미지는 임시 파일에 저장"""
+        image = bytes(range(256)) * 8
+        upload = await parse_image_upload(
+            self._request(self._body("말랑아 이거 봐", image)), max_image_bytes=1 << 20
+        )
+
+        try:
+            assert upload.fields == {"prompt": "말랑아 이거 봐"}
+            assert upload.image.size == len(image)
+            assert upload.image.sha256 == hashlib.sha256(image).hexdigest()
+            with open(upload.image.path, "rb") as f:
+                assert f.read() == image
+        finally:
+            upload.cleanup()
+        assert not os.path.exists(upload.image.path)
+
+    async def test_too_large_image_removes_temp_file(self, tmp_path, monkeypatch):
+        """크기 초과 시 413, 쓰던 임시 파일은 삭제"""
+        monkeypatch.setattr(
+            upload_module, "get_image_stager", lambda: ImageStager("tmpfs", str(tmp_path))
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await parse_image_upload(
+                self._request(self._body("hi", b"x" * 100)), max_image_bytes=50
+            )
+
+        assert exc_info.value.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_rejects_non_multipart(self):
+        """multipart가 아니면 415"""
+        request = Request(
+            {"type": "http", "method": "POST", "headers": [(b"content-type", b"application/json")]}
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await parse_image_upload(request, max_image_bytes=1024)
+
+        assert exc_info.value.status_code == 415
+
+
+class TestDisconnectGuard:
+    """클라이언트 연결 끊김 시 작업 취소 테스트"""
+
+    def _guard(self, disconnected: asyncio.Event) -> DisconnectGuard:
+        async def receive():
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        scope = {"type": "http", "method": "POST", "path": "/ai/chat", "headers": []}
+        return DisconnectGuard(Request(scope, receive))
+
+    async def test_returns_result_while_connected(self):
+        guard = self._guard(asyncio.Event())
+
+        async def work():
+            return "ok"
+
+        assert await guard.run(work) == "ok"
+
+    async def test_disconnect_cancels_work(self):
+        """연결이 끊기면 작업을 취소하고 정리가 끝난 뒤 499"""
+        disconnected = asyncio.Event()
+        guard = self._guard(disconnected)
+        started = asyncio.Event()
+        cleaned_up = []
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append(True)
+
+        run = asyncio.create_task(guard.run(work))
+        await started.wait()
+        disconnected.set()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await run
+        assert exc_info.value.status_code == CLIENT_CLOSED_REQUEST
+        assert cleaned_up == [True]
+
+    async def test_idempotent_work_survives_disconnect(self):
+        """Idempotency-Key가 있으면 연결이 끊겨도 끝까지 실행해서 재전송은 저장된 결과를 받음"""
+        store = IdempotencyStore()
+        calls = []
+        release = asyncio.Event()
+
+        async def work():
+            calls.append(1)
+            await release.wait()
+            return "parsed"
+
+        def idempotency(key: str | None) -> Idempotency:
+            return Idempotency(
+                key=key, owner_uid="u1", scope="POST /ai/chat", store=store, response=Response()
+            )
+
+        first = idempotency("retry-key")
+        disconnected = asyncio.Event()
+        run = asyncio.create_task(
+            self._guard(disconnected).run(
+                lambda: first.run(work, fingerprint="same"), cancellable=first.cancellable
+            )
+        )
+        while not calls:
+            await asyncio.sleep(0)
+        disconnected.set()
+        await asyncio.sleep(0.01)
+        release.set()
+        assert await run == "parsed"
+
+        resent = idempotency("retry-key")
+        result = await self._guard(asyncio.Event()).run(
+            lambda: resent.run(work, fingerprint="same"), cancellable=resent.cancellable
+        )
+        assert result == "parsed"
+        assert resent.response.headers[REPLAYED_HEADER] == "true"
+        assert len(calls) == 1
+        # 키가 없으면 기존처럼 연결이 끊기면 취소
+        assert idempotency(None).cancellable is True
+
+    async def test_work_error_propagates(self):
+        guard = self._guard(asyncio.Event())
+
+        async def work():
+            raise HTTPException(status_code=504, detail="timeout")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await guard.run(work)
+        assert exc_info.value.status_code == 504